@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class AcademicConfig(AppConfig):
     name = 'academic'
+    
+    def ready(self):
+        from core.response_cache import track_model_versions
+        track_model_versions(*self.get_models())
@@ -1,3 +1,67 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from users.models import User
+from .models import Faculty, Discipline, Subject
+
+
+class ConditionalGetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='vicedecano', email='vicedecano@uci.cu',
+            password='123456', role=User.Role.VICEDECANO
+        )
+        Faculty.objects.create(name='Facultad 1', code='F1')
+        cls.discipline = Discipline.objects.create(name='Matemática', code='MAT')
+        cls.subject = Subject.objects.create(name='Álgebra', code='ALG', discipline=cls.discipline)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_unchanged_list_returns_304_without_serializing(self):
+        response = self.client.get('/api/academic/subjects/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertNotIn('Last-Modified', response)
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/academic/subjects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_related_change_invalidates_etag(self):
+        etag = self.client.get('/api/academic/subjects/')['ETag']
+        self.discipline.name = 'Matemática Aplicada'
+        self.discipline.save()
+
+        response = self.client.get('/api/academic/subjects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]['discipline_name'], 'Matemática Aplicada')
+
+    def test_delete_invalidates_list(self):
+        other = Subject.objects.create(name='Cálculo', code='CAL', discipline=self.discipline)
+        etag = self.client.get('/api/academic/subjects/')['ETag']
+        other.delete()
+
+        response = self.client.get(
+            '/api/academic/subjects/', HTTP_IF_NONE_MATCH=etag,
+            HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+        response = self.client.get(
+            '/api/academic/subjects/', HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT'
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_retrieve_and_choices_support_etag(self):
+        url = f'/api/academic/subjects/{self.subject.pk}/'
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response)
+        etag = response['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        etag = self.client.get('/api/roles/')['ETag']
+        self.assertEqual(self.client.get('/api/roles/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
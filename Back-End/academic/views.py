@@ -1,6 +1,7 @@
 from rest_framework import viewsets, filters
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
+from django.contrib.auth import get_user_model
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from .models import Faculty, Discipline, Subject
@@ -10,6 +11,12 @@ from .serializers import (
     SubjectSerializer, SubjectListSerializer
 )
 from users.permissions import IsNotBlocked, CanManageAcademic
+from users.scope import get_user_scope
+from core.conditional import ConditionalGetMixin
+from core.response_cache import CachedResponseMixin
+from search.filters import FullTextSearchFilter
+
+User = get_user_model()
 
 
 @extend_schema_view(
@@ -20,7 +27,7 @@ from users.permissions import IsNotBlocked, CanManageAcademic
     partial_update=extend_schema(summary="Actualizar facultad parcialmente", tags=['Academic']),
     destroy=extend_schema(summary="Eliminar facultad", description="Elimina una facultad.", tags=['Academic']),
 )
-class FacultyViewSet(viewsets.ModelViewSet):
+class FacultyViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestión de Facultades.
     Lectura para todos los autenticados, escritura para admin y vicedecano.
@@ -32,6 +39,7 @@ class FacultyViewSet(viewsets.ModelViewSet):
     search_fields = ['name', 'code']
     ordering_fields = ['name', 'code', 'created_at']
     ordering = ['name']
+    cache_models = (Faculty,)
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -47,7 +55,7 @@ class FacultyViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Actualizar disciplina parcialmente", tags=['Academic']),
     destroy=extend_schema(summary="Eliminar disciplina", description="Elimina una disciplina.", tags=['Academic']),
 )
-class DisciplineViewSet(viewsets.ModelViewSet):
+class DisciplineViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestión de Disciplinas.
     Lectura para todos los autenticados, escritura para admin y vicedecano.
@@ -59,6 +67,9 @@ class DisciplineViewSet(viewsets.ModelViewSet):
     search_fields = ['name', 'code']
     ordering_fields = ['name', 'code', 'created_at']
     ordering = ['name']
+    # Las respuestas incluyen asignaturas y el nombre del jefe
+    conditional_related_models = (Subject, User)
+    cache_models = (Discipline, Subject, User)
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -70,7 +81,7 @@ class DisciplineViewSet(viewsets.ModelViewSet):
         # Si es jefe de disciplina, puede ver solo las suyas
         user = self.request.user
         if user.is_jefe_disciplina:
-            queryset = queryset.filter(head=user)
+            queryset = queryset.filter(pk__in=get_user_scope(user).discipline_ids)
         return queryset
 
 
@@ -82,18 +93,21 @@ class DisciplineViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Actualizar asignatura parcialmente", tags=['Academic']),
     destroy=extend_schema(summary="Eliminar asignatura", description="Elimina una asignatura.", tags=['Academic']),
 )
-class SubjectViewSet(viewsets.ModelViewSet):
+class SubjectViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestión de Asignaturas.
     Lectura para todos los autenticados, escritura para admin y vicedecano.
     """
     queryset = Subject.objects.all()
     permission_classes = [IsAuthenticated, IsNotBlocked, CanManageAcademic]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter, FullTextSearchFilter]
     filterset_fields = ['is_active', 'discipline', 'semester', 'year']
     search_fields = ['name', 'code']
     ordering_fields = ['name', 'code', 'discipline', 'semester', 'year']
     ordering = ['discipline', 'name']
+    # Las respuestas incluyen el nombre de la disciplina
+    conditional_related_models = (Discipline,)
+    cache_models = (Subject, Discipline)
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -105,5 +119,5 @@ class SubjectViewSet(viewsets.ModelViewSet):
         # Si es jefe de disciplina, puede ver solo las de sus disciplinas
         user = self.request.user
         if user.is_jefe_disciplina:
-            queryset = queryset.filter(discipline__head=user)
+            queryset = queryset.filter(pk__in=get_user_scope(user).subject_ids)
         return queryset
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Assignment, AssignmentHistory
+from .models import Assignment, AssignmentHistory, ProfessorLoadSummary
 
 
 @admin.register(Assignment)
@@ -48,3 +48,18 @@ class AssignmentHistoryAdmin(admin.ModelAdmin):
     search_fields = ['assignment__professor__last_name', 'assignment__subject__name']
     ordering = ['-created_at']
     readonly_fields = ['assignment', 'action', 'changes', 'performed_by', 'created_at']
+
+
+@admin.register(ProfessorLoadSummary)
+class ProfessorLoadSummaryAdmin(admin.ModelAdmin):
+    """Configuración del admin para Resúmenes de Carga Docente."""
+    
+    list_display = [
+        'professor', 'academic_year', 'semester', 'total_hours',
+        'assignments_count', 'subjects_count', 'faculties_count'
+    ]
+    list_filter = ['academic_year', 'semester']
+    search_fields = ['professor__first_name', 'professor__last_name']
+    ordering = ['academic_year', 'semester', 'professor']
+    raw_id_fields = ['professor']
+    readonly_fields = [field.name for field in ProfessorLoadSummary._meta.fields]
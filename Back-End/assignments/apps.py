@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class AssignmentsConfig(AppConfig):
     name = 'assignments'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
+        from core.response_cache import track_model_versions
+        track_model_versions(self.get_model('Assignment'))
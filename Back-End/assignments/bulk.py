@@ -0,0 +1,209 @@
+"""
+Altas, modificaciones y bajas masivas de asignaciones en una sola transacción.
+"""
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from academic.models import Faculty, Subject
+from core.response_cache import bump_model_versions
+from professors.models import Professor
+from search.index import update_search_index
+from .models import Assignment, AssignmentHistory
+from .conflicts import ERROR, find_conflicts
+from .history import build_history_changes
+from .signals import deferred_summary_refresh, summary_keys
+
+
+# Campos del unique_together de Assignment, por nombre de atributo
+UNIQUE_FIELDS = (
+    'professor_id', 'subject_id', 'faculty_id', 'assignment_type',
+    'academic_year', 'semester', 'group'
+)
+
+FOREIGN_KEYS = (
+    ('professor_id', Professor, 'professor'),
+    ('subject_id', Subject, 'subject'),
+    ('faculty_id', Faculty, 'faculty'),
+)
+
+
+def _unique_key(obj):
+    key = tuple(getattr(obj, field) for field in UNIQUE_FIELDS)
+    # Igual que la base de datos, un NULL nunca colisiona
+    return None if None in key else key
+
+
+class BulkAssignmentOperation:
+    """
+    Valida y aplica un lote de operaciones sobre asignaciones.
+
+    ``queryset`` es el alcance del usuario (``get_queryset`` de la vista): solo
+    se pueden modificar o eliminar asignaciones visibles en él. Toda la
+    validación se hace con un número fijo de consultas, independiente del
+    tamaño del lote.
+    """
+
+    def __init__(self, queryset, user, data):
+        self.queryset = queryset
+        self.user = user
+        self.creates = data.get('create', [])
+        self.updates = data.get('update', [])
+        self.deletes = data.get('delete', [])
+        self.errors = {}
+        self.issues = []
+
+    def validate(self):
+        self.targets = self._load_targets()
+        self._validate_foreign_keys()
+        self.new_objects = [
+            Assignment(assigned_by=self.user, **item) for item in self.creates
+        ]
+        self.changes = self._apply_updates()
+        self._validate_uniqueness()
+        if not self.errors:
+            self._check_conflicts()
+        if self.errors:
+            raise serializers.ValidationError(self.errors)
+
+    def _add_error(self, section, index, message):
+        self.errors.setdefault(section, {})[index] = message
+
+    def _load_targets(self):
+        update_ids = [item['id'] for item in self.updates]
+        ids = update_ids + list(self.deletes)
+        if len(ids) != len(set(ids)):
+            self.errors['non_field_errors'] = [
+                'Una asignación no puede aparecer más de una vez en el lote.'
+            ]
+        # Consulta única sobre el alcance del usuario, sin joins innecesarios
+        targets = self.queryset.select_related(None).order_by().in_bulk(ids)
+        for section, values in (('update', update_ids), ('delete', self.deletes)):
+            for index, pk in enumerate(values):
+                if pk not in targets:
+                    self._add_error(section, index, f'La asignación {pk} no existe o no tiene acceso a ella.')
+        return targets
+
+    def _validate_foreign_keys(self):
+        for attname, model, label in FOREIGN_KEYS:
+            requested = {
+                item[attname] for item in [*self.creates, *self.updates] if attname in item
+            }
+            if not requested:
+                continue
+            existing = set(model.objects.filter(pk__in=requested).values_list('pk', flat=True))
+            for section, items in (('create', self.creates), ('update', self.updates)):
+                for index, item in enumerate(items):
+                    if attname in item and item[attname] not in existing:
+                        self._add_error(section, index, f'No existe {label} con id {item[attname]}.')
+
+    def _apply_updates(self):
+        """Aplica los cambios en memoria y devuelve ``{id: {attname: (antes, después)}}``."""
+        changes = {}
+        for item in self.updates:
+            obj = self.targets.get(item['id'])
+            if obj is None:
+                continue
+            for field, value in item.items():
+                if field != 'id':
+                    setattr(obj, field, value)
+            diff = obj.get_changes()
+            if diff:
+                changes[obj.pk] = diff
+        return changes
+
+    def _check_conflicts(self):
+        """Sobrecargas y coberturas duplicadas; los avisos no bloquean el lote."""
+        proposed = [({'create': index}, obj) for index, obj in enumerate(self.new_objects)] + [
+            ({'update': index}, self.targets[item['id']])
+            for index, item in enumerate(self.updates) if item['id'] in self.changes
+        ]
+        self.issues = find_conflicts(proposed, self.deletes)
+        blocking = [issue['message'] for issue in self.issues if issue['severity'] == ERROR]
+        if blocking:
+            self.errors['conflicts'] = blocking
+
+    def _validate_uniqueness(self):
+        deleted = set(self.deletes)
+        final = self.new_objects + [
+            obj for pk, obj in self.targets.items() if pk not in deleted
+        ]
+
+        # Duplicados dentro del propio lote
+        seen = {}
+        for obj in final:
+            key = _unique_key(obj)
+            if key is None:
+                continue
+            if key in seen:
+                self.errors.setdefault('non_field_errors', []).append(
+                    f'El lote contiene asignaciones duplicadas: {dict(zip(UNIQUE_FIELDS, key))}.'
+                )
+            seen[key] = obj
+
+        if not seen:
+            return
+
+        # Conflictos con asignaciones existentes que no forman parte del lote
+        touched = set(self.targets)
+        candidates = Assignment.objects.filter(
+            professor_id__in={key[0] for key in seen},
+            academic_year__in={key[4] for key in seen},
+        ).exclude(pk__in=touched).order_by().values_list(*UNIQUE_FIELDS)
+        for key in candidates:
+            if key in seen:
+                self.errors.setdefault('non_field_errors', []).append(
+                    f'Ya existe una asignación con los mismos datos: {dict(zip(UNIQUE_FIELDS, key))}.'
+                )
+
+    @transaction.atomic
+    def apply(self):
+        """Aplica el lote validado y registra el historial con un único ``bulk_create``."""
+        now = timezone.now()
+        updated = [self.targets[pk] for pk in self.changes]
+
+        with deferred_summary_refresh() as affected_keys:
+            if self.deletes:
+                Assignment.objects.filter(pk__in=self.deletes).delete()
+
+            created = Assignment.objects.bulk_create(self.new_objects)
+
+            if updated:
+                fields = {field for diff in self.changes.values() for field in diff}
+                for obj in updated:
+                    obj.updated_at = now
+                Assignment.objects.bulk_update(updated, [*fields, 'updated_at'], batch_size=500)
+
+            # bulk_create/bulk_update no disparan señales: registrar las claves a mano
+            for obj in [*created, *updated]:
+                affected_keys.update(summary_keys(obj))
+            bump_model_versions(Assignment)
+            update_search_index(Assignment, [obj.pk for obj in [*created, *updated]])
+
+        history = [
+            AssignmentHistory(
+                assignment=obj,
+                action=AssignmentHistory.ActionType.CREATE,
+                changes={'created': True, 'bulk': True},
+                performed_by=self.user
+            )
+            for obj in created
+        ] + [
+            AssignmentHistory(
+                assignment=obj,
+                action=AssignmentHistory.ActionType.UPDATE,
+                changes=changes,
+                performed_by=self.user
+            )
+            for obj, changes in zip(
+                updated, build_history_changes([self.changes[obj.pk] for obj in updated])
+            )
+        ]
+        AssignmentHistory.objects.bulk_create(history, batch_size=500)
+
+        return {
+            'created': [obj.pk for obj in created],
+            'updated': [obj.pk for obj in updated],
+            'deleted': list(self.deletes),
+            'warnings': [issue['message'] for issue in self.issues if issue['severity'] != ERROR],
+        }
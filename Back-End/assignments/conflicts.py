@@ -0,0 +1,169 @@
+"""
+Detección de sobrecargas y conflictos en un conjunto de asignaciones.
+
+Las asignaciones propuestas se comparan con todas las existentes en una sola
+pasada: se cargan con una consulta las filas activas que comparten profesor o
+asignatura en los mismos años académicos y se indexan en memoria por
+``(profesor, año, semestre)`` y por ``(asignatura, grupo, año, semestre)``.
+El coste en consultas es fijo (tres), sea cual sea el tamaño del lote.
+
+Reglas:
+
+- ``professor_overload`` (error): las horas semanales del profesor en el
+  semestre superan su límite (``ASSIGNMENT_HOUR_LIMITS``).
+- ``duplicate_coverage`` (error): más de una asignación del mismo tipo para
+  la misma asignatura, grupo y semestre, aunque sea en otra facultad.
+- ``subject_hours`` (aviso): las horas asignadas a un grupo superan las
+  ``hours_per_week`` de la asignatura.
+
+Solo se informa de los conflictos en los que participa alguna fila propuesta:
+los que ya existían no bloquean operaciones ajenas.
+"""
+from collections import defaultdict
+from typing import NamedTuple
+
+from django.conf import settings
+from django.db.models import Q
+
+from academic.models import Subject
+from professors.models import Professor
+from .models import Assignment
+
+
+ERROR = 'error'
+WARNING = 'warning'
+
+ROW_FIELDS = (
+    'pk', 'professor_id', 'subject_id', 'assignment_type', 'group',
+    'academic_year', 'semester', 'hours_per_week',
+)
+
+
+class Row(NamedTuple):
+    ref: dict
+    pk: int
+    professor_id: int
+    subject_id: int
+    assignment_type: str
+    group: str
+    academic_year: str
+    semester: int
+    hours_per_week: int
+
+    @property
+    def proposed(self):
+        return 'id' not in self.ref
+
+
+def professor_hour_limit(contract_type, category):
+    """Límite de horas semanales: el menor entre el de su contrato y el de su categoría."""
+    limits = settings.ASSIGNMENT_HOUR_LIMITS
+    values = [
+        limits.get('contract_type', {}).get(contract_type),
+        limits.get('category', {}).get(category),
+    ]
+    values = [value for value in values if value is not None]
+    return min(values) if values else None
+
+
+def _issue(code, severity, message, rows, **extra):
+    return {
+        'code': code, 'severity': severity, 'message': message,
+        'rows': [row.ref for row in rows], **extra,
+    }
+
+
+def _period(row):
+    return f'{row.academic_year}/{row.semester}'
+
+
+def find_conflicts(proposed, deleted_ids=()):
+    """
+    ``proposed`` es una lista de ``(ref, Assignment)`` con las filas nuevas o
+    modificadas (``ref`` identifica la fila en la respuesta, p. ej.
+    ``{'create': 0}``). Devuelve la lista de conflictos encontrados.
+    """
+    rows = [
+        Row(ref, *(getattr(obj, field) for field in ROW_FIELDS))
+        for ref, obj in proposed if obj.is_active
+    ]
+    if not rows:
+        return []
+
+    professor_ids = {row.professor_id for row in rows}
+    subject_ids = {row.subject_id for row in rows}
+    excluded = {row.pk for row in rows if row.pk} | set(deleted_ids)
+    existing = Assignment.objects.filter(
+        Q(professor_id__in=professor_ids) | Q(subject_id__in=subject_ids),
+        is_active=True, academic_year__in={row.academic_year for row in rows},
+    ).exclude(pk__in=excluded).order_by().values_list(*ROW_FIELDS)
+    rows += [Row({'id': values[0]}, *values) for values in existing]
+
+    by_professor = defaultdict(list)
+    by_group = defaultdict(list)
+    for row in rows:
+        by_professor[(row.professor_id, row.academic_year, row.semester)].append(row)
+        by_group[(row.subject_id, row.group or None, row.academic_year, row.semester)].append(row)
+
+    professors = {
+        pk: (f'{first_name} {last_name}', professor_hour_limit(contract_type, category))
+        for pk, first_name, last_name, contract_type, category in Professor.objects.filter(
+            pk__in=professor_ids
+        ).order_by().values_list('pk', 'first_name', 'last_name', 'contract_type', 'category')
+    }
+    subjects = {
+        pk: (name, hours) for pk, name, hours in Subject.objects.filter(
+            pk__in=subject_ids
+        ).order_by().values_list('pk', 'name', 'hours_per_week')
+    }
+
+    issues = []
+    for (professor_id, _, _), group in by_professor.items():
+        if professor_id not in professors or not any(row.proposed for row in group):
+            continue
+        name, limit = professors[professor_id]
+        total = sum(row.hours_per_week for row in group)
+        if limit is not None and total > limit:
+            issues.append(_issue(
+                'professor_overload', ERROR,
+                f'{name} tendría {total} h/semana en {_period(group[0])} (límite {limit}).',
+                group, professor=professor_id, hours=total, limit=limit,
+            ))
+
+    for (subject_id, group_name, _, _), group in by_group.items():
+        if subject_id not in subjects or not any(row.proposed for row in group):
+            continue
+        subject_name, subject_hours = subjects[subject_id]
+        if group_name is None:
+            # Sin grupo no se puede saber qué filas cubren lo mismo: solo se
+            # comprueba cada fila propuesta por separado
+            for row in group:
+                if row.proposed and subject_hours and row.hours_per_week > subject_hours:
+                    issues.append(_issue(
+                        'subject_hours', WARNING,
+                        f'{row.hours_per_week} h/semana superan las {subject_hours} h de {subject_name}.',
+                        [row], subject=subject_id, hours=row.hours_per_week, limit=subject_hours,
+                    ))
+            continue
+
+        by_type = defaultdict(list)
+        for row in group:
+            by_type[row.assignment_type].append(row)
+        for assignment_type, same in by_type.items():
+            if len(same) > 1 and any(row.proposed for row in same):
+                issues.append(_issue(
+                    'duplicate_coverage', ERROR,
+                    f'{subject_name}, grupo {group_name}: {len(same)} asignaciones de tipo '
+                    f'{Assignment.AssignmentType(assignment_type).label} en {_period(same[0])}.',
+                    same, subject=subject_id, group=group_name, assignment_type=assignment_type,
+                ))
+
+        total = sum(row.hours_per_week for row in group)
+        if subject_hours and total > subject_hours:
+            issues.append(_issue(
+                'subject_hours', WARNING,
+                f'{subject_name}, grupo {group_name}: {total} h/semana asignadas y la '
+                f'asignatura tiene {subject_hours}.',
+                group, subject=subject_id, group=group_name, hours=total, limit=subject_hours,
+            ))
+    return issues
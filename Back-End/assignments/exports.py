@@ -0,0 +1,74 @@
+"""
+Columnas y filas de la exportación completa de asignaciones, compartidas por
+``GET /api/assignments/export_csv/`` y el trabajo en segundo plano
+``assignments.export`` (CSV o XLSX guardado en ``MEDIA_ROOT``).
+"""
+from core.exports import iter_csv, iter_values
+from professors.models import Professor
+from .models import Assignment
+
+try:
+    from openpyxl import Workbook
+except ImportError:  # pragma: no cover - dependencia opcional
+    Workbook = None
+
+
+# Columnas leídas con values_list() para las exportaciones CSV
+EXPORT_FIELDS = (
+    'professor__first_name', 'professor__last_name', 'professor__email',
+    'professor__category', 'subject__name', 'subject__code', 'faculty__name',
+    'subject__discipline__name', 'assignment_type', 'hours_per_week',
+    'group', 'academic_year', 'semester',
+)
+ASSIGNMENT_TYPE_LABELS = dict(Assignment.AssignmentType.choices)
+CATEGORY_LABELS = dict(Professor.Category.choices)
+
+EXPORT_HEADER = [
+    'Profesor', 'Email Profesor', 'Categoría',
+    'Asignatura', 'Código Asignatura', 'Facultad',
+    'Disciplina', 'Tipo de Actividad', 'Horas/Semana',
+    'Grupo', 'Año Académico', 'Semestre'
+]
+
+
+def export_rows(queryset):
+    """Filas de la exportación completa, leídas en bloques."""
+    return (
+        [
+            f'{row.professor__first_name} {row.professor__last_name}',
+            row.professor__email,
+            CATEGORY_LABELS.get(row.professor__category, row.professor__category),
+            row.subject__name,
+            row.subject__code,
+            row.faculty__name,
+            row.subject__discipline__name,
+            ASSIGNMENT_TYPE_LABELS.get(row.assignment_type, row.assignment_type),
+            row.hours_per_week,
+            row.group or '',
+            row.academic_year,
+            row.semester
+        ]
+        for row in iter_values(queryset, EXPORT_FIELDS)
+    )
+
+
+def write_csv(file, queryset):
+    """Escribe la exportación en ``file`` (binario) y devuelve el número de filas."""
+    lines = 0
+    for lines, line in enumerate(iter_csv(EXPORT_HEADER, export_rows(queryset)), start=1):
+        file.write(line.encode('utf-8'))
+    # Sin contar el BOM ni la cabecera
+    return lines - 2
+
+
+def write_xlsx(file, queryset):
+    """Como ``write_csv`` en formato XLSX (requiere ``openpyxl``)."""
+    # Modo de solo escritura: las filas no se acumulan en memoria
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Asignaciones')
+    sheet.append(EXPORT_HEADER)
+    count = 0
+    for count, row in enumerate(export_rows(queryset), start=1):
+        sheet.append(row)
+    workbook.save(file)
+    return count
@@ -0,0 +1,76 @@
+"""
+Construcción del JSON de cambios del historial de asignaciones.
+"""
+from academic.models import Faculty, Subject
+from professors.models import Professor
+from .models import Assignment
+
+
+ASSIGNMENT_TYPE_LABELS = dict(Assignment.AssignmentType.choices)
+
+
+def _professor_names(ids):
+    rows = Professor.objects.filter(pk__in=ids).values_list('pk', 'first_name', 'last_name')
+    return {pk: f'{first} {last}' for pk, first, last in rows}
+
+
+def _subject_names(ids):
+    rows = Subject.objects.filter(pk__in=ids).values_list('pk', 'name', 'discipline__name')
+    return {pk: (name, discipline) for pk, name, discipline in rows}
+
+
+def _faculty_names(ids):
+    return dict(Faculty.objects.filter(pk__in=ids).values_list('pk', 'name'))
+
+
+# attname -> (clave en el historial, clave del nombre, función que resuelve nombres)
+NAMED_RELATIONS = {
+    'professor_id': ('professor', 'professor_name', _professor_names),
+    'subject_id': ('subject', 'subject_name', _subject_names),
+    'faculty_id': ('faculty', 'faculty_name', _faculty_names),
+}
+
+
+def _json_value(value):
+    return value if value is None or isinstance(value, (str, int, float, bool)) else str(value)
+
+
+def build_history_changes(changes_list):
+    """
+    Convierte una lista de ``{attname: (antes, después)}`` (``Assignment.get_changes``)
+    en el JSON que se guarda en ``AssignmentHistory.changes``. Los nombres solo se
+    resuelven para las FKs que realmente cambiaron, con una consulta por modelo.
+    """
+    names = {}
+    for attname, (_, _, resolver) in NAMED_RELATIONS.items():
+        ids = {
+            value
+            for changes in changes_list if attname in changes
+            for value in changes[attname] if value is not None
+        }
+        if ids:
+            names[attname] = resolver(ids)
+
+    result = []
+    for changes in changes_list:
+        data = {}
+        for attname, (old, new) in changes.items():
+            if attname in NAMED_RELATIONS:
+                key, name_key, _ = NAMED_RELATIONS[attname]
+                old_name, new_name = names[attname].get(old), names[attname].get(new)
+                data[key] = {'old': old, 'new': new}
+                if attname == 'subject_id':
+                    old_name, old_discipline = old_name or (None, None)
+                    new_name, new_discipline = new_name or (None, None)
+                    if old_discipline != new_discipline:
+                        data['discipline_name'] = {'old': old_discipline, 'new': new_discipline}
+                data[name_key] = {'old': old_name, 'new': new_name}
+            else:
+                data[attname] = {'old': _json_value(old), 'new': _json_value(new)}
+                if attname == 'assignment_type':
+                    data['assignment_type_display'] = {
+                        'old': ASSIGNMENT_TYPE_LABELS.get(old, old),
+                        'new': ASSIGNMENT_TYPE_LABELS.get(new, new),
+                    }
+        result.append(data)
+    return result
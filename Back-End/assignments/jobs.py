@@ -0,0 +1,79 @@
+"""
+Trabajos en segundo plano de asignaciones: exportación completa (CSV o XLSX),
+reconstrucción de los resúmenes de carga e importación masiva.
+"""
+from django.db import IntegrityError
+from rest_framework import serializers
+
+from jobs.registry import JobFailed, register, save_result_file
+from users.scope import get_user_scope
+from .bulk import BulkAssignmentOperation
+from .exports import Workbook, write_csv, write_xlsx
+from .models import Assignment, ProfessorLoadSummary
+from .serializers import AssignmentBulkSerializer
+
+
+class AssignmentExportJobSerializer(serializers.Serializer):
+    """Filtros y formato de la exportación completa."""
+    academic_year = serializers.CharField(max_length=20, required=False)
+    semester = serializers.ChoiceField(choices=[1, 2], required=False)
+    faculty = serializers.IntegerField(min_value=1, required=False)
+    discipline = serializers.IntegerField(min_value=1, required=False)
+    format = serializers.ChoiceField(choices=['csv', 'xlsx'], default='csv')
+
+    def validate_format(self, value):
+        if value == 'xlsx' and Workbook is None:
+            raise serializers.ValidationError('El formato XLSX requiere el paquete openpyxl.')
+        return value
+
+
+@register(
+    'assignments.export',
+    permission=lambda user: user.can_download_reports(),
+    serializer=AssignmentExportJobSerializer,
+    description='Exportación completa de asignaciones (CSV o XLSX) para descargar.'
+)
+def export_assignments(job):
+    params = job.params
+    filters = {
+        lookup: params[name] for name, lookup in (
+            ('academic_year', 'academic_year'), ('semester', 'semester'),
+            ('faculty', 'faculty_id'), ('discipline', 'subject__discipline_id'),
+        ) if params.get(name) is not None
+    }
+    queryset = Assignment.objects.filter(**filters)
+    extension = params.get('format', 'csv')
+    suffix = ''.join(f"_{params[name]}" for name in ('academic_year', 'semester') if params.get(name) is not None)
+    write = write_xlsx if extension == 'xlsx' else write_csv
+    rows = save_result_file(job, f'asignaciones{suffix}.{extension}', lambda file: write(file, queryset))
+    return {'rows': rows, 'format': extension}
+
+
+@register(
+    'assignments.rebuild_load_summaries',
+    permission=lambda user: user.is_admin or user.is_vicedecano,
+    description='Reconstruye los resúmenes de carga docente de todos los profesores.'
+)
+def rebuild_load_summaries(job):
+    return {'summaries': ProfessorLoadSummary.rebuild()}
+
+
+@register(
+    'assignments.bulk',
+    permission=lambda user: user.can_modify_assignments(),
+    serializer=AssignmentBulkSerializer,
+    description='Operación masiva de asignaciones (como /api/assignments/bulk/) para lotes grandes.'
+)
+def bulk_assignments(job):
+    user = job.created_by
+    queryset = Assignment.objects.all()
+    if user is not None and user.is_jefe_disciplina:
+        queryset = queryset.filter(subject_id__in=get_user_scope(user).subject_ids)
+    operation = BulkAssignmentOperation(queryset, user, job.params)
+    try:
+        operation.validate()
+        return operation.apply()
+    except serializers.ValidationError as error:
+        raise JobFailed('El lote no es válido.', {'errors': error.detail})
+    except IntegrityError:
+        raise JobFailed('El lote entra en conflicto con cambios concurrentes. Intente de nuevo.')
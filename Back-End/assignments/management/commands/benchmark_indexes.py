@@ -0,0 +1,173 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from academic.models import Faculty, Discipline, Subject
+from assignments.models import Assignment, AssignmentHistory
+from comments.models import Comment
+from professors.models import Professor
+from users.models import User
+
+
+class _Rollback(Exception):
+    """Fuerza el rollback de la transacción del benchmark."""
+
+
+class Command(BaseCommand):
+    help = (
+        'Muestra los planes de consulta y tiempos de las consultas más frecuentes '
+        'con y sin los índices compuestos. Todo se ejecuta en una transacción '
+        'que se revierte al terminar.'
+    )
+
+    # Índices añadidos en assignments/0004 y comments/0003
+    INDEXES = [
+        (Assignment, 'assign_faculty_period_idx'),
+        (Assignment, 'assign_subject_period_idx'),
+        (Assignment, 'assign_active_prof_idx'),
+        (Assignment, 'assign_order_idx'),
+        (AssignmentHistory, 'history_assign_created_idx'),
+        (AssignmentHistory, 'history_created_idx'),
+        (Comment, 'comment_created_idx'),
+        (Comment, 'comment_unread_idx'),
+    ]
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', type=int, default=20000,
+            help='Asignaciones sintéticas a generar (0 para usar los datos existentes)'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=20,
+            help='Repeticiones de cada consulta para medir el tiempo'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                if options['rows']:
+                    self.stdout.write(self.style.HTTP_INFO(f"Generando {options['rows']} asignaciones sintéticas..."))
+                    self.seed(options['rows'])
+                self.analyze()
+
+                after = self.run_queries('Con índices', options['repeat'])
+                self.drop_indexes()
+                self.analyze()
+                before = self.run_queries('Sin índices', options['repeat'])
+
+                self.stdout.write("\n" + "=" * 60)
+                self.stdout.write(self.style.SUCCESS("Resumen (ms por consulta)"))
+                self.stdout.write("=" * 60)
+                for name in after:
+                    self.stdout.write(
+                        f"  {name:<28} sin índices: {before[name]:8.3f}   con índices: {after[name]:8.3f}"
+                    )
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write("\n" + self.style.WARNING("Transacción revertida: la base de datos no se modificó."))
+
+    def queries(self):
+        assignment = Assignment.objects.order_by('id').first()
+        head_id = Discipline.objects.exclude(head=None).values_list('head_id', flat=True).first()
+        faculty_id = assignment.faculty_id if assignment else 0
+        professor_id = assignment.professor_id if assignment else 0
+        academic_year = assignment.academic_year if assignment else ''
+        assignment_id = assignment.id if assignment else 0
+
+        return {
+            'jefe_scope': Assignment.objects.filter(subject__discipline__head_id=head_id),
+            'faculty_period': Assignment.objects.filter(
+                faculty_id=faculty_id, academic_year=academic_year, semester=1
+            ),
+            'active_by_professor': Assignment.objects.filter(
+                professor_id=professor_id, is_active=True
+            ).order_by(),
+            'ordered_page': Assignment.objects.order_by('order', 'id')[:50],
+            'unread_comments': Comment.objects.filter(is_read=False).order_by('-created_at')[:50],
+            'comments_page': Comment.objects.order_by('-created_at', '-id')[:50],
+            'history_by_assignment': AssignmentHistory.objects.filter(
+                assignment_id=assignment_id
+            ).order_by('-created_at'),
+            'history_page': AssignmentHistory.objects.order_by('-created_at', '-id')[:50],
+        }
+
+    def run_queries(self, title, repeat):
+        self.stdout.write("\n" + "=" * 60)
+        self.stdout.write(self.style.SUCCESS(title))
+        self.stdout.write("=" * 60)
+        timings = {}
+        for name, queryset in self.queries().items():
+            self.stdout.write(self.style.HTTP_INFO(f"\n--- {name} ---"))
+            self.stdout.write(queryset.explain())
+            start = time.perf_counter()
+            for _ in range(repeat):
+                list(queryset.all())
+            timings[name] = (time.perf_counter() - start) * 1000 / repeat
+        return timings
+
+    def drop_indexes(self):
+        with connection.cursor() as cursor:
+            for model, name in self.INDEXES:
+                cursor.execute(f'DROP INDEX {connection.ops.quote_name(name)}')
+
+    def analyze(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def seed(self, rows):
+        heads = User.objects.bulk_create([
+            User(username=f'bench_jefe_{i}', email=f'bench_jefe_{i}@uci.cu', role=User.Role.JEFE_DISCIPLINA)
+            for i in range(20)
+        ])
+        faculties = Faculty.objects.bulk_create([
+            Faculty(name=f'Bench Facultad {i}', code=f'BF{i}') for i in range(10)
+        ])
+        disciplines = Discipline.objects.bulk_create([
+            Discipline(name=f'Bench Disciplina {i}', code=f'BD{i}', head=heads[i % len(heads)])
+            for i in range(40)
+        ])
+        subjects = Subject.objects.bulk_create([
+            Subject(name=f'Bench Asignatura {i}', code=f'BS{i}', discipline=disciplines[i % len(disciplines)])
+            for i in range(400)
+        ])
+        professors = Professor.objects.bulk_create([
+            Professor(
+                first_name=f'Nombre{i}', last_name=f'Apellido{i}',
+                email=f'bench_prof_{i}@uci.cu', identification=f'B{i:010d}'
+            )
+            for i in range(max(rows // 10, 1))
+        ])
+
+        types = [value for value, _ in Assignment.AssignmentType.choices]
+        assignments = Assignment.objects.bulk_create([
+            Assignment(
+                professor=professors[i % len(professors)],
+                subject=subjects[(i * 7) % len(subjects)],
+                faculty=faculties[i % len(faculties)],
+                assignment_type=types[i % len(types)],
+                hours_per_week=2 + i % 6,
+                group=f'G{i}',
+                academic_year=f'{2020 + i % 6}-{2021 + i % 6}',
+                semester=1 + i % 2,
+                order=i % 100,
+                is_active=i % 5 != 0,
+            )
+            for i in range(rows)
+        ], batch_size=1000)
+
+        AssignmentHistory.objects.bulk_create([
+            AssignmentHistory(
+                assignment=assignments[i % len(assignments)],
+                action=AssignmentHistory.ActionType.UPDATE,
+                changes={'order': {'old': 0, 'new': 1}}
+            )
+            for i in range(rows)
+        ], batch_size=1000)
+        Comment.objects.bulk_create([
+            Comment(
+                author=heads[i % len(heads)], subject=f'Cambio {i}',
+                message='Benchmark', is_read=i % 10 != 0
+            )
+            for i in range(rows // 2)
+        ], batch_size=1000)
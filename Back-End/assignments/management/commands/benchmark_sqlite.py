@@ -0,0 +1,127 @@
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        'Compara el rendimiento de lecturas y escrituras concurrentes sobre SQLite '
+        'con la configuración por defecto y con SQLITE_TUNED_PRAGMAS (WAL). '
+        'Usa una base de datos temporal; no toca db.sqlite3.'
+    )
+
+    DEFAULT_PRAGMAS = 'PRAGMA journal_mode=DELETE;PRAGMA synchronous=FULL;'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000, help='Filas de asignaciones a generar')
+        parser.add_argument('--readers', type=int, default=4, help='Hilos de lectura (dashboard)')
+        parser.add_argument('--writers', type=int, default=2, help='Hilos de escritura (jefes)')
+        parser.add_argument('--seconds', type=float, default=5.0, help='Duración de cada modo')
+
+    def handle(self, *args, **options):
+        results = {}
+        for mode, pragmas in (('default', self.DEFAULT_PRAGMAS), ('tuned', settings.SQLITE_TUNED_PRAGMAS)):
+            fd, path = tempfile.mkstemp(suffix='.sqlite3')
+            os.close(fd)
+            try:
+                self.seed(path, options['rows'])
+                self.stdout.write(self.style.HTTP_INFO(f"Ejecutando modo {mode}..."))
+                results[mode] = self.run(path, pragmas, options)
+            finally:
+                for suffix in ('', '-wal', '-shm', '-journal'):
+                    if os.path.exists(path + suffix):
+                        os.remove(path + suffix)
+
+        self.stdout.write("\n" + "=" * 60)
+        self.stdout.write(self.style.SUCCESS("Operaciones por segundo"))
+        self.stdout.write("=" * 60)
+        for mode, data in results.items():
+            self.stdout.write(
+                f"  {mode:<8} lecturas: {data['reads']:9.1f}   escrituras: {data['writes']:8.1f}   "
+                f"bloqueos: {data['locked']}"
+            )
+
+    def connect(self, path, pragmas):
+        # Mismo timeout que Django usa por defecto (5 s)
+        conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        for pragma in pragmas.split(';'):
+            if pragma.strip():
+                conn.execute(pragma)
+        return conn
+
+    def seed(self, path, rows):
+        conn = sqlite3.connect(path)
+        conn.execute(
+            'CREATE TABLE assignment ('
+            'id INTEGER PRIMARY KEY, professor_id INTEGER, faculty_id INTEGER, '
+            'hours_per_week INTEGER, semester INTEGER, is_active INTEGER)'
+        )
+        conn.executemany(
+            'INSERT INTO assignment (professor_id, faculty_id, hours_per_week, semester, is_active) '
+            'VALUES (?, ?, ?, ?, 1)',
+            [(i % 1500, i % 10, 2 + i % 6, 1 + i % 2) for i in range(rows)]
+        )
+        conn.execute('CREATE INDEX assignment_faculty ON assignment (faculty_id, semester)')
+        conn.commit()
+        conn.close()
+
+    def run(self, path, pragmas, options):
+        deadline = time.perf_counter() + options['seconds']
+        counters = {'reads': 0, 'writes': 0, 'locked': 0}
+        lock = threading.Lock()
+
+        def reader():
+            conn = self.connect(path, pragmas)
+            done = 0
+            while time.perf_counter() < deadline:
+                conn.execute(
+                    'SELECT professor_id, SUM(hours_per_week) FROM assignment '
+                    'WHERE faculty_id = ? AND is_active = 1 GROUP BY professor_id',
+                    (random.randrange(10),)
+                ).fetchall()
+                done += 1
+            conn.close()
+            with lock:
+                counters['reads'] += done
+
+        def writer():
+            conn = self.connect(path, pragmas)
+            done = locked = 0
+            while time.perf_counter() < deadline:
+                try:
+                    conn.execute('BEGIN IMMEDIATE')
+                    conn.execute(
+                        'UPDATE assignment SET hours_per_week = ? WHERE id = ?',
+                        (random.randint(2, 8), random.randint(1, options['rows']))
+                    )
+                    conn.execute('COMMIT')
+                    done += 1
+                except sqlite3.OperationalError:
+                    locked += 1
+                    if conn.in_transaction:
+                        conn.execute('ROLLBACK')
+            conn.close()
+            with lock:
+                counters['writes'] += done
+                counters['locked'] += locked
+
+        threads = [threading.Thread(target=reader) for _ in range(options['readers'])]
+        threads += [threading.Thread(target=writer) for _ in range(options['writers'])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        return {
+            'reads': counters['reads'] / elapsed,
+            'writes': counters['writes'] / elapsed,
+            'locked': counters['locked'],
+        }
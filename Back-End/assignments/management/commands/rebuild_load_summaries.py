@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from assignments.models import ProfessorLoadSummary
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye los resúmenes de carga docente por profesor y semestre'
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.HTTP_INFO("Reconstruyendo resúmenes de carga docente..."))
+        total = ProfessorLoadSummary.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"✓ {total} resumen(es) generados"))
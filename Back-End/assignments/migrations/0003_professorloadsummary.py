@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assignments', '0002_initial'),
+        ('professors', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfessorLoadSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('academic_year', models.CharField(max_length=20, verbose_name='Año Académico')),
+                ('semester', models.PositiveIntegerField(verbose_name='Semestre')),
+                ('total_hours', models.PositiveIntegerField(default=0, verbose_name='Horas totales')),
+                ('lecture_hours', models.PositiveIntegerField(default=0, verbose_name='Horas de conferencia')),
+                ('practical_hours', models.PositiveIntegerField(default=0, verbose_name='Horas de clase práctica')),
+                ('seminar_hours', models.PositiveIntegerField(default=0, verbose_name='Horas de seminario')),
+                ('lab_hours', models.PositiveIntegerField(default=0, verbose_name='Horas de laboratorio')),
+                ('workshop_hours', models.PositiveIntegerField(default=0, verbose_name='Horas de taller')),
+                ('assignments_count', models.PositiveIntegerField(default=0, verbose_name='Asignaciones')),
+                ('subjects_count', models.PositiveIntegerField(default=0, verbose_name='Asignaturas distintas')),
+                ('faculties_count', models.PositiveIntegerField(default=0, verbose_name='Facultades distintas')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Fecha de actualización')),
+                ('professor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='load_summaries', to='professors.professor', verbose_name='Profesor')),
+            ],
+            options={
+                'verbose_name': 'Resumen de Carga Docente',
+                'verbose_name_plural': 'Resúmenes de Carga Docente',
+                'ordering': ['academic_year', 'semester', 'professor'],
+                'unique_together': {('professor', 'academic_year', 'semester')},
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0002_initial'),
+        ('assignments', '0003_professorloadsummary'),
+        ('professors', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['faculty', 'academic_year', 'semester'], name='assign_faculty_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['subject', 'academic_year', 'semester'], name='assign_subject_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['professor', 'academic_year', 'semester'], name='assign_active_prof_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['order', 'id'], name='assign_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignmenthistory',
+            index=models.Index(fields=['assignment', '-created_at'], name='history_assign_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assignmenthistory',
+            index=models.Index(fields=['-created_at', '-id'], name='history_created_idx'),
+        ),
+    ]
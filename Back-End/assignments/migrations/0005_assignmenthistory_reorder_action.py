@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('assignments', '0004_add_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='assignmenthistory',
+            name='action',
+            field=models.CharField(choices=[('CREATE', 'Creación'), ('UPDATE', 'Modificación'), ('DELETE', 'Eliminación'), ('REORDER', 'Reordenamiento')], max_length=10, verbose_name='Acción'),
+        ),
+    ]
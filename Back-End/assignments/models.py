@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
 from django.conf import settings
 from academic.models import Faculty, Discipline, Subject
 from professors.models import Professor
@@ -98,6 +100,21 @@ class Assignment(models.Model):
             'professor', 'subject', 'faculty', 'assignment_type', 
             'academic_year', 'semester', 'group'
         ]
+        indexes = [
+            # Exportación y filtros por facultad y periodo
+            models.Index(fields=['faculty', 'academic_year', 'semester'], name='assign_faculty_period_idx'),
+            # Listados del jefe de disciplina (subject__discipline__head)
+            models.Index(fields=['subject', 'academic_year', 'semester'], name='assign_subject_period_idx'),
+            # Carga activa por profesor (prefetch del listado y resúmenes de carga)
+            models.Index(
+                fields=['professor', 'academic_year', 'semester'],
+                name='assign_active_prof_idx',
+                condition=models.Q(is_active=True)
+            ),
+            # Solo la paginación por cursor (cursor_ordering = order, id); el orden por
+            # defecto (order, faculty, subject, professor) no puede usarlo entero
+            models.Index(fields=['order', 'id'], name='assign_order_idx'),
+        ]
     
     def __str__(self):
         return f"{self.professor} - {self.subject} ({self.faculty})"
@@ -106,6 +123,65 @@ class Assignment(models.Model):
     def discipline(self):
         """Obtiene la disciplina a través de la asignatura."""
         return self.subject.discipline
+    
+    # Campos que no se registran como cambios en el historial
+    UNTRACKED_FIELDS = ('id', 'created_at', 'updated_at')
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Guarda una copia de los valores cargados para detectar cambios sin otra consulta."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+    
+    def get_loaded_value(self, attname, default=None):
+        """Valor de un campo tal como se cargó de la base de datos."""
+        return getattr(self, '_loaded_values', {}).get(attname, default)
+    
+    def get_changes(self):
+        """
+        Devuelve ``{attname: (antes, después)}`` de los campos modificados desde
+        que la instancia se cargó (o se guardó por última vez).
+        """
+        loaded = getattr(self, '_loaded_values', {})
+        changes = {}
+        for attname, old in loaded.items():
+            if attname in self.UNTRACKED_FIELDS or attname not in self.__dict__:
+                continue
+            new = self.__dict__[attname]
+            if old != new:
+                changes[attname] = (old, new)
+        return changes
+    
+    def _attnames(self, names):
+        """``attname`` de los campos indicados por nombre (``None``: todos)."""
+        if names is None:
+            return None
+        return {self._meta.get_field(name).attname for name in names}
+    
+    def _update_loaded_values(self, attnames=None):
+        """Renueva la copia de los valores cargados, solo de ``attnames`` si se indica."""
+        loaded = dict(getattr(self, '_loaded_values', {}))
+        for field in self._meta.concrete_fields:
+            if field.attname in self.__dict__ and (attnames is None or field.attname in attnames):
+                loaded[field.attname] = self.__dict__[field.attname]
+        self._loaded_values = loaded
+    
+    def save(self, *args, **kwargs):
+        saved = self._attnames(kwargs.get('update_fields'))
+        changes = self.get_changes()
+        if saved is not None:
+            changes = {attname: change for attname, change in changes.items() if attname in saved}
+        super().save(*args, **kwargs)
+        # Cambios aplicados en este guardado (los lee perform_update para el historial)
+        self.saved_changes = changes
+        # Las señales post_save ya vieron la copia anterior; renovarla tras guardar
+        # (con ``update_fields``, solo la de los campos guardados)
+        self._update_loaded_values(saved)
+    
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        self._update_loaded_values(self._attnames(fields))
 
 
 class AssignmentHistory(models.Model):
@@ -118,6 +194,7 @@ class AssignmentHistory(models.Model):
         CREATE = 'CREATE', 'Creación'
         UPDATE = 'UPDATE', 'Modificación'
         DELETE = 'DELETE', 'Eliminación'
+        REORDER = 'REORDER', 'Reordenamiento'
     
     assignment = models.ForeignKey(
         Assignment,
@@ -150,6 +227,156 @@ class AssignmentHistory(models.Model):
         verbose_name = 'Historial de Asignación'
         verbose_name_plural = 'Historial de Asignaciones'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['assignment', '-created_at'], name='history_assign_created_idx'),
+            models.Index(fields=['-created_at', '-id'], name='history_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.get_action_display()} - {self.assignment} por {self.performed_by}"
+
+
+class ProfessorLoadSummary(models.Model):
+    """
+    Resumen materializado de la carga docente de un profesor por año académico
+    y semestre. Se mantiene desde las señales de Assignment y se puede
+    reconstruir completo con ``python manage.py rebuild_load_summaries``.
+    """
+    
+    # Campo de horas correspondiente a cada tipo de actividad
+    TYPE_FIELDS = {
+        Assignment.AssignmentType.LECTURE: 'lecture_hours',
+        Assignment.AssignmentType.PRACTICAL: 'practical_hours',
+        Assignment.AssignmentType.SEMINAR: 'seminar_hours',
+        Assignment.AssignmentType.LAB: 'lab_hours',
+        Assignment.AssignmentType.WORKSHOP: 'workshop_hours',
+    }
+    
+    professor = models.ForeignKey(
+        Professor,
+        on_delete=models.CASCADE,
+        related_name='load_summaries',
+        verbose_name='Profesor'
+    )
+    academic_year = models.CharField(
+        max_length=20,
+        verbose_name='Año Académico'
+    )
+    semester = models.PositiveIntegerField(
+        verbose_name='Semestre'
+    )
+    
+    # Horas por semana
+    total_hours = models.PositiveIntegerField(default=0, verbose_name='Horas totales')
+    lecture_hours = models.PositiveIntegerField(default=0, verbose_name='Horas de conferencia')
+    practical_hours = models.PositiveIntegerField(default=0, verbose_name='Horas de clase práctica')
+    seminar_hours = models.PositiveIntegerField(default=0, verbose_name='Horas de seminario')
+    lab_hours = models.PositiveIntegerField(default=0, verbose_name='Horas de laboratorio')
+    workshop_hours = models.PositiveIntegerField(default=0, verbose_name='Horas de taller')
+    
+    # Conteos
+    assignments_count = models.PositiveIntegerField(default=0, verbose_name='Asignaciones')
+    subjects_count = models.PositiveIntegerField(default=0, verbose_name='Asignaturas distintas')
+    faculties_count = models.PositiveIntegerField(default=0, verbose_name='Facultades distintas')
+    
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Fecha de actualización'
+    )
+    
+    class Meta:
+        verbose_name = 'Resumen de Carga Docente'
+        verbose_name_plural = 'Resúmenes de Carga Docente'
+        ordering = ['academic_year', 'semester', 'professor']
+        unique_together = ['professor', 'academic_year', 'semester']
+    
+    def __str__(self):
+        return f"{self.professor} - {self.academic_year}/{self.semester}: {self.total_hours} h"
+    
+    @classmethod
+    def aggregates(cls):
+        """Expresiones de agregación sobre asignaciones activas para un resumen."""
+        hours = {
+            field: Coalesce(Sum('hours_per_week', filter=Q(assignment_type=value)), 0)
+            for value, field in cls.TYPE_FIELDS.items()
+        }
+        return {
+            'total_hours': Coalesce(Sum('hours_per_week'), 0),
+            **hours,
+            'assignments_count': Count('id'),
+            'subjects_count': Count('subject', distinct=True),
+            'faculties_count': Count('faculty', distinct=True),
+        }
+    
+    @classmethod
+    def refresh(cls, professor_id, academic_year, semester):
+        """
+        Recalcula el resumen de una sola clave (profesor, año, semestre)
+        con una consulta agregada. Elimina la fila si ya no hay carga activa.
+        """
+        data = Assignment.objects.filter(
+            professor_id=professor_id,
+            academic_year=academic_year,
+            semester=semester,
+            is_active=True
+        ).aggregate(**cls.aggregates())
+        
+        if not data['assignments_count']:
+            cls.objects.filter(
+                professor_id=professor_id,
+                academic_year=academic_year,
+                semester=semester
+            ).delete()
+            return None
+        
+        summary, _ = cls.objects.update_or_create(
+            professor_id=professor_id,
+            academic_year=academic_year,
+            semester=semester,
+            defaults=data
+        )
+        return summary
+    
+    @classmethod
+    def refresh_many(cls, keys):
+        """
+        Recalcula varias claves (profesor, año, semestre) con una sola consulta
+        agregada. Se usa en operaciones masivas que no disparan señales.
+        """
+        keys = {key for key in keys if None not in key}
+        if not keys:
+            return
+        professor_ids = {key[0] for key in keys}
+        
+        rows = Assignment.objects.filter(
+            is_active=True, professor_id__in=professor_ids
+        ).order_by().values('professor_id', 'academic_year', 'semester').annotate(**cls.aggregates())
+        rows = [
+            row for row in rows
+            if (row['professor_id'], row['academic_year'], row['semester']) in keys
+        ]
+        stale = [
+            pk for pk, *key in cls.objects.filter(professor_id__in=professor_ids).values_list(
+                'pk', 'professor_id', 'academic_year', 'semester'
+            )
+            if tuple(key) in keys
+        ]
+        
+        with transaction.atomic():
+            cls.objects.filter(pk__in=stale).delete()
+            cls.objects.bulk_create([cls(**row) for row in rows], batch_size=1000)
+    
+    @classmethod
+    def rebuild(cls):
+        """Reconstruye todos los resúmenes a partir de las asignaciones activas."""
+        rows = Assignment.objects.filter(is_active=True).order_by().values(
+            'professor_id', 'academic_year', 'semester'
+        ).annotate(**cls.aggregates())
+        
+        with transaction.atomic():
+            cls.objects.all().delete()
+            summaries = cls.objects.bulk_create(
+                [cls(**row) for row in rows],
+                batch_size=1000
+            )
+        return len(summaries)
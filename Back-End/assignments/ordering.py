@@ -0,0 +1,124 @@
+"""
+Reordenamiento de asignaciones con rangos dispersos.
+
+Los valores de ``order`` se reparten con huecos (``RANK_GAP``) para que mover
+una asignación normalmente solo cambie su propia fila: se conservan las filas
+que ya están en el orden relativo pedido y las demás se colocan en el hueco
+entre sus vecinas. Solo si no queda hueco se renumera la lista completa.
+"""
+from bisect import bisect_left
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.response_cache import bump_model_versions
+from .models import Assignment, AssignmentHistory
+
+
+RANK_GAP = 1024
+
+
+def _stable_positions(ranks):
+    """
+    Índices de la subsecuencia estrictamente creciente más larga de ``ranks``:
+    son las filas que pueden conservar su rango actual.
+    """
+    tails = []        # rango final de la mejor subsecuencia de cada longitud
+    tail_indexes = []
+    previous = [None] * len(ranks)
+    for index, rank in enumerate(ranks):
+        position = bisect_left(tails, rank)
+        if position == len(tails):
+            tails.append(rank)
+            tail_indexes.append(index)
+        else:
+            tails[position] = rank
+            tail_indexes[position] = index
+        previous[index] = tail_indexes[position - 1] if position else None
+
+    stable = set()
+    index = tail_indexes[-1] if tail_indexes else None
+    while index is not None:
+        stable.add(index)
+        index = previous[index]
+    return stable
+
+
+def _fill_gaps(ranks, stable):
+    """
+    Asigna rangos a las filas no estables dentro del hueco entre sus vecinas
+    estables. Devuelve ``None`` si algún hueco es demasiado pequeño.
+    """
+    result = list(ranks)
+    index = 0
+    while index < len(ranks):
+        if index in stable:
+            index += 1
+            continue
+        start = index
+        while index < len(ranks) and index not in stable:
+            index += 1
+        count = index - start
+        low = result[start - 1] if start else -1
+        if index < len(ranks):
+            high = ranks[index]
+            step = (high - low) // (count + 1)
+            if step < 1:
+                return None
+        else:
+            step = RANK_GAP
+        for offset in range(count):
+            result[start + offset] = low + step * (offset + 1)
+    return result
+
+
+def compute_ranks(ranks):
+    """
+    Recibe los rangos actuales en el orden deseado y devuelve los nuevos
+    rangos, estrictamente crecientes, cambiando el menor número de filas.
+    """
+    ranks = list(ranks)
+    result = _fill_gaps(ranks, _stable_positions(ranks))
+    if result is None:
+        result = [RANK_GAP * (index + 1) for index in range(len(ranks))]
+    return result
+
+
+@transaction.atomic
+def reorder_assignments(queryset, ids, user):
+    """
+    Aplica el orden relativo ``ids`` a las asignaciones de ``queryset`` con un
+    único ``bulk_update`` y registra un solo evento en el historial.
+
+    Devuelve ``{id: rango}`` de las filas que cambiaron, o ``None`` si algún
+    id no existe en el alcance del usuario.
+    """
+    assignments = queryset.select_related(None).order_by().select_for_update().in_bulk(ids)
+    if len(assignments) != len(ids):
+        return None
+
+    ordered = [assignments[pk] for pk in ids]
+    new_ranks = compute_ranks([assignment.order for assignment in ordered])
+
+    moved = []
+    changes = {}
+    now = timezone.now()
+    for assignment, rank in zip(ordered, new_ranks):
+        if assignment.order != rank:
+            changes[str(assignment.pk)] = {'old': assignment.order, 'new': rank}
+            assignment.order = rank
+            assignment.updated_at = now
+            moved.append(assignment)
+
+    if moved:
+        Assignment.objects.bulk_update(moved, ['order', 'updated_at'])
+        bump_model_versions(Assignment)
+        # Un único evento compacto, asociado a la primera asignación movida
+        AssignmentHistory.objects.create(
+            assignment=moved[0],
+            action=AssignmentHistory.ActionType.REORDER,
+            changes={'order': changes, 'count': len(ids)},
+            performed_by=user
+        )
+
+    return {assignment.pk: assignment.order for assignment in moved}
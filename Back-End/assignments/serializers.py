@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Assignment, AssignmentHistory
+from .models import Assignment, AssignmentHistory, ProfessorLoadSummary
 from professors.serializers import ProfessorListSerializer
 from academic.serializers import SubjectListSerializer, FacultyListSerializer
 
@@ -55,6 +55,63 @@ class AssignmentUpdateSerializer(serializers.ModelSerializer):
         ]
 
 
+class AssignmentBulkItemSerializer(serializers.ModelSerializer):
+    """
+    Fila de una operación masiva. Las claves foráneas se reciben como IDs y
+    tanto su existencia como la unicidad se validan en bloque en ``bulk.py``,
+    sin una consulta por fila.
+    """
+    professor = serializers.IntegerField(source='professor_id', min_value=1)
+    subject = serializers.IntegerField(source='subject_id', min_value=1)
+    faculty = serializers.IntegerField(source='faculty_id', min_value=1)
+    
+    class Meta:
+        model = Assignment
+        fields = [
+            'professor', 'subject', 'faculty', 'assignment_type',
+            'hours_per_week', 'group', 'academic_year', 'semester',
+            'order', 'is_active'
+        ]
+        validators = []
+
+
+class AssignmentBulkUpdateSerializer(AssignmentBulkItemSerializer):
+    """Fila de actualización masiva: ``id`` más solo los campos a modificar."""
+    id = serializers.IntegerField(min_value=1)
+    professor = serializers.IntegerField(source='professor_id', min_value=1, required=False)
+    subject = serializers.IntegerField(source='subject_id', min_value=1, required=False)
+    faculty = serializers.IntegerField(source='faculty_id', min_value=1, required=False)
+    
+    class Meta(AssignmentBulkItemSerializer.Meta):
+        fields = ['id'] + AssignmentBulkItemSerializer.Meta.fields
+        extra_kwargs = {'academic_year': {'required': False}}
+
+
+class AssignmentBulkSerializer(serializers.Serializer):
+    """Operación masiva: altas, modificaciones y bajas en una sola petición."""
+    create = AssignmentBulkItemSerializer(many=True, required=False)
+    update = AssignmentBulkUpdateSerializer(many=True, required=False)
+    delete = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+    
+    def validate(self, attrs):
+        if not any(attrs.get(key) for key in ('create', 'update', 'delete')):
+            raise serializers.ValidationError('Debe indicar al menos una operación.')
+        return attrs
+
+
+class AssignmentReorderSerializer(serializers.Serializer):
+    """IDs de asignaciones en el orden relativo deseado."""
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False, max_length=1000
+    )
+    
+    def validate_ids(self, value):
+        if len(value) != len(set(value)):
+            raise serializers.ValidationError('La lista contiene IDs repetidos.')
+        return value
+
+
 class AssignmentListSerializer(serializers.ModelSerializer):
     """Serializer simplificado para listar Asignaciones."""
     professor_name = serializers.CharField(source='professor.full_name', read_only=True)
@@ -126,3 +183,17 @@ class AssignmentExportSerializer(serializers.ModelSerializer):
             'assignment_type_display', 'hours_per_week', 'group',
             'academic_year', 'semester'
         ]
+
+
+class ProfessorLoadSummarySerializer(serializers.ModelSerializer):
+    """Serializer para los resúmenes de carga docente."""
+    professor_name = serializers.CharField(source='professor.full_name', read_only=True)
+    
+    class Meta:
+        model = ProfessorLoadSummary
+        fields = [
+            'id', 'professor', 'professor_name', 'academic_year', 'semester',
+            'total_hours', 'lecture_hours', 'practical_hours', 'seminar_hours',
+            'lab_hours', 'workshop_hours', 'assignments_count',
+            'subjects_count', 'faculties_count', 'updated_at'
+        ]
@@ -0,0 +1,64 @@
+import threading
+from contextlib import contextmanager
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Assignment, ProfessorLoadSummary
+
+
+_deferred = threading.local()
+
+
+SUMMARY_KEY_FIELDS = ('professor_id', 'academic_year', 'semester')
+
+
+def summary_keys(instance):
+    """
+    Claves de resumen afectadas por la instancia: la actual y la que tenía al
+    cargarse de la base de datos (si cambió de profesor o de periodo).
+    Se lee de __dict__ para no disparar consultas sobre campos diferidos.
+    """
+    current = tuple(instance.__dict__.get(field) for field in SUMMARY_KEY_FIELDS)
+    loaded = tuple(instance.get_loaded_value(field) for field in SUMMARY_KEY_FIELDS)
+    return {current, loaded}
+
+
+def _refresh_summaries(keys):
+    pending = getattr(_deferred, 'keys', None)
+    if pending is not None:
+        pending.update(keys)
+        return
+    for key in keys:
+        if None not in key:
+            ProfessorLoadSummary.refresh(*key)
+
+
+@contextmanager
+def deferred_summary_refresh():
+    """
+    Acumula las claves de resumen afectadas dentro del bloque y las recalcula
+    una sola vez al salir. Las operaciones masivas (bulk_create/bulk_update)
+    no disparan señales, así que deben añadir sus claves al conjunto devuelto.
+    """
+    if getattr(_deferred, 'keys', None) is not None:
+        # Bloque anidado: el externo se encarga del recálculo
+        yield _deferred.keys
+        return
+    _deferred.keys = keys = set()
+    try:
+        yield keys
+    finally:
+        _deferred.keys = None
+    ProfessorLoadSummary.refresh_many(keys)
+
+
+@receiver(post_save, sender=Assignment)
+def update_summary_on_save(sender, instance, **kwargs):
+    """Recalcula el resumen afectado (y el anterior si cambió la clave)."""
+    _refresh_summaries(summary_keys(instance))
+
+
+@receiver(post_delete, sender=Assignment)
+def update_summary_on_delete(sender, instance, **kwargs):
+    _refresh_summaries(summary_keys(instance))
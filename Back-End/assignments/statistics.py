@@ -0,0 +1,143 @@
+"""
+Estadísticas agregadas de carga docente calculadas en la base de datos.
+"""
+from itertools import groupby
+
+from django.db import connection
+from django.db.models import Aggregate, Avg, Count, FloatField, Max, Min, Sum
+from django.db.models.functions import Coalesce
+
+
+# Dimensiones de agrupación: nombre del parámetro -> (campo clave, campo etiqueta)
+GROUP_FIELDS = {
+    'faculty': ('faculty_id', 'faculty__name'),
+    'discipline': ('subject__discipline_id', 'subject__discipline__name'),
+    'subject': ('subject_id', 'subject__name'),
+    'assignment_type': ('assignment_type', None),
+    'academic_year': ('academic_year', None),
+    'semester': ('semester', None),
+}
+
+PERCENTILES = {'p50_hours': 0.5, 'p95_hours': 0.95}
+
+
+class PercentileCont(Aggregate):
+    """Agregado ``percentile_cont`` de PostgreSQL."""
+    function = 'PERCENTILE_CONT'
+    template = '%(function)s(%(percentile)s) WITHIN GROUP (ORDER BY %(expressions)s)'
+    output_field = FloatField()
+
+    def __init__(self, expression, percentile, **extra):
+        super().__init__(expression, percentile=float(percentile), **extra)
+
+
+def parse_group_by(value):
+    """
+    Convierte ``"faculty,semester"`` en una lista de dimensiones válidas.
+    Lanza ``ValueError`` con las dimensiones desconocidas.
+    """
+    names = [name.strip() for name in (value or '').split(',') if name.strip()]
+    unknown = [name for name in names if name not in GROUP_FIELDS]
+    if unknown:
+        raise ValueError(', '.join(unknown))
+    # Conservar el orden pedido sin repetir dimensiones
+    return list(dict.fromkeys(names))
+
+
+def _value_fields(group_by):
+    fields = []
+    for name in group_by:
+        key, label = GROUP_FIELDS[name]
+        fields.append(key)
+        if label:
+            fields.append(label)
+    return fields
+
+
+def _aggregates(with_percentiles):
+    aggregates = {
+        'count': Count('id'),
+        'professors_count': Count('professor', distinct=True),
+        'total_hours': Coalesce(Sum('hours_per_week'), 0),
+        'avg_hours': Avg('hours_per_week'),
+        'min_hours': Min('hours_per_week'),
+        'max_hours': Max('hours_per_week'),
+    }
+    if with_percentiles:
+        for name, percentile in PERCENTILES.items():
+            aggregates[name] = PercentileCont('hours_per_week', percentile)
+    return aggregates
+
+
+def _percentile(sorted_values, percentile):
+    """Interpolación lineal, equivalente a ``percentile_cont``."""
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * percentile
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+def _percentiles(sorted_values):
+    return {
+        name: _percentile(sorted_values, percentile)
+        for name, percentile in PERCENTILES.items()
+    }
+
+
+def _python_percentiles(queryset, key_fields):
+    """
+    Calcula los percentiles globales y por grupo en una sola pasada ordenada,
+    para los motores sin ``percentile_cont`` (p. ej. SQLite).
+    """
+    rows = queryset.order_by(*key_fields, 'hours_per_week').values_list(
+        *key_fields, 'hours_per_week'
+    )
+    width = len(key_fields)
+    all_hours = []
+    by_group = {}
+    for key, items in groupby(rows.iterator(), key=lambda row: row[:width]):
+        hours = [row[width] for row in items]
+        all_hours.extend(hours)
+        by_group[key] = _percentiles(hours)
+    all_hours.sort()
+    return _percentiles(all_hours), by_group
+
+
+def _format(row):
+    for name in ('avg_hours', *PERCENTILES):
+        if row.get(name) is not None:
+            row[name] = round(float(row[name]), 2)
+    return row
+
+
+def build_statistics(queryset, group_by):
+    """
+    Devuelve el resumen global y las filas agrupadas por ``group_by``.
+    Cada agrupación es una única consulta ``values().annotate()``; en
+    PostgreSQL los percentiles se calculan en esa misma consulta.
+    """
+    queryset = queryset.order_by()
+    native = connection.vendor == 'postgresql'
+    aggregates = _aggregates(with_percentiles=native)
+
+    overall = queryset.aggregate(**aggregates)
+    groups = []
+    if group_by:
+        value_fields = _value_fields(group_by)
+        groups = list(queryset.values(*value_fields).annotate(**aggregates).order_by(*value_fields))
+
+    if not native:
+        key_fields = [GROUP_FIELDS[name][0] for name in group_by]
+        overall_percentiles, by_group = _python_percentiles(queryset, key_fields)
+        overall.update(overall_percentiles)
+        for row in groups:
+            row.update(by_group[tuple(row[field] for field in key_fields)])
+
+    return {
+        'group_by': group_by,
+        'overall': _format(overall),
+        'groups': [_format(row) for row in groups],
+    }
@@ -1,3 +1,443 @@
-from django.test import TestCase
+from django.db import connection
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from users.models import User
+from academic.models import Faculty, Discipline, Subject
+from professors.models import Professor
+from .models import Assignment, AssignmentHistory, ProfessorLoadSummary
+from .ordering import RANK_GAP, compute_ranks
+
+
+class AssignmentTestMixin:
+    """Datos mínimos compartidos por las pruebas de asignaciones."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vicedecano = User.objects.create_user(
+            username='vicedecano', email='vicedecano@uci.cu',
+            password='123456', role=User.Role.VICEDECANO
+        )
+        cls.faculty = Faculty.objects.create(name='Facultad 1', code='F1')
+        cls.discipline = Discipline.objects.create(name='Matemática', code='MAT')
+        cls.subject = Subject.objects.create(
+            name='Álgebra', code='ALG', discipline=cls.discipline, hours_per_week=4
+        )
+        cls.professor = Professor.objects.create(
+            first_name='Ana', last_name='Pérez',
+            email='ana@uci.cu', identification='00000000001'
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.vicedecano)
+
+    def create_assignment(self, **kwargs):
+        data = {
+            'professor': self.professor, 'subject': self.subject,
+            'faculty': self.faculty, 'academic_year': '2025-2026',
+            'semester': 1, 'hours_per_week': 4,
+        }
+        data.update(kwargs)
+        return Assignment.objects.create(**data)
+
+
+class CursorPaginationTests(AssignmentTestMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Órdenes repetidos para comprobar el desempate por id
+        for i in range(7):
+            self.create_assignment(group=f'G{i}', order=i % 3)
+
+    def test_without_params_returns_full_list(self):
+        response = self.client.get('/api/assignments/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.json(), list)
+        self.assertEqual(len(response.json()), 7)
+
+    def test_walks_all_pages_forward_and_back(self):
+        url = '/api/assignments/?page_size=3'
+        seen, pages = [], []
+        while url:
+            data = self.client.get(url).json()
+            pages.append(data)
+            seen.extend(row['id'] for row in data['results'])
+            url = data['next']
+
+        expected = list(
+            Assignment.objects.order_by('order', 'id').values_list('id', flat=True)
+        )
+        self.assertEqual(seen, expected)
+        self.assertEqual(len(pages), 3)
+        self.assertIsNone(pages[0]['previous'])
+
+        previous = self.client.get(pages[-1]['previous']).json()
+        self.assertEqual(previous['results'], pages[1]['results'])
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get('/api/assignments/?cursor=no-valido')
+        self.assertEqual(response.status_code, 404)
+
+    def test_ordering_with_cursor_pagination_returns_400(self):
+        response = self.client.get('/api/assignments/?page_size=3&ordering=-created_at')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json())
+        self.assertEqual(self.client.get('/api/assignments/?ordering=-created_at').status_code, 200)
+
+
+class ExportCSVTests(AssignmentTestMixin, TestCase):
+
+    def test_export_streams_rows_with_choice_labels(self):
+        self.create_assignment(group='G1', assignment_type=Assignment.AssignmentType.LAB)
+        response = self.client.get('/api/assignments/export_csv/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+
+        content = b''.join(response.streaming_content).decode('utf-8')
+        lines = content.lstrip('\ufeff').splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            lines[1],
+            'Ana Pérez,ana@uci.cu,Instructor,Álgebra,ALG,Facultad 1,'
+            'Matemática,Laboratorio,4,G1,2025-2026,1'
+        )
+
+
+class ProfessorLoadSummaryTests(AssignmentTestMixin, TestCase):
+
+    def get_summary(self, semester=1):
+        return ProfessorLoadSummary.objects.get(
+            professor=self.professor, academic_year='2025-2026', semester=semester
+        )
+
+    def test_summary_follows_assignment_changes(self):
+        lecture = self.create_assignment(group='G1')
+        self.create_assignment(
+            group='G1', assignment_type=Assignment.AssignmentType.LAB, hours_per_week=2
+        )
+        summary = self.get_summary()
+        self.assertEqual(summary.total_hours, 6)
+        self.assertEqual(summary.lecture_hours, 4)
+        self.assertEqual(summary.lab_hours, 2)
+        self.assertEqual(summary.subjects_count, 1)
+        self.assertEqual(summary.faculties_count, 1)
+
+        # Mover la conferencia al segundo semestre actualiza ambas claves
+        lecture.semester = 2
+        lecture.save()
+        self.assertEqual(self.get_summary(1).total_hours, 2)
+        self.assertEqual(self.get_summary(2).total_hours, 4)
+
+        lecture.delete()
+        self.assertFalse(ProfessorLoadSummary.objects.filter(semester=2).exists())
+
+    def test_rebuild_matches_incremental_summary(self):
+        self.create_assignment(group='G1')
+        self.create_assignment(group='G2', is_active=False)
+        expected = self.get_summary()
+
+        ProfessorLoadSummary.objects.all().delete()
+        self.assertEqual(ProfessorLoadSummary.rebuild(), 1)
+        rebuilt = self.get_summary()
+        self.assertEqual(rebuilt.total_hours, expected.total_hours)
+        self.assertEqual(rebuilt.assignments_count, 1)
+
+
+class AssignmentStatisticsTests(AssignmentTestMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        other_faculty = Faculty.objects.create(name='Facultad 2', code='F2')
+        for i, hours in enumerate([2, 4, 6, 8]):
+            self.create_assignment(group=f'G{i}', hours_per_week=hours)
+        self.create_assignment(group='G9', hours_per_week=10, faculty=other_faculty)
+
+    def test_grouped_totals_and_percentiles(self):
+        response = self.client.get('/api/assignments/statistics/?group_by=faculty,semester')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+
+        self.assertEqual(data['overall']['count'], 5)
+        self.assertEqual(data['overall']['total_hours'], 30)
+        self.assertEqual(data['overall']['p50_hours'], 6)
+
+        first = data['groups'][0]
+        self.assertEqual(first['faculty__name'], 'Facultad 1')
+        self.assertEqual(first['total_hours'], 20)
+        self.assertEqual(first['avg_hours'], 5)
+        self.assertEqual(first['p50_hours'], 5)
+        self.assertEqual(first['p95_hours'], 7.7)
+        self.assertEqual(data['groups'][1]['count'], 1)
+
+    def test_unknown_dimension_is_rejected(self):
+        response = self.client.get('/api/assignments/statistics/?group_by=faculty,color')
+        self.assertEqual(response.status_code, 400)
+
+    def test_jefe_only_sees_own_disciplines(self):
+        jefe = User.objects.create_user(
+            username='jefe', email='jefe@uci.cu',
+            password='123456', role=User.Role.JEFE_DISCIPLINA
+        )
+        self.client.force_authenticate(jefe)
+        data = self.client.get('/api/assignments/statistics/').json()
+        self.assertEqual(data['overall']['count'], 0)
+        self.assertIsNone(data['overall']['p50_hours'])
+
+
+class BulkAssignmentTests(AssignmentTestMixin, TestCase):
+
+    def payload(self, group, **kwargs):
+        data = {
+            'professor': self.professor.id, 'subject': self.subject.id,
+            'faculty': self.faculty.id, 'academic_year': '2025-2026',
+            'semester': 1, 'hours_per_week': 4, 'group': group,
+        }
+        data.update(kwargs)
+        return data
+
+    def test_create_update_delete_in_one_request(self):
+        to_update = self.create_assignment(group='A')
+        to_delete = self.create_assignment(group='B')
+
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.post('/api/assignments/bulk/', {
+                'create': [self.payload(f'N{i}') for i in range(3)],
+                'update': [{'id': to_update.id, 'hours_per_week': 6}],
+                'delete': [to_delete.id],
+            }, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(len(response.json()['created']), 3)
+
+        to_update.refresh_from_db()
+        self.assertEqual(to_update.hours_per_week, 6)
+        self.assertFalse(Assignment.objects.filter(pk=to_delete.pk).exists())
+        self.assertEqual(AssignmentHistory.objects.count(), 4)
+        self.assertEqual(
+            AssignmentHistory.objects.get(assignment=to_update).changes,
+            {'hours_per_week': {'old': 4, 'new': 6}}
+        )
+        summary = ProfessorLoadSummary.objects.get(professor=self.professor)
+        self.assertEqual(summary.total_hours, 18)
+
+        # El número de consultas no depende del tamaño del lote (sin límite
+        # de horas: 30 asignaciones del mismo profesor serían una sobrecarga)
+        with override_settings(ASSIGNMENT_HOUR_LIMITS={}), CaptureQueriesContext(connection) as large:
+            response = self.client.post('/api/assignments/bulk/', {
+                'create': [self.payload(f'M{i}') for i in range(30)],
+            }, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertLessEqual(len(large.captured_queries), len(small.captured_queries))
+
+    def test_duplicates_are_rejected_without_changes(self):
+        existing = self.create_assignment(group='A')
+        response = self.client.post('/api/assignments/bulk/', {
+            'create': [self.payload('A'), self.payload('C'), self.payload('C')],
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.json()['non_field_errors']), 2)
+        self.assertEqual(list(Assignment.objects.values_list('pk', flat=True)), [existing.pk])
+
+    def test_jefe_cannot_touch_other_disciplines(self):
+        other = self.create_assignment(group='A')
+        jefe = User.objects.create_user(
+            username='jefe', email='jefe@uci.cu',
+            password='123456', role=User.Role.JEFE_DISCIPLINA
+        )
+        self.client.force_authenticate(jefe)
+        response = self.client.post('/api/assignments/bulk/', {'delete': [other.id]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(Assignment.objects.filter(pk=other.pk).exists())
+
+
+class ConflictValidationTests(AssignmentTestMixin, TestCase):
+
+    def payload(self, group, **kwargs):
+        return {
+            'professor': self.professor.id, 'subject': self.subject.id,
+            'faculty': self.faculty.id, 'academic_year': '2025-2026',
+            'semester': 1, 'hours_per_week': 4, 'group': group, **kwargs,
+        }
+
+    def validate(self, **data):
+        response = self.client.post('/api/assignments/validate/', data, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_overload_depends_on_contract_and_category(self):
+        for group in 'ABCD':
+            self.create_assignment(group=group)
+        data = self.validate(create=[self.payload('E')])
+        self.assertTrue(data['valid'])
+
+        data = self.validate(create=[self.payload('E'), self.payload('F')])
+        self.assertFalse(data['valid'])
+        [issue] = data['issues']
+        self.assertEqual((issue['code'], issue['hours'], issue['limit']), ('professor_overload', 24, 20))
+        self.assertEqual(issue['rows'][:2], [{'create': 0}, {'create': 1}])
+
+        # Tiempo parcial: límite de 12 h aunque la categoría permita 20
+        Professor.objects.filter(pk=self.professor.pk).update(contract_type=Professor.ContractType.PART_TIME)
+        data = self.validate(update=[{'id': Assignment.objects.get(group='A').id, 'hours_per_week': 2}])
+        self.assertEqual((data['issues'][0]['hours'], data['issues'][0]['limit']), (14, 12))
+
+    def test_duplicate_coverage_across_faculties_blocks_bulk(self):
+        self.create_assignment(group='A')
+        other_faculty = Faculty.objects.create(name='Facultad 2', code='F2')
+        other = Professor.objects.create(
+            first_name='Luis', last_name='Gómez', email='luis@uci.cu', identification='00000000002'
+        )
+        create = [self.payload('A', faculty=other_faculty.id, professor=other.id)]
+
+        data = self.validate(create=create)
+        self.assertEqual([issue['code'] for issue in data['issues']], ['duplicate_coverage', 'subject_hours'])
+        response = self.client.post('/api/assignments/bulk/', {'create': create}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.json()['conflicts']), 1)
+        self.assertEqual(Assignment.objects.count(), 1)
+
+        # Otro tipo de actividad en el mismo grupo no es una duplicidad, solo supera las horas
+        create[0]['assignment_type'] = Assignment.AssignmentType.PRACTICAL
+        response = self.client.post('/api/assignments/bulk/', {'create': create}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(len(response.json()['warnings']), 1)
+
+    def test_query_count_does_not_depend_on_batch_size(self):
+        with CaptureQueriesContext(connection) as small:
+            self.validate(create=[self.payload('A')])
+        professors = Professor.objects.bulk_create([
+            Professor(first_name='P', last_name=str(i), email=f'p{i}@uci.cu', identification=f'1{i:010d}')
+            for i in range(100)
+        ])
+        with CaptureQueriesContext(connection) as large:
+            data = self.validate(create=[
+                self.payload(f'G{i}', professor=professor.id) for i, professor in enumerate(professors)
+            ])
+        self.assertTrue(data['valid'])
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+
+
+class AssignmentHistoryDiffTests(AssignmentTestMixin, TestCase):
+
+    def test_update_records_only_changed_fields_with_names(self):
+        assignment = self.create_assignment(group='A')
+        other = Professor.objects.create(
+            first_name='Luis', last_name='Gómez',
+            email='luis@uci.cu', identification='00000000002'
+        )
+        response = self.client.patch(
+            f'/api/assignments/{assignment.id}/',
+            {'professor': other.id, 'hours_per_week': 4, 'group': 'B'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+
+        history = AssignmentHistory.objects.get(
+            assignment=assignment, action=AssignmentHistory.ActionType.UPDATE
+        )
+        self.assertEqual(history.changes, {
+            'professor': {'old': self.professor.id, 'new': other.id},
+            'professor_name': {'old': 'Ana Pérez', 'new': 'Luis Gómez'},
+            'group': {'old': 'A', 'new': 'B'},
+        })
+        # Los resúmenes de ambos profesores se recalculan
+        self.assertFalse(ProfessorLoadSummary.objects.filter(professor=self.professor).exists())
+        self.assertTrue(ProfessorLoadSummary.objects.filter(professor=other).exists())
+
+    def test_update_without_changes_skips_history(self):
+        assignment = self.create_assignment(group='A')
+        response = self.client.patch(
+            f'/api/assignments/{assignment.id}/', {'group': 'A'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertFalse(AssignmentHistory.objects.filter(
+            assignment=assignment, action=AssignmentHistory.ActionType.UPDATE
+        ).exists())
+
+    def test_loaded_values_follow_update_fields_and_refresh(self):
+        assignment = Assignment.objects.get(pk=self.create_assignment(group='A').pk)
+        assignment.group = 'B'
+        assignment.hours_per_week = 6
+        assignment.save(update_fields=['hours_per_week'])
+        self.assertEqual(assignment.saved_changes, {'hours_per_week': (4, 6)})
+        # El grupo no se guardó: sigue pendiente
+        self.assertEqual(assignment.get_changes(), {'group': ('A', 'B')})
+
+        Assignment.objects.filter(pk=assignment.pk).update(group='C', semester=2)
+        assignment.refresh_from_db(fields=['semester'])
+        self.assertEqual(assignment.get_loaded_value('semester'), 2)
+        self.assertEqual(assignment.get_changes(), {'group': ('A', 'B')})
+        assignment.refresh_from_db()
+        self.assertEqual(assignment.get_changes(), {})
+        self.assertEqual(assignment.get_loaded_value('group'), 'C')
+
+
+class ReorderTests(AssignmentTestMixin, TestCase):
+
+    def test_compute_ranks(self):
+        # Mover el último al principio: solo cambia esa fila
+        self.assertEqual(compute_ranks([4096, 1024, 2048, 3072]), [511, 1024, 2048, 3072])
+        self.assertEqual(compute_ranks([5, 3, 4]), [1, 3, 4])
+        # Sin hueco disponible se renumera toda la lista
+        self.assertEqual(compute_ranks([5, 0, 1]), [RANK_GAP, 2 * RANK_GAP, 3 * RANK_GAP])
+        self.assertEqual(compute_ranks([0, 0, 0]), [RANK_GAP, 2 * RANK_GAP, 3 * RANK_GAP])
+
+    def test_move_updates_one_row_and_logs_one_event(self):
+        items = [self.create_assignment(group=f'G{i}', order=(i + 1) * RANK_GAP) for i in range(5)]
+        ids = [item.id for item in items]
+        new_order = ids[:1] + ids[4:] + ids[1:4]
+
+        response = self.client.post('/api/assignments/reorder/', {'ids': new_order}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(list(response.json()['updated']), [str(ids[4])])
+
+        self.assertEqual(
+            list(Assignment.objects.order_by('order').values_list('id', flat=True)), new_order
+        )
+        history = AssignmentHistory.objects.get(action=AssignmentHistory.ActionType.REORDER)
+        self.assertEqual(history.assignment_id, ids[4])
+        self.assertEqual(history.changes['order'][str(ids[4])]['old'], 5 * RANK_GAP)
+
+    def test_unknown_or_repeated_ids_are_rejected(self):
+        item = self.create_assignment(group='A')
+        response = self.client.post('/api/assignments/reorder/', {'ids': [item.id, item.id]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/assignments/reorder/', {'ids': [item.id, 999]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(AssignmentHistory.objects.filter(action=AssignmentHistory.ActionType.REORDER).exists())
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=True)
+class ResponseCacheTests(AssignmentTestMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        for alias in ('default', 'responses'):
+            caches[alias].clear()
+        self.assignment = self.create_assignment(group='A')
+
+    def test_list_is_served_from_cache_until_rows_change(self):
+        self.assertEqual(self.client.get('/api/assignments/').status_code, 200)
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/assignments/')
+        self.assertEqual(len(response.json()), 1)
+
+        # Otra consulta (otros parámetros) tiene su propia entrada
+        self.assertEqual(len(self.client.get('/api/assignments/?semester=2').json()), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_assignment(group='B')
+        self.assertEqual(len(self.client.get('/api/assignments/').json()), 2)
+
+    def test_bulk_operations_invalidate_cache(self):
+        url = f'/api/assignments/{self.assignment.id}/'
+        self.assertEqual(self.client.get(url).json()['hours_per_week'], 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/assignments/bulk/', {
+                'update': [{'id': self.assignment.id, 'hours_per_week': 6}],
+            }, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.client.get(url).json()['hours_per_week'], 6)
@@ -1,11 +1,12 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
-from .views import AssignmentViewSet, AssignmentHistoryViewSet
+from .views import AssignmentViewSet, AssignmentHistoryViewSet, ProfessorLoadSummaryViewSet
 
 router = DefaultRouter()
 router.register(r'assignments', AssignmentViewSet, basename='assignment')
 router.register(r'history', AssignmentHistoryViewSet, basename='assignment-history')
+router.register(r'load-summaries', ProfessorLoadSummaryViewSet, basename='load-summary')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -1,20 +1,35 @@
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
-from django.http import HttpResponse
+from django.db import IntegrityError
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
-import csv
 
-from .models import Assignment, AssignmentHistory
+from .models import Assignment, AssignmentHistory, ProfessorLoadSummary
 from .serializers import (
     AssignmentSerializer, AssignmentCreateSerializer,
     AssignmentUpdateSerializer, AssignmentListSerializer,
     AssignmentDetailSerializer, AssignmentHistorySerializer,
-    AssignmentExportSerializer
+    AssignmentExportSerializer, ProfessorLoadSummarySerializer,
+    AssignmentBulkSerializer, AssignmentReorderSerializer
 )
+from academic.models import Discipline, Faculty, Subject
+from professors.models import Professor
+from users.models import User
 from users.permissions import IsNotBlocked, CanModifyAssignments, CanDownloadReports
+from users.scope import get_user_scope
+from core.exports import iter_values, streaming_csv_response
+from core.conditional import choices_response
+from core.response_cache import CachedResponseMixin
+from search.filters import FullTextSearchFilter
+from .statistics import GROUP_FIELDS, build_statistics, parse_group_by
+from .bulk import BulkAssignmentOperation
+from .exports import ASSIGNMENT_TYPE_LABELS, EXPORT_FIELDS, EXPORT_HEADER, export_rows
+from .history import build_history_changes
+from .ordering import reorder_assignments
 
 
 @extend_schema_view(
@@ -25,13 +40,13 @@ from users.permissions import IsNotBlocked, CanModifyAssignments, CanDownloadRep
     partial_update=extend_schema(summary="Actualizar asignación parcialmente", tags=['Assignments']),
     destroy=extend_schema(summary="Eliminar asignación", description="Elimina una asignación.", tags=['Assignments']),
 )
-class AssignmentViewSet(viewsets.ModelViewSet):
+class AssignmentViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestión de Asignaciones de profesores.
     """
     queryset = Assignment.objects.all()
     permission_classes = [IsAuthenticated, IsNotBlocked]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter, FullTextSearchFilter]
     filterset_fields = [
         'is_active', 'faculty', 'subject', 'professor', 
         'academic_year', 'semester', 'assignment_type'
@@ -42,6 +57,8 @@ class AssignmentViewSet(viewsets.ModelViewSet):
     ]
     ordering_fields = ['order', 'faculty', 'subject', 'professor', 'created_at']
     ordering = ['order', 'faculty', 'subject']
+    cursor_ordering = ['order', 'id']
+    cache_models = (Assignment, Professor, Subject, Discipline, Faculty, User)
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -67,7 +84,7 @@ class AssignmentViewSet(viewsets.ModelViewSet):
         user = self.request.user
         # Filtrar por disciplina del jefe
         if user.is_jefe_disciplina:
-            queryset = queryset.filter(subject__discipline__head=user)
+            queryset = queryset.filter(subject_id__in=get_user_scope(user).subject_ids)
         
         # Filtros adicionales por query params
         discipline = self.request.query_params.get('discipline', None)
@@ -87,28 +104,94 @@ class AssignmentViewSet(viewsets.ModelViewSet):
         )
     
     def perform_update(self, serializer):
-        old_data = AssignmentSerializer(self.get_object()).data
+        # La instancia ya viene de get_object(); el modelo registra qué campos cambiaron
         assignment = serializer.save()
-        new_data = AssignmentSerializer(assignment).data
-        
-        # Calcular cambios
-        changes = {}
-        for key in new_data:
-            if old_data.get(key) != new_data.get(key):
-                changes[key] = {
-                    'old': old_data.get(key),
-                    'new': new_data.get(key)
-                }
         
         # Registrar en historial
-        if changes:
+        if assignment.saved_changes:
             AssignmentHistory.objects.create(
                 assignment=assignment,
                 action=AssignmentHistory.ActionType.UPDATE,
-                changes=changes,
+                changes=build_history_changes([assignment.saved_changes])[0],
                 performed_by=self.request.user
             )
     
+    @extend_schema(
+        summary="Operación masiva",
+        description=(
+            "Crea, modifica y elimina varias asignaciones en una sola transacción. "
+            "Todo el lote se valida en conjunto (incluida la unicidad, la sobrecarga de los "
+            "profesores y las coberturas duplicadas) antes de aplicarse; los avisos se "
+            "devuelven en `warnings`."
+        ),
+        tags=['Assignments'],
+        request=AssignmentBulkSerializer
+    )
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated, IsNotBlocked, CanModifyAssignments])
+    def bulk(self, request):
+        """Aplicar altas, modificaciones y bajas masivas."""
+        serializer = AssignmentBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        operation = BulkAssignmentOperation(self.get_queryset(), request.user, serializer.validated_data)
+        operation.validate()
+        try:
+            result = operation.apply()
+        except IntegrityError:
+            return Response(
+                {'error': 'El lote entra en conflicto con cambios concurrentes. Intente de nuevo.'},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(result)
+    
+    @extend_schema(
+        summary="Validar operación masiva",
+        description=(
+            "Ejecuta sin guardar la misma validación que la operación masiva: datos, unicidad, "
+            "sobrecarga horaria de los profesores (según contrato y categoría), coberturas "
+            "duplicadas de un grupo y horas por encima de las de la asignatura (aviso). "
+            "Admite una facultad completa en una sola llamada."
+        ),
+        tags=['Assignments'],
+        request=AssignmentBulkSerializer,
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated, IsNotBlocked, CanModifyAssignments])
+    def validate(self, request):
+        """Validar un lote de asignaciones sin aplicarlo."""
+        serializer = AssignmentBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        operation = BulkAssignmentOperation(self.get_queryset(), request.user, serializer.validated_data)
+        try:
+            operation.validate()
+        except ValidationError as error:
+            return Response({'valid': False, 'errors': error.detail, 'issues': operation.issues})
+        return Response({'valid': True, 'errors': {}, 'issues': operation.issues})
+    
+    @extend_schema(
+        summary="Reordenar asignaciones",
+        description=(
+            "Recibe una lista de IDs en el orden deseado y actualiza el campo order. "
+            "Los rangos son dispersos: mover una asignación normalmente modifica una sola fila."
+        ),
+        tags=['Assignments'],
+        request=AssignmentReorderSerializer
+    )
+    @action(detail=False, methods=['post'], permission_classes=[IsAuthenticated, IsNotBlocked, CanModifyAssignments])
+    def reorder(self, request):
+        """Reordenar asignaciones."""
+        serializer = AssignmentReorderSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        ranks = reorder_assignments(self.get_queryset(), serializer.validated_data['ids'], request.user)
+        if ranks is None:
+            return Response(
+                {'error': 'Alguna asignación no existe o no tiene acceso a ella.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response({'updated': ranks})
+    
     @extend_schema(
         summary="Exportar asignaciones CSV",
         description="Descarga un archivo CSV con todas las asignaciones.",
@@ -119,36 +202,7 @@ class AssignmentViewSet(viewsets.ModelViewSet):
     def export_csv(self, request):
         """Exportar asignaciones a CSV."""
         queryset = self.filter_queryset(self.get_queryset())
-        
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="asignaciones.csv"'
-        response.write('\ufeff')  # BOM para Excel
-        
-        writer = csv.writer(response)
-        writer.writerow([
-            'Profesor', 'Email Profesor', 'Categoría', 
-            'Asignatura', 'Código Asignatura', 'Facultad', 
-            'Disciplina', 'Tipo de Actividad', 'Horas/Semana',
-            'Grupo', 'Año Académico', 'Semestre'
-        ])
-        
-        for assignment in queryset:
-            writer.writerow([
-                assignment.professor.full_name,
-                assignment.professor.email,
-                assignment.professor.get_category_display(),
-                assignment.subject.name,
-                assignment.subject.code,
-                assignment.faculty.name,
-                assignment.subject.discipline.name,
-                assignment.get_assignment_type_display(),
-                assignment.hours_per_week,
-                assignment.group or '',
-                assignment.academic_year,
-                assignment.semester
-            ])
-        
-        return response
+        return streaming_csv_response('asignaciones.csv', EXPORT_HEADER, export_rows(queryset))
     
     @extend_schema(
         summary="Exportar por facultad CSV",
@@ -169,29 +223,24 @@ class AssignmentViewSet(viewsets.ModelViewSet):
         
         queryset = self.get_queryset().filter(faculty_id=faculty_id)
         
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="asignaciones_facultad_{faculty_id}.csv"'
-        response.write('\ufeff')
+        rows = (
+            [
+                f'{row.professor__first_name} {row.professor__last_name}',
+                row.professor__email,
+                row.subject__name,
+                row.subject__discipline__name,
+                ASSIGNMENT_TYPE_LABELS.get(row.assignment_type, row.assignment_type),
+                row.hours_per_week,
+                row.group or '',
+                row.semester
+            ]
+            for row in iter_values(queryset, EXPORT_FIELDS)
+        )
         
-        writer = csv.writer(response)
-        writer.writerow([
+        return streaming_csv_response(f'asignaciones_facultad_{faculty_id}.csv', [
             'Profesor', 'Email', 'Asignatura', 'Disciplina',
             'Tipo', 'Horas/Semana', 'Grupo', 'Semestre'
-        ])
-        
-        for assignment in queryset:
-            writer.writerow([
-                assignment.professor.full_name,
-                assignment.professor.email,
-                assignment.subject.name,
-                assignment.subject.discipline.name,
-                assignment.get_assignment_type_display(),
-                assignment.hours_per_week,
-                assignment.group or '',
-                assignment.semester
-            ])
-        
-        return response
+        ], rows)
     
     @extend_schema(
         summary="Exportar por disciplina CSV",
@@ -212,29 +261,24 @@ class AssignmentViewSet(viewsets.ModelViewSet):
         
         queryset = self.get_queryset().filter(subject__discipline_id=discipline_id)
         
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="asignaciones_disciplina_{discipline_id}.csv"'
-        response.write('\ufeff')
+        rows = (
+            [
+                f'{row.professor__first_name} {row.professor__last_name}',
+                row.professor__email,
+                row.subject__name,
+                row.faculty__name,
+                ASSIGNMENT_TYPE_LABELS.get(row.assignment_type, row.assignment_type),
+                row.hours_per_week,
+                row.group or '',
+                row.semester
+            ]
+            for row in iter_values(queryset, EXPORT_FIELDS)
+        )
         
-        writer = csv.writer(response)
-        writer.writerow([
+        return streaming_csv_response(f'asignaciones_disciplina_{discipline_id}.csv', [
             'Profesor', 'Email', 'Asignatura', 'Facultad',
             'Tipo', 'Horas/Semana', 'Grupo', 'Semestre'
-        ])
-        
-        for assignment in queryset:
-            writer.writerow([
-                assignment.professor.full_name,
-                assignment.professor.email,
-                assignment.subject.name,
-                assignment.faculty.name,
-                assignment.get_assignment_type_display(),
-                assignment.hours_per_week,
-                assignment.group or '',
-                assignment.semester
-            ])
-        
-        return response
+        ], rows)
     
     @extend_schema(
         summary="Historial de asignación",
@@ -250,6 +294,34 @@ class AssignmentViewSet(viewsets.ModelViewSet):
         serializer = AssignmentHistorySerializer(history, many=True)
         return Response(serializer.data)
     
+    @extend_schema(
+        summary="Estadísticas de carga",
+        description=(
+            "Obtiene totales, promedios, percentiles (p50/p95) y conteos de horas "
+            "agrupados por cualquier combinación de dimensiones. Respeta los mismos "
+            "filtros y el alcance del jefe de disciplina que el listado."
+        ),
+        tags=['Assignments'],
+        parameters=[OpenApiParameter(
+            name='group_by',
+            description=f"Dimensiones separadas por coma: {', '.join(GROUP_FIELDS)}",
+            required=False, type=str
+        )]
+    )
+    @action(detail=False, methods=['get'])
+    def statistics(self, request):
+        """Obtener estadísticas agregadas de carga docente."""
+        try:
+            group_by = parse_group_by(request.query_params.get('group_by'))
+        except ValueError as error:
+            return Response(
+                {'error': f'Dimensiones de agrupación no válidas: {error}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(build_statistics(queryset, group_by))
+    
     @extend_schema(
         summary="Tipos de asignación",
         description="Obtiene la lista de tipos de asignación disponibles (Conferencia, Clase Práctica, etc.).",
@@ -258,11 +330,7 @@ class AssignmentViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def assignment_types(self, request):
         """Obtener tipos de asignación."""
-        types = [
-            {'value': choice[0], 'label': choice[1]}
-            for choice in Assignment.AssignmentType.choices
-        ]
-        return Response(types)
+        return choices_response(request, Assignment.AssignmentType.choices)
 
 
 @extend_schema_view(
@@ -287,3 +355,42 @@ class AssignmentHistoryViewSet(viewsets.ReadOnlyModelViewSet):
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['assignment', 'action', 'performed_by']
     ordering = ['-created_at']
+    cursor_ordering = ['-created_at', '-id']
+
+
+@extend_schema_view(
+    list=extend_schema(
+        summary="Listar resúmenes de carga",
+        description="Obtiene las horas totales y por tipo de actividad de cada profesor por año académico y semestre.",
+        tags=['Assignments']
+    ),
+    retrieve=extend_schema(
+        summary="Detalle de resumen de carga",
+        description="Obtiene el resumen de carga de un profesor en un semestre.",
+        tags=['Assignments']
+    )
+)
+class ProfessorLoadSummaryViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    ViewSet de solo lectura para los resúmenes materializados de carga docente.
+    """
+    queryset = ProfessorLoadSummary.objects.all()
+    serializer_class = ProfessorLoadSummarySerializer
+    permission_classes = [IsAuthenticated, IsNotBlocked]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_fields = ['professor', 'academic_year', 'semester']
+    ordering_fields = ['total_hours', 'academic_year', 'semester']
+    ordering = ['academic_year', 'semester', 'professor']
+    cursor_ordering = ['id']
+    
+    def get_queryset(self):
+        queryset = ProfessorLoadSummary.objects.select_related('professor')
+        
+        user = self.request.user
+        # Los jefes solo ven profesores con carga en sus disciplinas
+        if user.is_jefe_disciplina:
+            queryset = queryset.filter(professor_id__in=Assignment.objects.filter(
+                subject_id__in=get_user_scope(user).subject_ids
+            ).values('professor_id'))
+        
+        return queryset
@@ -72,6 +72,15 @@ class Comment(models.Model):
         verbose_name = 'Comentario'
         verbose_name_plural = 'Comentarios'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='comment_created_idx'),
+            # Bandeja de no leídos del director
+            models.Index(
+                fields=['-created_at'],
+                name='comment_unread_idx',
+                condition=models.Q(is_read=False)
+            ),
+        ]
     
     def __str__(self):
         return f"{self.subject} - {self.author}"
@@ -84,17 +84,28 @@ class CommentListSerializer(serializers.ModelSerializer):
     author_role = serializers.CharField(source='author.get_role_display', read_only=True)
     comment_type_display = serializers.CharField(source='get_comment_type_display', read_only=True)
     replies_count = serializers.SerializerMethodField()
+    last_reply_at = serializers.SerializerMethodField()
     
     class Meta:
         model = Comment
         fields = [
             'id', 'author_name', 'author_role', 'comment_type', 
             'comment_type_display', 'subject', 'message', 'is_read', 
-            'replies_count', 'created_at'
+            'replies_count', 'last_reply_at', 'created_at'
         ]
     
     def get_author_name(self, obj):
         return obj.author.get_full_name()
     
     def get_replies_count(self, obj):
+        # Anotado en CommentViewSet.get_queryset; consulta solo si falta
+        if hasattr(obj, 'replies_count'):
+            return obj.replies_count
         return obj.replies.count()
+    
+    def get_last_reply_at(self, obj):
+        if hasattr(obj, 'last_reply_at'):
+            value = obj.last_reply_at
+        else:
+            value = max((reply.created_at for reply in obj.replies.all()), default=None)
+        return serializers.DateTimeField().to_representation(value) if value else None
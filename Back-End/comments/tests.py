@@ -1,3 +1,94 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from users.models import User
+from .models import Comment
+
+
+class CommentStatisticsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.director = User.objects.create_user(
+            username='director', email='director@uci.cu', password='123456',
+            first_name='Dora', last_name='Díaz', role=User.Role.DIRECTOR
+        )
+        cls.jefe = User.objects.create_user(
+            username='jefe', email='jefe@uci.cu', password='123456',
+            first_name='Juan', last_name='Gómez', role=User.Role.JEFE_DISCIPLINA
+        )
+        for i in range(3):
+            Comment.objects.create(
+                author=cls.jefe, subject=f'Cambio {i}', message='...',
+                comment_type=Comment.CommentType.MODIFICATION, is_read=i == 0
+            )
+        Comment.objects.create(
+            author=cls.director, subject='Aviso', message='...',
+            comment_type=Comment.CommentType.GENERAL
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.director)
+
+    def test_statistics_counts(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/comments/statistics/')
+        self.assertEqual(response.status_code, 200)
+        # Totales, por autor y por día: una consulta cada uno
+        self.assertEqual(len(context.captured_queries), 3)
+
+        data = response.json()
+        self.assertEqual(data['total'], 4)
+        self.assertEqual(data['unread'], 3)
+        self.assertEqual(data['read'], 1)
+        self.assertEqual(data['by_type']['Modificación'], 3)
+        self.assertEqual(data['by_type']['General'], 1)
+        self.assertEqual(data['by_author'][0]['author_name'], 'Juan Gómez')
+        self.assertEqual(data['by_author'][0]['unread'], 2)
+        self.assertEqual(sum(day['total'] for day in data['by_day']), 4)
+
+
+class CommentListQueryCountTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.director = User.objects.create_user(
+            username='director', email='director@uci.cu',
+            password='123456', role=User.Role.DIRECTOR
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.director)
+
+    def create_comments(self, count):
+        for i in range(count):
+            comment = Comment.objects.create(
+                author=self.director, subject=f'Asunto {i}', message='...'
+            )
+            comment.replies.create(author=self.director, message='Respuesta')
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response.json()
+
+    def test_list_and_unread_use_annotated_reply_counts(self):
+        self.create_comments(2)
+        list_small, _ = self.count_queries('/api/comments/')
+        unread_small, _ = self.count_queries('/api/comments/unread/')
+
+        self.create_comments(10)
+        list_large, data = self.count_queries('/api/comments/')
+        unread_large, unread = self.count_queries('/api/comments/unread/')
+
+        self.assertEqual(list_small, list_large)
+        self.assertEqual(unread_small, unread_large)
+        self.assertEqual(unread_large, 1)
+        self.assertEqual(unread['count'], 12)
+        self.assertEqual(data[0]['replies_count'], 1)
+        self.assertIsNotNone(data[0]['last_reply_at'])
@@ -4,7 +4,10 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from datetime import timedelta
+from django.db.models import Count, Max, Q
+from django.db.models.functions import TruncDate
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 
 from .models import Comment, CommentReply
 from .serializers import (
@@ -12,6 +15,7 @@ from .serializers import (
     CommentReplySerializer
 )
 from users.permissions import IsNotBlocked, CanViewComments, CanModifyAssignments
+from search.filters import FullTextSearchFilter
 
 
 @extend_schema_view(
@@ -52,11 +56,12 @@ class CommentViewSet(viewsets.ModelViewSet):
     """
     queryset = Comment.objects.all()
     permission_classes = [IsAuthenticated, IsNotBlocked]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter, FullTextSearchFilter]
     filterset_fields = ['is_read', 'comment_type', 'author']
     search_fields = ['subject', 'message']
     ordering_fields = ['created_at', 'is_read']
     ordering = ['-created_at']
+    cursor_ordering = ['-created_at', '-id']
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -75,9 +80,17 @@ class CommentViewSet(viewsets.ModelViewSet):
         return super().get_permissions()
     
     def get_queryset(self):
-        queryset = Comment.objects.select_related(
-            'author', 'assignment', 'read_by'
-        ).prefetch_related('replies').all()
+        queryset = Comment.objects.select_related('author', 'read_by').annotate(
+            replies_count=Count('replies'),
+            last_reply_at=Max('replies__created_at')
+        )
+        
+        # El listado solo usa las anotaciones; el detalle serializa respuestas y asignación
+        if self.action not in ['list', 'unread']:
+            queryset = queryset.select_related(
+                'assignment', 'assignment__professor',
+                'assignment__subject', 'assignment__faculty'
+            ).prefetch_related('replies', 'replies__author')
         
         return queryset
     
@@ -143,17 +156,19 @@ class CommentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        queryset = self.get_queryset().filter(is_read=False)
+        queryset = self.get_queryset().filter(is_read=False).order_by('-created_at')
         serializer = CommentListSerializer(queryset, many=True)
+        data = serializer.data
         return Response({
-            'count': queryset.count(),
-            'results': serializer.data
+            'count': len(data),
+            'results': data
         })
     
     @extend_schema(
         summary="Estadísticas de comentarios",
-        description="Obtiene estadísticas generales de comentarios: total, leídos, no leídos y por tipo.",
-        tags=['Comments']
+        description="Obtiene estadísticas generales de comentarios: total, leídos, no leídos, por tipo, por autor y por día.",
+        tags=['Comments'],
+        parameters=[OpenApiParameter(name='days', description='Días incluidos en el desglose diario (por defecto 30)', required=False, type=int)]
     )
     @action(detail=False, methods=['get'])
     def statistics(self, request):
@@ -164,20 +179,62 @@ class CommentViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        queryset = self.get_queryset()
-        total = queryset.count()
-        unread = queryset.filter(is_read=False).count()
+        # Sin select_related/prefetch: solo se necesitan conteos
+        queryset = self.filter_queryset(Comment.objects.all()).order_by()
+        
+        # Total, no leídos y por tipo en una sola consulta de agregación condicional
+        type_counts = {
+            f'type_{value}': Count('id', filter=Q(comment_type=value))
+            for value, _ in Comment.CommentType.choices
+        }
+        counts = queryset.aggregate(
+            total=Count('id'),
+            unread=Count('id', filter=Q(is_read=False)),
+            **type_counts
+        )
+        by_type = {
+            label: counts[f'type_{value}']
+            for value, label in Comment.CommentType.choices
+        }
+        
+        by_author = [
+            {
+                'author': row['author'],
+                'author_name': f"{row['author__first_name']} {row['author__last_name']}".strip(),
+                'total': row['total'],
+                'unread': row['unread'],
+            }
+            for row in queryset.values(
+                'author', 'author__first_name', 'author__last_name'
+            ).annotate(
+                total=Count('id'),
+                unread=Count('id', filter=Q(is_read=False))
+            ).order_by('-total', 'author')
+        ]
         
-        # Por tipo
-        by_type = {}
-        for choice in Comment.CommentType.choices:
-            by_type[choice[1]] = queryset.filter(comment_type=choice[0]).count()
+        # Desglose diario limitado a los últimos N días (por defecto 30)
+        try:
+            days = max(int(request.query_params.get('days', 30)), 1)
+        except ValueError:
+            days = 30
+        since = timezone.now() - timedelta(days=days)
+        by_day = [
+            {'date': row['date'], 'total': row['total'], 'unread': row['unread']}
+            for row in queryset.filter(created_at__gte=since).annotate(
+                date=TruncDate('created_at')
+            ).values('date').annotate(
+                total=Count('id'),
+                unread=Count('id', filter=Q(is_read=False))
+            ).order_by('-date')
+        ]
         
         return Response({
-            'total': total,
-            'unread': unread,
-            'read': total - unread,
-            'by_type': by_type
+            'total': counts['total'],
+            'unread': counts['unread'],
+            'read': counts['total'] - counts['unread'],
+            'by_type': by_type,
+            'by_author': by_author,
+            'by_day': by_day
         })
 
 
@@ -0,0 +1,47 @@
+"""
+Compresión de respuestas grandes por vista.
+
+``compress_page`` aplica ``CompressionMiddleware`` a una vista concreta: usa
+Brotli si el paquete ``brotli`` está instalado y el cliente lo acepta, y gzip
+en los demás casos. No se activa globalmente para no comprimir respuestas que
+mezclan datos secretos con datos controlados por el cliente (BREACH).
+"""
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import decorator_from_middleware
+from django.utils.regex_helper import _lazy_re_compile
+
+try:
+    import brotli
+except ImportError:  # Dependencia opcional
+    brotli = None
+
+
+re_accepts_brotli = _lazy_re_compile(r'\bbr\b')
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """``GZipMiddleware`` con preferencia por Brotli cuando está disponible."""
+
+    def process_response(self, request, response):
+        if (
+            brotli is None or response.streaming or len(response.content) < 200
+            or response.has_header('Content-Encoding')
+            or not re_accepts_brotli.search(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        ):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        compressed_content = brotli.compress(response.content, quality=5)
+        if len(compressed_content) >= len(response.content):
+            return response
+        response.content = compressed_content
+        response.headers['Content-Length'] = str(len(compressed_content))
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = 'br'
+        return response
+
+
+compress_page = decorator_from_middleware(CompressionMiddleware)
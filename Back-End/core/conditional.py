@@ -0,0 +1,91 @@
+"""
+Peticiones GET condicionales (ETag / Last-Modified) para los catálogos.
+
+El ETag se calcula con ``COUNT(*)`` y ``MAX(updated_at)`` en una sola consulta,
+sin serializar nada: si el cliente envía ``If-None-Match`` o
+``If-Modified-Since`` y los datos no cambiaron, se responde ``304``.
+
+Los listados solo envían ETag: al borrar una fila ``MAX(updated_at)`` no
+cambia (solo el recuento), así que ``Last-Modified`` daría por válida una
+lista que ya no lo es.
+"""
+import hashlib
+import json
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+
+def make_etag(*parts):
+    digest = hashlib.md5(json.dumps(parts, default=str).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def queryset_state(queryset):
+    """Devuelve ``(count, max(updated_at))`` del queryset con una consulta."""
+    data = queryset.order_by().aggregate(count=Count('pk'), last_modified=Max('updated_at'))
+    return data['count'], data['last_modified']
+
+
+def conditional_response(request, etag, last_modified, get_response):
+    """
+    Responde ``304`` si el cliente ya tiene la versión ``etag``; si no, llama a
+    ``get_response()`` y añade las cabeceras de validación.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = get_response()
+    if response.status_code in (200, 304):
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+        # La respuesta depende del usuario: el navegador debe revalidar siempre
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Authorization'])
+    return response
+
+
+def choices_response(request, choices):
+    """Lista ``[{value, label}]`` de unas ``choices`` con soporte de ETag."""
+    data = [{'value': value, 'label': label} for value, label in choices]
+    return conditional_response(request, make_etag(data), None, lambda: Response(data))
+
+
+class ConditionalGetMixin:
+    """
+    Añade ETag a ``list`` y ETag y Last-Modified a ``retrieve`` de un ViewSet.
+
+    El estado se deriva del queryset filtrado de la vista y de
+    ``conditional_related_models``: modelos cuyos datos también aparecen en la
+    respuesta (p. ej. el nombre de la disciplina en una asignatura).
+    """
+    conditional_related_models = ()
+
+    def get_conditional_state(self, queryset):
+        states = [queryset_state(queryset)] + [
+            queryset_state(model.objects.all()) for model in self.conditional_related_models
+        ]
+        last_modified = max((last for _, last in states if last), default=None)
+        etag = make_etag(self.request.user.pk, self.request.get_full_path(), states)
+        return etag, last_modified
+
+    def list(self, request, *args, **kwargs):
+        etag, _ = self.get_conditional_state(self.filter_queryset(self.get_queryset()))
+        return conditional_response(
+            request, etag, None,
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: kwargs[lookup_url_kwarg]}
+        )
+        etag, last_modified = self.get_conditional_state(queryset)
+        return conditional_response(
+            request, etag, last_modified,
+            lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs)
+        )
@@ -0,0 +1,44 @@
+"""
+Utilidades compartidas para exportar reportes CSV en streaming o a archivo.
+"""
+import csv
+
+from django.http import StreamingHttpResponse
+
+
+# Filas leídas de la base de datos por cada viaje del cursor
+EXPORT_CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """Pseudo-archivo que devuelve lo escrito en lugar de acumularlo."""
+
+    def write(self, value):
+        return value
+
+
+def iter_values(queryset, fields, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Itera el queryset como tuplas con nombre (``values_list(named=True)``)
+    leyendo en bloques, sin instanciar modelos ni cachear resultados.
+    """
+    return queryset.values_list(*fields, named=True).iterator(chunk_size=chunk_size)
+
+
+def iter_csv(header, rows):
+    """Genera el CSV línea a línea, con BOM para que Excel detecte UTF-8."""
+    writer = csv.writer(_Echo())
+    yield '\ufeff'
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def streaming_csv_response(filename, header, rows):
+    """
+    Construye una ``StreamingHttpResponse`` que escribe el CSV fila a fila,
+    de modo que el archivo nunca se mantiene completo en memoria.
+    """
+    response = StreamingHttpResponse(iter_csv(header, rows), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
@@ -0,0 +1,125 @@
+"""
+Caché versionada de respuestas para ``list`` y ``retrieve``.
+
+Cada modelo tiene un contador de versión que se incrementa al guardar o
+eliminar filas (señales) o explícitamente tras operaciones masivas. La clave
+de una respuesta combina la vista, la URL con sus parámetros, el alcance del
+usuario y las versiones de los modelos que aparecen en ella, así que una
+entrada deja de usarse en cuanto cambia cualquiera de esos modelos; las
+entradas obsoletas las desaloja el backend (LRU con ``MAX_ENTRIES``).
+
+Los contadores viven en ``RESPONSE_CACHE_VERSIONS_ALIAS``, un almacén
+compartido por los workers (Redis o la misma caché en disco de las entradas).
+"""
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from rest_framework.response import Response
+
+from users.scope import get_user_scope
+
+
+def _version_key(model):
+    return f'model_version:{model._meta.label_lower}'
+
+
+def _versions_cache():
+    return caches[settings.RESPONSE_CACHE_VERSIONS_ALIAS]
+
+
+def get_model_versions(models):
+    """Versiones actuales de ``models`` con una sola lectura de la caché."""
+    cache = _versions_cache()
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    for key in missing:
+        # Una versión desalojada no puede volver a un valor usado antes
+        initial = time.time_ns()
+        cache.add(key, initial, timeout=None)
+        versions[key] = cache.get(key, initial)
+    return [versions[key] for key in keys]
+
+
+def bump_model_versions(*models):
+    """
+    Invalida las respuestas que dependen de ``models``. Se aplica al confirmar
+    la transacción para que nadie cachee datos antiguos con la versión nueva.
+    """
+    def bump():
+        cache = _versions_cache()
+        for model in models:
+            key = _version_key(model)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, time.time_ns(), timeout=None)
+    transaction.on_commit(bump)
+
+
+def _bump_on_change(sender, **kwargs):
+    bump_model_versions(sender)
+
+
+def track_model_versions(*models):
+    """Conecta las señales que incrementan la versión de ``models``."""
+    for model in models:
+        uid = f'response_cache:{model._meta.label_lower}'
+        post_save.connect(_bump_on_change, sender=model, dispatch_uid=uid)
+        post_delete.connect(_bump_on_change, sender=model, dispatch_uid=uid)
+
+
+def _scope_key(user):
+    # Los jefes de disciplina ven un subconjunto; el resto de roles comparte respuestas
+    if user.is_jefe_disciplina:
+        scope = get_user_scope(user)
+        return [user.role, sorted(scope.discipline_ids), sorted(scope.subject_ids)]
+    return [user.role]
+
+
+class CachedResponseMixin:
+    """
+    Sirve ``list`` y ``retrieve`` desde la caché ``RESPONSE_CACHE_ALIAS``.
+
+    ``cache_models`` enumera todos los modelos cuyos datos aparecen en la
+    respuesta (el del queryset y los relacionados que se serializan).
+    """
+    cache_models = ()
+
+    def get_response_cache_key(self, request):
+        parts = [
+            f'{type(self).__module__}.{type(self).__qualname__}', self.action,
+            request.get_full_path(), request.accepted_renderer.format,
+            _scope_key(request.user), get_model_versions(self.cache_models),
+        ]
+        return 'response:' + hashlib.md5(json.dumps(parts, default=str).encode()).hexdigest()
+
+    def cached_response(self, request, get_response):
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return get_response()
+
+        response_cache = caches[settings.RESPONSE_CACHE_ALIAS]
+        key = self.get_response_cache_key(request)
+        data = response_cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = get_response()
+        if response.status_code == 200:
+            response_cache.set(key, response.data, settings.RESPONSE_CACHE_TIMEOUT)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(
+            request, lambda: super(CachedResponseMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(
+            request, lambda: super(CachedResponseMixin, self).retrieve(request, *args, **kwargs)
+        )
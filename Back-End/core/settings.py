@@ -10,23 +10,40 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 from datetime import timedelta
 
+from dotenv import load_dotenv
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Variables de entorno opcionales desde Back-End/.env (ver .env.example)
+load_dotenv(BASE_DIR / '.env')
+
+
+def env_bool(name, default=False):
+    return os.environ.get(name, str(default)).strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def env_int(name, default):
+    return int(os.environ.get(name, default))
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/6.0/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = 'django-insecure-e&z#r_ga#k)=a_*z(*$1!*k)8esex11&!z1w2duc2qt+mo6lbr'
+SECRET_KEY = os.environ.get(
+    'DJANGO_SECRET_KEY',
+    'django-insecure-e&z#r_ga#k)=a_*z(*$1!*k)8esex11&!z1w2duc2qt+mo6lbr'
+)
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = env_bool('DJANGO_DEBUG', True)
 
-ALLOWED_HOSTS = ['*']
+ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', '*').split(',')
 
 
 # Application definition
@@ -54,6 +71,10 @@ INSTALLED_APPS = [
     'professors.apps.ProfessorsConfig',
     'assignments.apps.AssignmentsConfig',
     'comments.apps.CommentsConfig',
+    'sync.apps.SyncConfig',
+    'search.apps.SearchConfig',
+    'planning.apps.PlanningConfig',
+    'jobs.apps.JobsConfig',
 ]
 
 MIDDLEWARE = [
@@ -86,17 +107,181 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'core.wsgi.application'
 
+TEST_RUNNER = 'core.test_runner.TestRunner'
+
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
+# SQLite por defecto para desarrollo. En producción usar DB_ENGINE=postgresql,
+# que admite escrituras concurrentes de varios jefes sin "database is locked".
+
+DB_ENGINE = os.environ.get('DB_ENGINE', 'sqlite').lower()
+
+if DB_ENGINE in ('postgres', 'postgresql'):
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'carga_docente'),
+            'USER': os.environ.get('DB_USER', 'postgres'),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5432'),
+            # Conexiones persistentes con verificación antes de reutilizarlas
+            'CONN_MAX_AGE': env_int('DB_CONN_MAX_AGE', 60),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {},
+            'TEST': {
+                'NAME': os.environ.get('DB_TEST_NAME', 'test_carga_docente'),
+            },
+        }
+    }
+    if env_bool('DB_POOL'):
+        # Pool de psycopg 3 (requiere psycopg[pool]). Django exige
+        # CONN_MAX_AGE=0 cuando el pool gestiona las conexiones.
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': env_int('DB_POOL_MIN_SIZE', 2),
+            'max_size': env_int('DB_POOL_MAX_SIZE', 10),
+            'timeout': env_int('DB_POOL_TIMEOUT', 10),
+        }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+        }
+    }
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# Modo SQLite optimizado para despliegues pequeños (SQLITE_TUNED=true):
+# WAL permite que las lecturas del dashboard no bloqueen las escrituras de los
+# jefes, y BEGIN IMMEDIATE evita errores "database is locked" al pasar de
+# lectura a escritura dentro de una transacción.
+SQLITE_TUNED_PRAGMAS = (
+    'PRAGMA journal_mode=WAL;'
+    'PRAGMA synchronous=NORMAL;'
+    f"PRAGMA cache_size=-{env_int('SQLITE_CACHE_SIZE_KB', 65536)};"
+    f"PRAGMA mmap_size={env_int('SQLITE_MMAP_SIZE', 268435456)};"
+    f"PRAGMA busy_timeout={env_int('SQLITE_BUSY_TIMEOUT_MS', 5000)};"
+)
+
+if DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3' and env_bool('SQLITE_TUNED'):
+    DATABASES['default']['OPTIONS'] = {
+        'init_command': SQLITE_TUNED_PRAGMAS,
+        'transaction_mode': 'IMMEDIATE',
     }
+
+
+# Caché
+# Memoria local por proceso por defecto. Con varios workers usar Redis
+# (CACHE_REDIS_URL, requiere el paquete redis) para compartir invalidaciones.
+# CACHE_SHARED indica que todos los workers ven la caché por defecto (Redis o
+# un único proceso); sin ella, la revocación de tokens se comprueba en la base
+# de datos y el alcance de los jefes no se guarda entre peticiones.
+
+if os.environ.get('CACHE_REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['CACHE_REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'carga-docente',
+        }
+    }
+
+CACHE_SHARED = env_bool('CACHE_SHARED', bool(os.environ.get('CACHE_REDIS_URL')))
+
+# Caché de respuestas de list/retrieve (core.response_cache). Backends:
+# locmem (LRU en memoria del proceso) o file (LRU en disco, compartida entre
+# workers de la misma máquina). MAX_ENTRIES limita el tamaño de ambas.
+RESPONSE_CACHE_ALIAS = 'responses'
+RESPONSE_CACHE_BACKEND = os.environ.get('RESPONSE_CACHE_BACKEND', 'locmem')
+RESPONSE_CACHE_TIMEOUT = env_int('RESPONSE_CACHE_TIMEOUT', 600)
+
+if RESPONSE_CACHE_BACKEND == 'file':
+    CACHES[RESPONSE_CACHE_ALIAS] = {
+        'BACKEND': 'core.cache_backends.LRUFileBasedCache',
+        'LOCATION': os.environ.get('RESPONSE_CACHE_DIR', BASE_DIR / '.cache' / 'responses'),
+        'OPTIONS': {
+            'MAX_ENTRIES': env_int('RESPONSE_CACHE_MAX_ENTRIES', 2000),
+            'CULL_FREQUENCY': 4,
+        },
+    }
+else:
+    CACHES[RESPONSE_CACHE_ALIAS] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'carga-docente-responses',
+        'OPTIONS': {
+            'MAX_ENTRIES': env_int('RESPONSE_CACHE_MAX_ENTRIES', 2000),
+            'CULL_FREQUENCY': 4,
+        },
+    }
+
+# Contadores de versión de los modelos (caché de respuestas y autocompletado):
+# deben verlos todos los workers. Van en la caché compartida si la hay; si no,
+# con la caché en disco, junto a las entradas.
+RESPONSE_CACHE_VERSIONS_ALIAS = 'default'
+if RESPONSE_CACHE_BACKEND == 'file' and not CACHE_SHARED:
+    RESPONSE_CACHE_VERSIONS_ALIAS = RESPONSE_CACHE_ALIAS
+MODEL_VERSIONS_SHARED = CACHE_SHARED or RESPONSE_CACHE_BACKEND == 'file'
+# Activa por defecto solo con versiones compartidas: con contadores por proceso
+# los demás workers servirían respuestas antiguas. Las pruebas la desactivan
+# (core.test_runner.TestRunner).
+RESPONSE_CACHE_ENABLED = env_bool('RESPONSE_CACHE', MODEL_VERSIONS_SHARED)
+
+# Segundos que se conserva en caché el alcance (disciplinas y asignaturas) de
+# cada jefe (solo con CACHE_SHARED)
+USER_SCOPE_CACHE_TIMEOUT = env_int('USER_SCOPE_CACHE_TIMEOUT', 300)
+
+# Sincronización incremental (/api/sync/): días que se conservan los registros
+# de borrado (y validez de los tokens) y margen en segundos al leer un token
+SYNC_TOMBSTONE_RETENTION_DAYS = env_int('SYNC_TOMBSTONE_RETENTION_DAYS', 30)
+SYNC_TOKEN_OVERLAP_SECONDS = env_int('SYNC_TOKEN_OVERLAP_SECONDS', 5)
+
+# Horas semanales máximas de un profesor por semestre, según su tipo de contrato
+# y su categoría docente (se aplica el menor). Las asignaciones masivas que las
+# superan se rechazan; POST /api/assignments/validate/ las informa sin guardar.
+ASSIGNMENT_HOUR_LIMITS = {
+    'contract_type': {'FULL_TIME': 20, 'PART_TIME': 12, 'HOURLY': 8},
+    'category': {'INSTRUCTOR': 20, 'ASISTENTE': 20, 'AUXILIAR': 18, 'TITULAR': 16},
+}
+
+# Búsqueda de texto completo (?q=): máximo de resultados por consulta
+SEARCH_MAX_RESULTS = env_int('SEARCH_MAX_RESULTS', 500)
+# Autocompletado (/api/autocomplete/): resultados por defecto y máximo, y cada
+# cuántos segundos cada worker comprueba en la base de datos si su índice en
+# memoria sigue al día (ve así los cambios de otros workers y los update())
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 50
+AUTOCOMPLETE_RECHECK_SECONDS = env_int('AUTOCOMPLETE_RECHECK_SECONDS', 5)
+
+# Reparto automático de la carga (/api/planning-runs/): segundos máximos de la
+# búsqueda local
+PLANNING_TIME_LIMIT_SECONDS = env_int('PLANNING_TIME_LIMIT_SECONDS', 10)
+# Categorías docentes que pueden impartir cada tipo de actividad (los tipos que
+# no aparecen, cualquiera)
+PLANNING_TYPE_CATEGORIES = {
+    'LECTURE': ['ASISTENTE', 'AUXILIAR', 'TITULAR'],
 }
 
+# Cola de trabajos en segundo plano (python manage.py run_jobs): hilos por
+# worker, espera con la cola vacía, cada cuántos segundos el worker renueva el
+# latido de sus trabajos en curso, segundos sin latido tras los que un trabajo se
+# da por interrumpido (su worker murió), intentos máximos y días que se conservan los terminados
+# (purge_jobs). Con JOBS_EAGER (activo en las pruebas) se ejecutan al confirmar la
+# transacción, dentro de la petición. Los archivos van a MEDIA_ROOT/jobs/.
+JOBS_WORKERS = env_int('JOBS_WORKERS', 2)
+JOBS_POLL_SECONDS = env_int('JOBS_POLL_SECONDS', 2)
+JOBS_HEARTBEAT_SECONDS = env_int('JOBS_HEARTBEAT_SECONDS', 30)
+JOBS_STALE_SECONDS = env_int('JOBS_STALE_SECONDS', 300)
+JOBS_MAX_ATTEMPTS = env_int('JOBS_MAX_ATTEMPTS', 3)
+JOBS_RETENTION_DAYS = env_int('JOBS_RETENTION_DAYS', 7)
+JOBS_EAGER = env_bool('JOBS_EAGER', False)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -112,6 +297,18 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Hashers: el primero se usa para las contraseñas nuevas; los demás solo para
+# verificar contraseñas antiguas, que se vuelven a cifrar en el siguiente login.
+# PASSWORD_PBKDF2_ITERATIONS ajusta el coste de cada login (0 = valor de Django).
+PASSWORD_HASHERS = [
+    'users.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+PASSWORD_PBKDF2_ITERATIONS = env_int('PASSWORD_PBKDF2_ITERATIONS', 0)
+
 # AUTH_PASSWORD_VALIDATORS = [
 #     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
 #     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -155,7 +352,8 @@ AUTH_USER_MODEL = 'users.User'
 # Django REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # JWT con rol y bloqueo en los claims: sin consulta de usuario por petición
+        'users.authentication.ClaimsJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -165,7 +363,8 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ),
-    'DEFAULT_PAGINATION_CLASS': None,
+    # Paginación opcional: solo se activa con ?cursor= o ?page_size=
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.OptInCursorPagination',
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
@@ -176,10 +375,17 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
-    'UPDATE_LAST_LOGIN': True,
+    # last_login lo actualiza CustomTokenObtainPairSerializer en la misma
+    # escritura que el rehash de la contraseña
+    'UPDATE_LAST_LOGIN': False,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    'TOKEN_REFRESH_SERIALIZER': 'users.serializers.CustomTokenRefreshSerializer',
 }
 
+# Segundos que se conserva en caché la lista de usuarios bloqueados (se
+# recarga de inmediato al bloquear o desbloquear desde la API)
+AUTH_BLOCKED_CACHE_TIMEOUT = env_int('AUTH_BLOCKED_CACHE_TIMEOUT', 300)
+
 
 # CORS Configuration
 CORS_ALLOW_ALL_ORIGINS = True  # Solo para desarrollo
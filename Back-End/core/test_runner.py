@@ -0,0 +1,25 @@
+"""
+Ejecutor de pruebas del proyecto.
+"""
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Desactiva la caché de respuestas durante las pruebas: el rollback de cada
+    test no incrementa las versiones de los modelos. Las pruebas de la caché
+    la activan con ``override_settings``. Los trabajos en segundo plano se
+    ejecutan dentro de la petición (``JOBS_EAGER``). Las pruebas corren en un
+    único proceso, así que la caché por defecto es compartida (``CACHE_SHARED``).
+    """
+    test_settings = {'RESPONSE_CACHE_ENABLED': False, 'JOBS_EAGER': True, 'CACHE_SHARED': True}
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._settings_override = override_settings(**self.test_settings)
+        self._settings_override.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._settings_override.disable()
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+import time
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from academic.models import Faculty
+from .cache_backends import LRUFileBasedCache
+from .response_cache import bump_model_versions, get_model_versions
+
+
+class LRUFileBasedCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.location, ignore_errors=True)
+        self.cache = LRUFileBasedCache(self.location, {
+            'OPTIONS': {'MAX_ENTRIES': 4, 'CULL_FREQUENCY': 2},
+        })
+
+    def test_culls_least_recently_used_entries(self):
+        for i in range(4):
+            self.cache.set(f'k{i}', i)
+            # Fechas de modificación distintas aunque el sistema tenga poca resolución
+            os.utime(self.cache._key_to_file(f'k{i}'), (time.time() - 100 + i, time.time() - 100 + i))
+        self.assertEqual(self.cache.get('k0'), 0)  # k0 pasa a ser la más reciente
+
+        self.cache.set('k4', 4)  # supera MAX_ENTRIES: se eliminan las dos menos usadas
+        self.assertEqual(self.cache.get('k0'), 0)
+        self.assertIsNone(self.cache.get('k1'))
+        self.assertIsNone(self.cache.get('k2'))
+        self.assertEqual(self.cache.get('k4'), 4)
+
+
+class FileResponseCacheVersionsTests(TestCase):
+
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.location, ignore_errors=True)
+        caches = {
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+            'responses': {'BACKEND': 'core.cache_backends.LRUFileBasedCache', 'LOCATION': self.location},
+        }
+        settings_override = override_settings(CACHES=caches, RESPONSE_CACHE_VERSIONS_ALIAS='responses')
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_versions_are_shared_through_the_cache_directory(self):
+        [version] = get_model_versions([Faculty])
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_model_versions(Faculty)
+
+        # Otro worker: su propia instancia del backend sobre el mismo directorio
+        other_worker = LRUFileBasedCache(self.location, {})
+        self.assertEqual(other_worker.get('model_version:academic.faculty'), version + 1)
@@ -53,6 +53,11 @@ def api_root(request):
             'professors': '/api/professors/',
             'assignments': '/api/assignments/',
             'comments': '/api/comments/',
+            'bootstrap': '/api/bootstrap/',
+            'autocomplete': '/api/autocomplete/',
+            'sync': '/api/sync/',
+            'planning': '/api/planning-runs/',
+            'jobs': '/api/jobs/',
         }
     })
 
@@ -77,6 +82,10 @@ urlpatterns = [
     path('api/', include('professors.urls')),
     path('api/', include('assignments.urls')),
     path('api/', include('comments.urls')),
+    path('api/', include('sync.urls')),
+    path('api/', include('search.urls')),
+    path('api/', include('planning.urls')),
+    path('api/', include('jobs.urls')),
 ]
 
 # Servir archivos estáticos y media en desarrollo
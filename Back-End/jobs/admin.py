@@ -0,0 +1,12 @@
+from django.contrib import admin
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """Configuración del admin para los trabajos en segundo plano."""
+    
+    list_display = ['kind', 'status', 'attempts', 'created_by', 'created_at', 'finished_at']
+    list_filter = ['status', 'kind']
+    raw_id_fields = ['created_by']
+    readonly_fields = ['params', 'result', 'error', 'attempts', 'created_at', 'started_at', 'heartbeat_at', 'finished_at']
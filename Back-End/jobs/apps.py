@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class JobsConfig(AppConfig):
+    name = 'jobs'
+    
+    def ready(self):
+        # Cada app registra sus tipos de trabajo en su módulo ``jobs.py``
+        autodiscover_modules('jobs')
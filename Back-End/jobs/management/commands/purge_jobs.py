@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = (
+        'Elimina los trabajos terminados o fallidos más antiguos que JOBS_RETENTION_DAYS '
+        'y sus archivos de resultado.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=settings.JOBS_RETENTION_DAYS,
+            help='Días de trabajos a conservar'
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        finished = Job.objects.filter(
+            status__in=[Job.Status.DONE, Job.Status.FAILED], finished_at__lt=cutoff
+        )
+        for job in finished.exclude(result_file='').only('pk', 'result_file').iterator():
+            job.result_file.delete(save=False)
+        deleted, _ = finished.delete()
+        self.stdout.write(self.style.SUCCESS(f'{deleted} trabajos eliminados.'))
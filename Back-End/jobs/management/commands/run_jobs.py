@@ -0,0 +1,86 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from jobs.models import Job
+from jobs.queue import claim_next, execute, heartbeat, requeue_stale
+
+
+def _execute_in_thread(job):
+    try:
+        return execute(job)
+    finally:
+        # Cada hilo abre sus propias conexiones: cerrarlas al terminar el trabajo
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        'Worker de la cola de trabajos: toma los trabajos pendientes y los ejecuta '
+        'en un pool de hilos. Se pueden lanzar varios procesos a la vez.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=settings.JOBS_WORKERS,
+            help='Trabajos simultáneos (hilos)'
+        )
+        parser.add_argument(
+            '--poll', type=float, default=settings.JOBS_POLL_SECONDS,
+            help='Segundos de espera cuando la cola está vacía'
+        )
+        parser.add_argument(
+            '--once', action='store_true',
+            help='Terminar cuando no queden trabajos pendientes'
+        )
+
+    def handle(self, *args, **options):
+        workers = max(1, options['workers'])
+        requeued = requeue_stale()
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'{requeued} trabajo(s) interrumpido(s) devueltos a la cola.'))
+        self.stdout.write(self.style.HTTP_INFO(f'Worker iniciado con {workers} hilo(s).'))
+
+        # Futuro → pk del trabajo, para renovar su latido mientras se ejecuta
+        running = {}
+        last_beat = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='job') as pool:
+            try:
+                while True:
+                    while len(running) < workers:
+                        job = claim_next()
+                        if job is None:
+                            break
+                        self.stdout.write(f'→ {job.kind} #{job.pk}')
+                        future = pool.submit(_execute_in_thread, job)
+                        future.add_done_callback(self.report)
+                        running[future] = job.pk
+
+                    if running:
+                        done, _ = wait(running, timeout=options['poll'], return_when=FIRST_COMPLETED)
+                        for future in done:
+                            del running[future]
+                        if time.monotonic() - last_beat >= settings.JOBS_HEARTBEAT_SECONDS:
+                            heartbeat(list(running.values()))
+                            requeue_stale()
+                            last_beat = time.monotonic()
+                    elif options['once']:
+                        break
+                    else:
+                        time.sleep(options['poll'])
+                        requeue_stale()
+            except KeyboardInterrupt:
+                self.stdout.write(self.style.WARNING('Esperando a que terminen los trabajos en curso...'))
+
+    def report(self, future):
+        if future.exception() is not None:
+            self.stdout.write(self.style.ERROR(f'✗ {future.exception()}'))
+            return
+        job = future.result()
+        if job.status == Job.Status.DONE:
+            self.stdout.write(self.style.SUCCESS(f'✓ {job.kind} #{job.pk}'))
+        else:
+            self.stdout.write(self.style.ERROR(f'✗ {job.kind} #{job.pk}: {job.error}'))
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:42
+
+from django.db import migrations, models
+
+
+def copy_started_at(apps, schema_editor):
+    # Los trabajos en curso conservan el plazo que tenían hasta ahora
+    Job = apps.get_model('jobs', 'Job')
+    Job.objects.filter(status='RUNNING').update(heartbeat_at=models.F('started_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Último latido'),
+        ),
+        migrations.RunPython(copy_started_at, migrations.RunPython.noop),
+    ]
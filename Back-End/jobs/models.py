@@ -0,0 +1,90 @@
+from django.conf import settings
+from django.db import models
+
+
+class Job(models.Model):
+    """
+    Trabajo en segundo plano. Se encola con ``jobs.registry.enqueue`` y lo
+    ejecuta ``python manage.py run_jobs``; los archivos que genera se guardan
+    en ``MEDIA_ROOT/jobs/`` y se descargan desde la API.
+    """
+    
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pendiente'
+        RUNNING = 'RUNNING', 'En ejecución'
+        DONE = 'DONE', 'Terminado'
+        FAILED = 'FAILED', 'Fallido'
+    
+    kind = models.CharField(
+        max_length=50,
+        verbose_name='Tipo'
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name='Estado'
+    )
+    params = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='Parámetros'
+    )
+    result = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='Resultado'
+    )
+    result_file = models.FileField(
+        upload_to='jobs/%Y/%m/',
+        blank=True,
+        verbose_name='Archivo de resultado'
+    )
+    error = models.TextField(
+        blank=True,
+        verbose_name='Error'
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='Intentos'
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='jobs',
+        verbose_name='Creado por'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Fecha de creación'
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Inicio'
+    )
+    heartbeat_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Último latido'
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Fin'
+    )
+    
+    class Meta:
+        verbose_name = 'Trabajo'
+        verbose_name_plural = 'Trabajos'
+        ordering = ['-created_at']
+        indexes = [
+            # Cola: el pendiente más antiguo primero
+            models.Index(fields=['status', 'created_at'], name='job_status_created_idx'),
+            models.Index(fields=['created_by', '-created_at'], name='job_user_created_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.kind} #{self.pk} ({self.get_status_display()})"
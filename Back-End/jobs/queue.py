@@ -0,0 +1,116 @@
+"""
+Cola de trabajos en la base de datos.
+
+``enqueue`` crea el ``Job`` pendiente; los workers de ``run_jobs`` lo toman
+con ``claim_next``, un ``UPDATE ... WHERE status = 'PENDING'`` condicional,
+de modo que varios hilos o procesos nunca ejecutan el mismo trabajo. Con
+``JOBS_EAGER`` (en las pruebas) se ejecuta al confirmarse la transacción, en
+el mismo hilo.
+
+Mientras un trabajo se ejecuta, su worker renueva ``heartbeat_at`` cada
+``JOBS_HEARTBEAT_SECONDS``; si pasan ``JOBS_STALE_SECONDS`` sin latido, el
+worker murió y ``requeue_stale`` lo devuelve a la cola. Un trabajo lento pero
+vivo nunca se ejecuta dos veces.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+from .registry import JOB_TYPES, JobFailed
+
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(kind, params=None, user=None):
+    """Encola un trabajo de tipo ``kind`` y lo devuelve."""
+    if kind not in JOB_TYPES:
+        raise ValueError(f'Tipo de trabajo desconocido: {kind}')
+    job = Job.objects.create(kind=kind, params=params or {}, created_by=user)
+    if settings.JOBS_EAGER:
+        transaction.on_commit(lambda: run_job(job.pk))
+    return job
+
+
+def _claim(pk):
+    now = timezone.now()
+    return Job.objects.filter(pk=pk, status=Job.Status.PENDING).update(
+        status=Job.Status.RUNNING, started_at=now, heartbeat_at=now, attempts=F('attempts') + 1
+    )
+
+
+def claim_next():
+    """Toma el trabajo pendiente más antiguo, o devuelve None si no hay."""
+    while True:
+        pk = Job.objects.filter(status=Job.Status.PENDING).order_by('created_at', 'id').values_list(
+            'pk', flat=True
+        ).first()
+        if pk is None:
+            return None
+        # Otro worker pudo tomarlo entre la lectura y la actualización
+        if _claim(pk):
+            return Job.objects.get(pk=pk)
+
+
+def run_job(pk):
+    """Toma y ejecuta un trabajo concreto si sigue pendiente."""
+    if _claim(pk):
+        return execute(Job.objects.get(pk=pk))
+    return None
+
+
+def execute(job):
+    """Ejecuta un trabajo ya tomado y guarda su resultado o su error."""
+    job_type = JOB_TYPES.get(job.kind)
+    try:
+        if job_type is None:
+            raise JobFailed(f'Tipo de trabajo desconocido: {job.kind}')
+        job.result = job_type.handler(job) or {}
+        job.status = Job.Status.DONE
+    except JobFailed as error:
+        job.status, job.error, job.result = Job.Status.FAILED, str(error), error.result
+    except Exception as error:
+        logger.exception('Falló el trabajo %s (%s)', job.pk, job.kind)
+        job.status, job.error = Job.Status.FAILED, str(error) or error.__class__.__name__
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'result', 'result_file', 'error', 'finished_at'])
+    return job
+
+
+def heartbeat(pks):
+    """Renueva el latido de los trabajos ``pks`` que siguen en ejecución."""
+    if not pks:
+        return 0
+    return Job.objects.filter(pk__in=pks, status=Job.Status.RUNNING).update(heartbeat_at=timezone.now())
+
+
+def requeue_stale():
+    """
+    Devuelve a la cola los trabajos en ejecución sin latido desde hace más de
+    ``JOBS_STALE_SECONDS`` (su worker murió) y marca como fallidos los que ya
+    agotaron ``JOBS_MAX_ATTEMPTS``. En ambos casos llama a ``on_requeue`` de su
+    tipo para que restablezca su estado. Devuelve cuántos se reencolaron.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.JOBS_STALE_SECONDS)
+    stale = Job.objects.filter(status=Job.Status.RUNNING, heartbeat_at__lt=cutoff)
+    requeued = 0
+    for job in stale.only('pk', 'kind', 'params', 'attempts'):
+        failed = job.attempts >= settings.JOBS_MAX_ATTEMPTS
+        if failed:
+            changes = dict(status=Job.Status.FAILED, error='Se agotaron los intentos.', finished_at=timezone.now())
+        else:
+            changes = dict(status=Job.Status.PENDING, started_at=None, heartbeat_at=None)
+        with transaction.atomic():
+            # Condicional: otro worker pudo reencolarlo o el suyo terminar entretanto
+            if not stale.filter(pk=job.pk).update(**changes):
+                continue
+            job_type = JOB_TYPES.get(job.kind)
+            if job_type is not None and job_type.on_requeue is not None:
+                job_type.on_requeue(job, failed)
+        requeued += not failed
+    return requeued
@@ -0,0 +1,64 @@
+"""
+Tipos de trabajo en segundo plano.
+
+Cada app declara los suyos en ``<app>/jobs.py`` con ``@register``; el módulo se
+importa al arrancar (``JobsConfig.ready``). Un manejador recibe el ``Job`` y
+devuelve un diccionario serializable que se guarda como resultado. Si genera
+un archivo, lo escribe con ``save_result_file``. Si el trabajo deja estado
+propio a medias (p. ej. un ``PlanningRun`` en ejecución), ``on_requeue``
+lo restablece cuando el worker muere y el trabajo vuelve a la cola.
+"""
+import tempfile
+from typing import Callable, NamedTuple, Optional
+
+from django.core.files import File
+
+
+class JobType(NamedTuple):
+    handler: Callable
+    # ``permission(user)``: quién puede encolarlo desde la API (None: solo interno)
+    permission: Optional[Callable]
+    # Serializer DRF que valida ``params`` al encolar desde la API
+    serializer: Optional[type]
+    description: str
+    # ``on_requeue(job, failed)``: el worker murió; ``failed`` si no habrá más intentos
+    on_requeue: Optional[Callable] = None
+
+
+JOB_TYPES = {}
+
+
+class JobFailed(Exception):
+    """Fallo esperado de un trabajo: ``result`` se guarda junto al mensaje."""
+
+    def __init__(self, message, result=None):
+        super().__init__(message)
+        self.result = result or {}
+
+
+def register(kind, permission=None, serializer=None, description='', on_requeue=None):
+    """Decorador que registra ``handler(job)`` como el trabajo ``kind``."""
+    def decorator(handler):
+        JOB_TYPES[kind] = JobType(handler, permission, serializer, description, on_requeue)
+        return handler
+    return decorator
+
+
+def public_job_types(user):
+    """Tipos que ``user`` puede encolar desde la API."""
+    return {
+        kind: job_type for kind, job_type in JOB_TYPES.items()
+        if job_type.permission is not None and job_type.permission(user)
+    }
+
+
+def save_result_file(job, filename, write):
+    """
+    Llama a ``write(file)`` con un archivo temporal binario y lo guarda como
+    ``job.result_file`` (en ``MEDIA_ROOT``). Devuelve lo que devuelva ``write``.
+    """
+    with tempfile.TemporaryFile() as file:
+        value = write(file)
+        file.seek(0)
+        job.result_file.save(filename, File(file), save=False)
+    return value
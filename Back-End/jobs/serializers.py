@@ -0,0 +1,46 @@
+from rest_framework import serializers
+from rest_framework.exceptions import PermissionDenied
+
+from .models import Job
+from .registry import JOB_TYPES
+
+
+class JobCreateSerializer(serializers.Serializer):
+    """Encolar un trabajo: tipo y parámetros, validados por el serializer del tipo."""
+    kind = serializers.CharField(max_length=50)
+    params = serializers.DictField(required=False, default=dict)
+
+    def validate_kind(self, value):
+        job_type = JOB_TYPES.get(value)
+        if job_type is None or job_type.permission is None:
+            raise serializers.ValidationError(f'Tipo de trabajo desconocido: {value}.')
+        if not job_type.permission(self.context['request'].user):
+            raise PermissionDenied('No tiene permisos para ejecutar este trabajo.')
+        return value
+
+    def validate(self, attrs):
+        job_type = JOB_TYPES[attrs['kind']]
+        if job_type.serializer is not None:
+            params = job_type.serializer(data=attrs['params'], context=self.context)
+            if not params.is_valid():
+                raise serializers.ValidationError({'params': params.errors})
+            attrs['params'] = params.validated_data
+        return attrs
+
+
+class JobSerializer(serializers.ModelSerializer):
+    """Estado y resultado de un trabajo."""
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Job
+        fields = [
+            'id', 'kind', 'status', 'status_display', 'params', 'result',
+            'error', 'attempts', 'download_url', 'created_at', 'started_at',
+            'finished_at'
+        ]
+        read_only_fields = fields
+
+    def get_download_url(self, obj):
+        return f'/api/jobs/{obj.pk}/download/' if obj.result_file else None
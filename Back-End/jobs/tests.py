@@ -0,0 +1,161 @@
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import User
+from academic.models import Faculty, Discipline, Subject
+from assignments.exports import Workbook
+from assignments.models import Assignment, ProfessorLoadSummary
+from planning.models import PlanningRun
+from professors.models import Professor
+from .models import Job
+from .queue import claim_next, enqueue, execute, heartbeat, requeue_stale
+
+
+class JobTestMixin:
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.media_root = tempfile.mkdtemp()
+        cls.media_override = override_settings(MEDIA_ROOT=cls.media_root)
+        cls.media_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.media_override.disable()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
+        super().tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vicedecano = User.objects.create_user(
+            username='vicedecano', email='vicedecano@uci.cu',
+            password='123456', role=User.Role.VICEDECANO
+        )
+        cls.jefe = User.objects.create_user(
+            username='jefe', email='jefe@uci.cu',
+            password='123456', role=User.Role.JEFE_DISCIPLINA
+        )
+        cls.faculty = Faculty.objects.create(name='Facultad 1', code='F1')
+        discipline = Discipline.objects.create(name='Matemática', code='MAT')
+        cls.subject = Subject.objects.create(name='Álgebra', code='ALG', discipline=discipline)
+        cls.professor = Professor.objects.create(
+            first_name='Ana', last_name='Pérez', email='ana@uci.cu', identification='00000000001'
+        )
+        for year in ('2024-2025', '2025-2026'):
+            Assignment.objects.create(
+                professor=cls.professor, subject=cls.subject, faculty=cls.faculty,
+                academic_year=year, semester=1, hours_per_week=4
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.vicedecano)
+
+    def submit(self, kind, status_code=202, **params):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/jobs/', {'kind': kind, 'params': params}, format='json')
+        self.assertEqual(response.status_code, status_code, response.content)
+        return response.json()
+
+
+class JobApiTests(JobTestMixin, TestCase):
+
+    def test_export_runs_off_request_and_is_downloadable(self):
+        job = self.submit('assignments.export', academic_year='2025-2026')
+        self.assertEqual(job['status'], Job.Status.PENDING)
+
+        job = self.client.get(f"/api/jobs/{job['id']}/").json()
+        self.assertEqual((job['status'], job['result']), ('DONE', {'rows': 1, 'format': 'csv'}))
+        self.assertTrue(Job.objects.get(pk=job['id']).result_file.path.startswith(self.media_root))
+
+        response = self.client.get(job['download_url'])
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('asignaciones_2025-2026.csv', response['Content-Disposition'])
+        lines = b''.join(response.streaming_content).decode('utf-8-sig').splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn('Álgebra', lines[1])
+
+    def test_kind_permission_and_params_are_validated(self):
+        self.submit('assignments.unknown', status_code=400)
+        # Solo interno: se encola desde /api/planning-runs/
+        self.submit('planning.solve', status_code=400, run=1)
+        self.submit('assignments.export', status_code=400, semester=3)
+        if Workbook is None:
+            self.submit('assignments.export', status_code=400, format='xlsx')
+
+        self.client.force_authenticate(self.jefe)
+        self.submit('assignments.export', status_code=403)
+        kinds = [item['kind'] for item in self.client.get('/api/jobs/types/').json()]
+        self.assertEqual(kinds, ['assignments.bulk'])
+        self.assertEqual(self.client.get('/api/jobs/').json(), [])
+
+    def test_failed_bulk_import_keeps_errors_and_statistics_rebuild(self):
+        job = self.submit('assignments.bulk', create=[{
+            'professor': 999, 'subject': self.subject.id, 'faculty': self.faculty.id,
+            'academic_year': '2025-2026', 'semester': 2, 'hours_per_week': 2,
+        }])
+        job = Job.objects.get(pk=job['id'])
+        self.assertEqual((job.status, job.error), (Job.Status.FAILED, 'El lote no es válido.'))
+        self.assertIn('create', job.result['errors'])
+
+        ProfessorLoadSummary.objects.all().delete()
+        job = self.submit('assignments.rebuild_load_summaries')
+        self.assertEqual(Job.objects.get(pk=job['id']).result, {'summaries': 2})
+
+
+@override_settings(JOBS_EAGER=False)
+class JobQueueTests(JobTestMixin, TestCase):
+
+    def test_jobs_are_claimed_once_in_order(self):
+        first = enqueue('assignments.rebuild_load_summaries', user=self.vicedecano)
+        second = enqueue('search.rebuild_index')
+        self.assertEqual(claim_next().pk, first.pk)
+        job = claim_next()
+        self.assertEqual((job.pk, job.status, job.attempts), (second.pk, Job.Status.RUNNING, 1))
+        self.assertIsNone(claim_next())
+
+        job = execute(job)
+        self.assertEqual(job.status, Job.Status.DONE)
+        self.assertGreater(job.result['documents'], 0)
+
+    @override_settings(JOBS_MAX_ATTEMPTS=2)
+    def test_stale_jobs_are_requeued_until_attempts_run_out(self):
+        job = enqueue('search.rebuild_index')
+        for expected in (Job.Status.PENDING, Job.Status.FAILED):
+            claim_next()
+            Job.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(days=1))
+            requeue_stale()
+            self.assertEqual(Job.objects.get(pk=job.pk).status, expected)
+
+    def test_slow_job_with_heartbeat_is_not_requeued(self):
+        enqueue('search.rebuild_index')
+        job = claim_next()
+        long_ago = timezone.now() - timedelta(days=1)
+        Job.objects.filter(pk=job.pk).update(started_at=long_ago, heartbeat_at=long_ago)
+        heartbeat([job.pk])
+        self.assertEqual(requeue_stale(), 0)
+        self.assertEqual(Job.objects.get(pk=job.pk).status, Job.Status.RUNNING)
+
+    @override_settings(JOBS_MAX_ATTEMPTS=2)
+    def test_requeue_releases_the_planning_run(self):
+        run = PlanningRun.objects.create(
+            academic_year='2025-2026', semester=1, created_by=self.vicedecano,
+            status=PlanningRun.Status.RUNNING
+        )
+        job = enqueue('planning.solve', {'run': run.pk})
+        for expected in (PlanningRun.Status.PENDING, PlanningRun.Status.FAILED):
+            claim_next()
+            Job.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(days=1))
+            requeue_stale()
+            run.refresh_from_db()
+            self.assertEqual(run.status, expected)
+            # El siguiente intento la toma de nuevo al empezar
+            PlanningRun.objects.filter(pk=run.pk, status=PlanningRun.Status.PENDING).update(
+                status=PlanningRun.Status.RUNNING
+            )
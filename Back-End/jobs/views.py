@@ -0,0 +1,89 @@
+import os
+
+from django.http import FileResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from users.permissions import IsNotBlocked
+from .models import Job
+from .queue import enqueue
+from .registry import public_job_types
+from .serializers import JobCreateSerializer, JobSerializer
+
+
+@extend_schema_view(
+    list=extend_schema(summary="Listar trabajos", description="Trabajos en segundo plano del usuario, del más reciente al más antiguo.", tags=['Jobs']),
+    retrieve=extend_schema(summary="Estado de un trabajo", description="Estado (`PENDING`, `RUNNING`, `DONE`, `FAILED`), resultado y enlace de descarga.", tags=['Jobs']),
+)
+class JobViewSet(mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Trabajos largos (exportaciones, reconstrucciones, importaciones masivas)
+    que se ejecutan fuera de la petición con ``python manage.py run_jobs``.
+    """
+    queryset = Job.objects.all()
+    serializer_class = JobSerializer
+    permission_classes = [IsAuthenticated, IsNotBlocked]
+    filterset_fields = ['kind', 'status']
+    ordering = ['-created_at']
+    cursor_ordering = ['-created_at', '-id']
+
+    def get_queryset(self):
+        return Job.objects.filter(created_by=self.request.user)
+
+    def get_serializer_class(self):
+        if self.action == 'create':
+            return JobCreateSerializer
+        return JobSerializer
+
+    @extend_schema(
+        summary="Encolar trabajo",
+        description=(
+            "Encola un trabajo de tipo `kind` con sus `params` y responde 202. Los tipos "
+            "disponibles para el usuario se listan en `/api/jobs/types/`."
+        ),
+        tags=['Jobs'],
+        responses={202: JobSerializer}
+    )
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        job = enqueue(serializer.validated_data['kind'], serializer.validated_data['params'], request.user)
+        return Response(JobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+    @extend_schema(
+        summary="Tipos de trabajo",
+        description="Tipos de trabajo que el usuario puede encolar.",
+        tags=['Jobs'],
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['get'])
+    def types(self, request):
+        """Listar los tipos de trabajo permitidos."""
+        return Response([
+            {'kind': kind, 'description': job_type.description}
+            for kind, job_type in sorted(public_job_types(request.user).items())
+        ])
+
+    @extend_schema(
+        summary="Descargar resultado",
+        description="Descarga el archivo generado por un trabajo terminado.",
+        tags=['Jobs'],
+        responses={(200, 'application/octet-stream'): bytes}
+    )
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        """Descargar el archivo de resultado."""
+        job = self.get_object()
+        if job.status != Job.Status.DONE or not job.result_file:
+            return Response(
+                {'error': 'El trabajo no tiene un archivo de resultado.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return FileResponse(
+            job.result_file.open('rb'), as_attachment=True,
+            filename=os.path.basename(job.result_file.name)
+        )
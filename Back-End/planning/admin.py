@@ -0,0 +1,12 @@
+from django.contrib import admin
+from .models import PlanningRun
+
+
+@admin.register(PlanningRun)
+class PlanningRunAdmin(admin.ModelAdmin):
+    """Configuración del admin para las planificaciones automáticas."""
+    
+    list_display = ['academic_year', 'semester', 'status', 'created_by', 'created_at', 'finished_at']
+    list_filter = ['status', 'academic_year', 'semester']
+    raw_id_fields = ['created_by']
+    readonly_fields = ['parameters', 'result', 'error', 'created_at', 'started_at', 'finished_at', 'applied_at']
@@ -0,0 +1,55 @@
+"""
+Resolución de las planificaciones en la cola de trabajos (``jobs``): la vista
+crea el ``PlanningRun`` y encola ``planning.solve``, que lo resuelve fuera de
+la petición y guarda la propuesta.
+"""
+from django.conf import settings
+from django.utils import timezone
+
+from jobs.registry import JobFailed, register
+from .models import PlanningRun
+from .plan import plan_semester
+
+
+def release_planning_run(job, failed):
+    """
+    El worker murió resolviendo la planificación: vuelve a quedar pendiente para
+    el siguiente intento, o fallida si ya no habrá más.
+    """
+    running = PlanningRun.objects.filter(pk=job.params['run'], status=PlanningRun.Status.RUNNING)
+    if failed:
+        running.update(
+            status=PlanningRun.Status.FAILED, error='El trabajo se interrumpió y agotó los intentos.',
+            finished_at=timezone.now()
+        )
+    else:
+        running.update(status=PlanningRun.Status.PENDING, started_at=None)
+
+
+@register(
+    'planning.solve',
+    description='Resuelve una planificación automática.',
+    on_requeue=release_planning_run
+)
+def solve_planning_run(job):
+    run_id = job.params['run']
+    claimed = PlanningRun.objects.filter(pk=run_id, status=PlanningRun.Status.PENDING).update(
+        status=PlanningRun.Status.RUNNING, started_at=timezone.now()
+    )
+    if not claimed:
+        raise JobFailed(f'La planificación {run_id} no está pendiente.')
+    run = PlanningRun.objects.get(pk=run_id)
+    try:
+        result = plan_semester(
+            run.academic_year, run.semester,
+            time_limit=settings.PLANNING_TIME_LIMIT_SECONDS, **run.parameters
+        )
+    except Exception as error:
+        PlanningRun.objects.filter(pk=run_id).update(
+            status=PlanningRun.Status.FAILED, error=str(error), finished_at=timezone.now()
+        )
+        raise
+    PlanningRun.objects.filter(pk=run_id).update(
+        status=PlanningRun.Status.DONE, result=result, finished_at=timezone.now()
+    )
+    return {'run': run_id, 'stats': result['stats']}
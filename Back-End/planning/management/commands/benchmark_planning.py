@@ -0,0 +1,74 @@
+import math
+import random
+
+from django.core.management.base import BaseCommand
+
+from planning.solver import Slot, solve, utilization_stats
+
+
+class Command(BaseCommand):
+    help = (
+        'Mide el reparto automático de carga (voraz y voraz + búsqueda local) sobre '
+        'conjuntos sintéticos de distintos tamaños. No usa la base de datos.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--slots', default='500,2000,5000',
+            help='Tamaños a medir (actividades, separados por comas)'
+        )
+        parser.add_argument('--slots-per-professor', type=float, default=4.0, help='Actividades por profesor')
+        parser.add_argument('--disciplines', type=int, default=20, help='Disciplinas sintéticas')
+        parser.add_argument('--time-limit', type=float, default=10.0, help='Segundos máximos de búsqueda local')
+        parser.add_argument('--seed', type=int, default=42, help='Semilla del generador')
+
+    def handle(self, *args, **options):
+        results = []
+        for size in [int(value) for value in options['slots'].split(',')]:
+            slots, base, capacity, scale = self.generate(size, options)
+            greedy = solve(slots, base, capacity, scale, local_search=False)
+            full = solve(slots, base, capacity, scale, time_limit=options['time_limit'])
+            results.append((size, len(base), greedy, full, scale))
+
+        self.stdout.write("\n" + "=" * 78)
+        self.stdout.write(self.style.SUCCESS("Reparto automático: voraz vs. voraz + búsqueda local"))
+        self.stdout.write("=" * 78)
+        for size, professors, greedy, full, scale in results:
+            self.stdout.write(f"  {size} actividades, {professors} profesores")
+            for label, solution in (('voraz', greedy), ('+ búsqueda local', full)):
+                stats = utilization_stats(solution.load, scale)
+                unassigned = sum(owner is None for owner in solution.owner)
+                self.stdout.write(
+                    f"    {label:<17} {solution.elapsed * 1000:8.1f} ms   pasadas: {solution.rounds:3}   "
+                    f"utilización media {stats['mean']:.3f}  desv. {stats['stdev']:.3f}   "
+                    f"sin cubrir: {unassigned}"
+                )
+
+    def generate(self, size, options):
+        """Profesores con una a tres disciplinas y actividades de 2 a 6 horas."""
+        rng = random.Random(options['seed'] + size)
+        professors = max(1, round(size / options['slots_per_professor']))
+        disciplines = options['disciplines']
+        # Límites como ASSIGNMENT_HOUR_LIMITS: tiempo completo, parcial y por horas
+        limits = [rng.choices([20, 16, 12, 8], weights=[6, 2, 1, 1])[0] for _ in range(professors)]
+        senior = [rng.random() < 0.7 for _ in range(professors)]
+        qualified = [rng.sample(range(disciplines), rng.randint(1, 3)) for _ in range(professors)]
+        base = [rng.choice([0, 0, 0, 2, 4]) for _ in range(professors)]
+
+        members = {discipline: [] for discipline in range(disciplines)}
+        for professor, values in enumerate(qualified):
+            for discipline in values:
+                members[discipline].append(professor)
+        # Un conjunto de candidatos por disciplina y tipo (conferencia: solo categorías superiores)
+        shared = {}
+        for discipline, group in members.items():
+            for lecture in (False, True):
+                eligible = tuple(p for p in group if senior[p] or not lecture)
+                shared[discipline, lecture] = (eligible, frozenset(eligible))
+
+        slots = []
+        for _ in range(size):
+            eligible, allowed = shared[rng.randrange(disciplines), rng.random() < 0.3]
+            slots.append(Slot(rng.choice([2, 2, 4, 4, 6]), eligible, allowed))
+        capacity = [limit if limit else math.inf for limit in limits]
+        return slots, base, capacity, limits
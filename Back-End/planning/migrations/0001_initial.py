@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlanningRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('academic_year', models.CharField(max_length=20, verbose_name='Año Académico')),
+                ('semester', models.PositiveIntegerField(choices=[(1, 'Primer Semestre'), (2, 'Segundo Semestre')], verbose_name='Semestre')),
+                ('status', models.CharField(choices=[('PENDING', 'Pendiente'), ('RUNNING', 'En ejecución'), ('DONE', 'Terminada'), ('FAILED', 'Fallida'), ('APPLIED', 'Aplicada')], default='PENDING', max_length=10, verbose_name='Estado')),
+                ('parameters', models.JSONField(default=dict, verbose_name='Parámetros')),
+                ('result', models.JSONField(blank=True, default=dict, verbose_name='Resultado')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de creación')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='Inicio')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Fin')),
+                ('applied_at', models.DateTimeField(blank=True, null=True, verbose_name='Fecha de aplicación')),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='planning_runs', to=settings.AUTH_USER_MODEL, verbose_name='Creada por')),
+            ],
+            options={
+                'verbose_name': 'Planificación automática',
+                'verbose_name_plural': 'Planificaciones automáticas',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['created_by', '-created_at'], name='planning_user_created_idx')],
+            },
+        ),
+    ]
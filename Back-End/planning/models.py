@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.db import models
+
+
+class PlanningRun(models.Model):
+    """
+    Ejecución del reparto automático de la carga de un semestre.
+
+    Se crea en estado pendiente con las actividades a cubrir (``parameters``),
+    se resuelve en la cola de trabajos (``planning.jobs``) y guarda en ``result``
+    la propuesta, que se puede revisar y aplicar como asignaciones.
+    """
+    
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pendiente'
+        RUNNING = 'RUNNING', 'En ejecución'
+        DONE = 'DONE', 'Terminada'
+        FAILED = 'FAILED', 'Fallida'
+        APPLIED = 'APPLIED', 'Aplicada'
+    
+    academic_year = models.CharField(
+        max_length=20,
+        verbose_name='Año Académico'
+    )
+    semester = models.PositiveIntegerField(
+        choices=[(1, 'Primer Semestre'), (2, 'Segundo Semestre')],
+        verbose_name='Semestre'
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name='Estado'
+    )
+    # Actividades a cubrir, profesores candidatos y opciones del reparto
+    parameters = models.JSONField(
+        default=dict,
+        verbose_name='Parámetros'
+    )
+    # Propuesta: asignaciones, actividades sin cubrir y estadísticas
+    result = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='Resultado'
+    )
+    error = models.TextField(
+        blank=True,
+        verbose_name='Error'
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='planning_runs',
+        verbose_name='Creada por'
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Fecha de creación'
+    )
+    started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Inicio'
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Fin'
+    )
+    applied_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Fecha de aplicación'
+    )
+    
+    class Meta:
+        verbose_name = 'Planificación automática'
+        verbose_name_plural = 'Planificaciones automáticas'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_by', '-created_at'], name='planning_user_created_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.academic_year}/{self.semester} - {self.get_status_display()}"
@@ -0,0 +1,216 @@
+"""
+Construcción del problema de reparto a partir de la base de datos y
+traducción de la solución a asignaciones.
+
+Los datos se cargan con un número fijo de consultas (asignaturas, profesores,
+carga previa, disciplinas impartidas antes y actividades ya cubiertas); los
+candidatos se calculan una vez por cada par (asignatura, tipo de actividad).
+
+Un profesor es candidato para una actividad si:
+
+- está activo y en la lista de profesores indicada (si la hay);
+- su categoría puede impartir ese tipo de actividad
+  (``PLANNING_TYPE_CATEGORIES``);
+- con ``respect_specialty``, ya ha impartido alguna asignatura de la
+  disciplina o su especialidad comparte una palabra con el nombre de la
+  disciplina (sin acentos ni mayúsculas).
+"""
+import math
+
+from django.conf import settings
+from django.db.models import Sum
+
+from academic.models import Faculty, Subject
+from assignments.conflicts import professor_hour_limit
+from assignments.models import Assignment
+from professors.models import Professor
+from search.index import search_terms
+from .solver import Slot, solve, utilization_stats
+
+
+# Divisor de la utilización de los profesores sin límite de horas configurado
+DEFAULT_SCALE_HOURS = 20
+# Palabras más cortas no cuentan al comparar especialidad y disciplina
+MIN_SPECIALTY_WORD = 4
+
+
+def _words(text):
+    return {word for word in search_terms(text or '') if len(word) >= MIN_SPECIALTY_WORD}
+
+
+def _expand_demands(demands):
+    """Una actividad por grupo: ``(subject, faculty, tipo, grupo, horas)``."""
+    for demand in demands:
+        for group in demand.get('groups') or [None]:
+            yield (
+                demand['subject'], demand['faculty'], demand['assignment_type'],
+                group, demand['hours_per_week'],
+            )
+
+
+def plan_semester(academic_year, semester, demands, professors=None, respect_specialty=True, time_limit=None):
+    """
+    Propone un reparto de ``demands`` entre los profesores activos. Devuelve
+    un diccionario serializable con la propuesta (``assignments``), las
+    actividades sin cubrir (``unassigned``), las que ya tenían asignación
+    (``covered``), la carga resultante de cada profesor (``loads``) y
+    estadísticas.
+    """
+    activities = list(_expand_demands(demands))
+    subject_ids = {activity[0] for activity in activities}
+    disciplines = {
+        pk: (discipline_id, _words(discipline_name))
+        for pk, discipline_id, discipline_name in Subject.objects.filter(pk__in=subject_ids).order_by().values_list(
+            'pk', 'discipline_id', 'discipline__name'
+        )
+    }
+
+    pool = Professor.objects.filter(is_active=True).order_by('pk')
+    if professors is not None:
+        pool = pool.filter(pk__in=professors)
+    pool = list(pool.values_list('pk', 'contract_type', 'category', 'specialty'))
+
+    base_hours = dict(
+        Assignment.objects.filter(
+            is_active=True, academic_year=academic_year, semester=semester
+        ).order_by().values_list('professor_id').annotate(total=Sum('hours_per_week'))
+    )
+    taught = set()
+    if respect_specialty:
+        taught = set(
+            Assignment.objects.order_by().values_list('professor_id', 'subject__discipline_id').distinct()
+        )
+    covered_keys = set(
+        Assignment.objects.filter(
+            is_active=True, academic_year=academic_year, semester=semester, subject_id__in=subject_ids
+        ).order_by().values_list('subject_id', 'group', 'assignment_type')
+    )
+
+    type_categories = settings.PLANNING_TYPE_CATEGORIES
+    specialties = [_words(specialty) for _, _, _, specialty in pool]
+    candidates = {}
+
+    def eligible_for(subject_id, assignment_type):
+        key = (subject_id, assignment_type)
+        if key not in candidates:
+            discipline_id, discipline_words = disciplines[subject_id]
+            categories = type_categories.get(assignment_type)
+            eligible = tuple(
+                index for index, (pk, _, category, _) in enumerate(pool)
+                if (categories is None or category in categories)
+                and (
+                    not respect_specialty
+                    or (pk, discipline_id) in taught
+                    or discipline_words & specialties[index]
+                )
+            )
+            candidates[key] = Slot(0, eligible, frozenset(eligible))
+        return candidates[key]
+
+    slots, open_activities, covered = [], [], []
+    for activity in activities:
+        subject_id, faculty_id, assignment_type, group, hours = activity
+        if subject_id not in disciplines:
+            continue
+        if (subject_id, group, assignment_type) in covered_keys:
+            covered.append(activity)
+            continue
+        shared = eligible_for(subject_id, assignment_type)
+        slots.append(shared._replace(hours=hours))
+        open_activities.append(activity)
+
+    limits = [professor_hour_limit(contract_type, category) for _, contract_type, category, _ in pool]
+    base = [base_hours.get(pk, 0) for pk, *_ in pool]
+    capacity = [math.inf if limit is None else limit for limit in limits]
+    scale = [limit or DEFAULT_SCALE_HOURS for limit in limits]
+    solution = solve(slots, base, capacity, scale, time_limit=time_limit)
+
+    fields = ('subject', 'faculty', 'assignment_type', 'group', 'hours_per_week')
+    assignments, unassigned = [], []
+    for slot, activity, owner in zip(slots, open_activities, solution.owner):
+        row = dict(zip(fields, activity))
+        if owner is None:
+            row['reason'] = 'no_capacity' if slot.eligible else 'no_candidates'
+            unassigned.append(row)
+        else:
+            assignments.append({'professor': pool[owner][0], **row})
+
+    # Utilización sobre los profesores que podían recibir alguna actividad
+    involved = sorted({index for slot in slots for index in slot.eligible})
+    loads = [
+        {
+            'professor': pool[index][0],
+            'base_hours': base[index],
+            'planned_hours': solution.load[index] - base[index],
+            'limit': limits[index],
+        }
+        for index in involved if solution.load[index] != base[index]
+    ]
+    return {
+        'assignments': assignments,
+        'unassigned': unassigned,
+        'covered': [dict(zip(fields, activity)) for activity in covered],
+        'loads': loads,
+        'stats': {
+            'activities': len(activities),
+            'assigned': len(assignments),
+            'unassigned': len(unassigned),
+            'covered': len(covered),
+            'candidates': len(involved),
+            'utilization': utilization_stats(
+                [solution.load[index] for index in involved], [scale[index] for index in involved]
+            ),
+            'greedy_cost': round(solution.greedy_cost, 4),
+            'cost': round(solution.cost, 4),
+            'rounds': solution.rounds,
+            'elapsed_ms': round(solution.elapsed * 1000, 1),
+        },
+    }
+
+
+def describe_plan(result):
+    """Añade nombres de profesor, asignatura y facultad a la propuesta (tres consultas)."""
+    rows = [*result.get('assignments', []), *result.get('unassigned', []), *result.get('covered', [])]
+    loads = result.get('loads', [])
+    professor_ids = {row['professor'] for row in [*rows, *loads] if 'professor' in row}
+    names = {
+        'professor': {
+            pk: f'{first_name} {last_name}'
+            for pk, first_name, last_name in Professor.objects.filter(pk__in=professor_ids).values_list(
+                'pk', 'first_name', 'last_name'
+            )
+        },
+        'subject': dict(Subject.objects.filter(pk__in={row['subject'] for row in rows}).values_list('pk', 'name')),
+        'faculty': dict(Faculty.objects.filter(pk__in={row['faculty'] for row in rows}).values_list('pk', 'name')),
+    }
+
+    def named(row):
+        return {
+            **row,
+            **{f'{field}_name': names[field].get(row[field]) for field in names if field in row},
+        }
+
+    return {
+        'assignments': [named(row) for row in result.get('assignments', [])],
+        'unassigned': [named(row) for row in result.get('unassigned', [])],
+        'covered': [named(row) for row in result.get('covered', [])],
+        'loads': [named(row) for row in loads],
+        'stats': result.get('stats', {}),
+    }
+
+
+def plan_to_bulk(run):
+    """Filas de ``create`` para ``BulkAssignmentOperation`` con la propuesta de ``run``."""
+    return [
+        {
+            'professor_id': row['professor'],
+            'subject_id': row['subject'],
+            'faculty_id': row['faculty'],
+            'assignment_type': row['assignment_type'],
+            'group': row['group'],
+            'hours_per_week': row['hours_per_week'],
+            'academic_year': run.academic_year,
+            'semester': run.semester,
+        }
+        for row in run.result.get('assignments', [])
+    ]
@@ -0,0 +1,90 @@
+from rest_framework import serializers
+
+from academic.models import Faculty, Subject
+from assignments.models import Assignment
+from users.scope import get_user_scope
+from .models import PlanningRun
+
+
+class PlanningDemandSerializer(serializers.Serializer):
+    """Actividad a cubrir: una asignatura, un tipo de actividad y sus grupos."""
+    subject = serializers.IntegerField(min_value=1)
+    faculty = serializers.IntegerField(min_value=1)
+    assignment_type = serializers.ChoiceField(choices=Assignment.AssignmentType.choices)
+    hours_per_week = serializers.IntegerField(min_value=1)
+    groups = serializers.ListField(
+        child=serializers.CharField(max_length=50), required=False, default=list
+    )
+
+    def validate_groups(self, value):
+        if len(value) != len(set(value)):
+            raise serializers.ValidationError('La lista contiene grupos repetidos.')
+        return value
+
+
+class PlanningRunCreateSerializer(serializers.ModelSerializer):
+    """
+    Solicitud de reparto automático. Las asignaturas y facultades se validan
+    en bloque, con una consulta por modelo.
+    """
+    demands = PlanningDemandSerializer(many=True, allow_empty=False, max_length=5000)
+    professors = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False, allow_empty=False,
+        help_text='Profesores candidatos (por defecto, todos los activos)'
+    )
+    respect_specialty = serializers.BooleanField(default=True)
+
+    class Meta:
+        model = PlanningRun
+        fields = ['academic_year', 'semester', 'demands', 'professors', 'respect_specialty']
+
+    def validate_demands(self, value):
+        keys = [(item['subject'], item['assignment_type'], group)
+                for item in value for group in item['groups'] or [None]]
+        if len(keys) != len(set(keys)):
+            raise serializers.ValidationError('Una actividad aparece más de una vez.')
+
+        for attname, model, label in (('subject', Subject, 'asignatura'), ('faculty', Faculty, 'facultad')):
+            requested = {item[attname] for item in value}
+            existing = set(model.objects.filter(pk__in=requested, is_active=True).values_list('pk', flat=True))
+            missing = sorted(requested - existing)
+            if missing:
+                raise serializers.ValidationError(f'No existe {label} activa con id {missing[0]}.')
+
+        user = self.context['request'].user
+        if user.is_jefe_disciplina:
+            outside = {item['subject'] for item in value} - get_user_scope(user).subject_ids
+            if outside:
+                raise serializers.ValidationError(
+                    f'La asignatura {min(outside)} no pertenece a sus disciplinas.'
+                )
+        return value
+
+    def create(self, validated_data):
+        parameters = {
+            'demands': validated_data.pop('demands'),
+            'respect_specialty': validated_data.pop('respect_specialty'),
+        }
+        if 'professors' in validated_data:
+            parameters['professors'] = validated_data.pop('professors')
+        return PlanningRun.objects.create(
+            parameters=parameters, created_by=self.context['request'].user, **validated_data
+        )
+
+
+class PlanningRunSerializer(serializers.ModelSerializer):
+    """Estado de una planificación y resumen de su resultado."""
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    stats = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PlanningRun
+        fields = [
+            'id', 'academic_year', 'semester', 'status', 'status_display',
+            'parameters', 'stats', 'error', 'created_at', 'started_at',
+            'finished_at', 'applied_at'
+        ]
+        read_only_fields = fields
+
+    def get_stats(self, obj):
+        return obj.result.get('stats')
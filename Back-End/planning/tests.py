@@ -0,0 +1,139 @@
+import math
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from users.models import User
+from academic.models import Faculty, Discipline, Subject
+from assignments.models import Assignment
+from professors.models import Professor
+from .models import PlanningRun
+from .solver import Slot, solve
+
+
+class SolverTests(TestCase):
+
+    def test_local_search_balances_what_greedy_cannot(self):
+        both = (0, 1)
+        slots = [Slot(hours, both, frozenset(both)) for hours in (3, 3, 2, 2, 2)]
+        # El voraz reparte 3+2+2 / 3+2; solo un intercambio llega a 6 / 6
+        solution = solve(slots, base=[0, 0], capacity=[math.inf, math.inf], scale=[10, 10])
+        self.assertEqual(solution.load, [6, 6])
+        self.assertLess(solution.cost, solution.greedy_cost)
+
+    def test_capacity_is_never_exceeded(self):
+        only_first = (0,)
+        slots = [Slot(2, only_first, frozenset(only_first)) for _ in range(3)]
+        solution = solve(slots, base=[1, 0], capacity=[5, 20], scale=[10, 10])
+        self.assertEqual(solution.load[0], 5)
+        self.assertEqual(solution.owner.count(None), 1)
+
+
+class PlanningRunTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vicedecano = User.objects.create_user(
+            username='vicedecano', email='vicedecano@uci.cu',
+            password='123456', role=User.Role.VICEDECANO
+        )
+        cls.jefe = User.objects.create_user(
+            username='jefe', email='jefe@uci.cu',
+            password='123456', role=User.Role.JEFE_DISCIPLINA
+        )
+        cls.faculty = Faculty.objects.create(name='Facultad 1', code='F1')
+        mathematics = Discipline.objects.create(name='Matemática', code='MAT', head=cls.jefe)
+        physics = Discipline.objects.create(name='Física', code='FIS')
+        cls.algebra = Subject.objects.create(name='Álgebra', code='ALG', discipline=mathematics, hours_per_week=20)
+        cls.optics = Subject.objects.create(name='Óptica', code='OPT', discipline=physics)
+        # Instructora con especialidad afín: no puede dar conferencias
+        cls.ana = Professor.objects.create(
+            first_name='Ana', last_name='Pérez', email='ana@uci.cu', identification='00000000001',
+            category=Professor.Category.INSTRUCTOR, specialty='Matemática aplicada'
+        )
+        # Titular (límite 16 h) que ya impartió Matemática otro curso
+        cls.luis = Professor.objects.create(
+            first_name='Luis', last_name='Gómez', email='luis@uci.cu', identification='00000000002',
+            category=Professor.Category.TITULAR
+        )
+        Assignment.objects.create(
+            professor=cls.luis, subject=cls.algebra, faculty=cls.faculty,
+            academic_year='2024-2025', semester=1, hours_per_week=4
+        )
+        # Sin relación con Matemática
+        Professor.objects.create(
+            first_name='Eva', last_name='Ruiz', email='eva@uci.cu', identification='00000000003',
+            category=Professor.Category.ASISTENTE, specialty='Electrónica'
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.vicedecano)
+
+    def demand(self, subject, assignment_type, groups, hours=4):
+        return {
+            'subject': subject.id, 'faculty': self.faculty.id,
+            'assignment_type': assignment_type, 'hours_per_week': hours, 'groups': groups,
+        }
+
+    def plan(self, *demands, status_code=202):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/planning-runs/', {
+                'academic_year': '2025-2026', 'semester': 1, 'demands': list(demands),
+            }, format='json')
+        self.assertEqual(response.status_code, status_code, response.content)
+        return response.json()
+
+    def test_plan_respects_category_and_specialty_and_balances_load(self):
+        run = self.plan(
+            self.demand(self.algebra, 'LECTURE', ['A']),
+            self.demand(self.algebra, 'PRACTICAL', ['A', 'B', 'C', 'D']),
+        )
+        self.assertEqual(run['status'], PlanningRun.Status.PENDING)
+        self.assertEqual(self.client.get(f"/api/planning-runs/{run['id']}/").json()['status'], 'DONE')
+
+        preview = self.client.get(f"/api/planning-runs/{run['id']}/preview/").json()
+        lecture = [row for row in preview['assignments'] if row['assignment_type'] == 'LECTURE']
+        self.assertEqual([row['professor_name'] for row in lecture], ['Luis Gómez'])
+        # 20 h entre Ana (límite 20) y Luis (16): 12/20 y 8/16 es el reparto más parejo
+        loads = {row['professor_name']: row['planned_hours'] for row in preview['loads']}
+        self.assertEqual(loads, {'Ana Pérez': 12, 'Luis Gómez': 8})
+        self.assertEqual(preview['stats']['unassigned'], 0)
+
+    def test_covered_and_uncoverable_activities_are_reported(self):
+        Assignment.objects.create(
+            professor=self.ana, subject=self.algebra, faculty=self.faculty,
+            academic_year='2025-2026', semester=1, hours_per_week=4,
+            assignment_type='PRACTICAL', group='A'
+        )
+        run = self.plan(
+            self.demand(self.algebra, 'PRACTICAL', ['A', 'B']),
+            self.demand(self.optics, 'LAB', []),
+        )
+        preview = self.client.get(f"/api/planning-runs/{run['id']}/preview/").json()
+        self.assertEqual([row['group'] for row in preview['covered']], ['A'])
+        self.assertEqual([row['group'] for row in preview['assignments']], ['B'])
+        self.assertEqual(
+            [(row['subject_name'], row['reason']) for row in preview['unassigned']],
+            [('Óptica', 'no_candidates')]
+        )
+
+    def test_apply_creates_assignments_once(self):
+        run = self.plan(self.demand(self.algebra, 'PRACTICAL', ['A', 'B']))
+        response = self.client.post(f"/api/planning-runs/{run['id']}/apply/")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(len(response.json()['created']), 2)
+        self.assertEqual(
+            Assignment.objects.filter(academic_year='2025-2026', assigned_by=self.vicedecano).count(), 2
+        )
+        self.assertEqual(PlanningRun.objects.get(pk=run['id']).status, PlanningRun.Status.APPLIED)
+
+        response = self.client.post(f"/api/planning-runs/{run['id']}/apply/")
+        self.assertEqual(response.status_code, 409)
+
+    def test_jefe_only_plans_own_subjects_and_sees_own_runs(self):
+        self.plan(self.demand(self.algebra, 'PRACTICAL', ['A']))
+        self.client.force_authenticate(self.jefe)
+        self.assertEqual(self.client.get('/api/planning-runs/').json(), [])
+        self.plan(self.demand(self.optics, 'LAB', ['A']), status_code=400)
+        self.plan(self.demand(self.algebra, 'LAB', ['A']))
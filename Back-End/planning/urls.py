@@ -0,0 +1,11 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+
+from .views import PlanningRunViewSet
+
+router = DefaultRouter()
+router.register(r'planning-runs', PlanningRunViewSet, basename='planning-run')
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
@@ -0,0 +1,127 @@
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from assignments.bulk import BulkAssignmentOperation
+from assignments.models import Assignment
+from jobs.queue import enqueue
+from users.permissions import IsNotBlocked, CanModifyAssignments
+from users.scope import get_user_scope
+from .models import PlanningRun
+from .plan import describe_plan, plan_to_bulk
+from .serializers import PlanningRunCreateSerializer, PlanningRunSerializer
+
+
+@extend_schema_view(
+    list=extend_schema(summary="Listar planificaciones", description="Planificaciones automáticas del usuario, de la más reciente a la más antigua.", tags=['Planning']),
+    retrieve=extend_schema(summary="Estado de una planificación", description="Estado (`PENDING`, `RUNNING`, `DONE`, `FAILED`, `APPLIED`) y estadísticas del reparto.", tags=['Planning']),
+)
+class PlanningRunViewSet(mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Reparto automático de la carga docente de un semestre: se crea la
+    planificación, se resuelve en segundo plano, se revisa la propuesta y,
+    si se acepta, se aplica como asignaciones.
+    """
+    queryset = PlanningRun.objects.all()
+    serializer_class = PlanningRunSerializer
+    permission_classes = [IsAuthenticated, IsNotBlocked, CanModifyAssignments]
+    filterset_fields = ['status', 'academic_year', 'semester']
+    ordering = ['-created_at']
+    cursor_ordering = ['-created_at', '-id']
+
+    def get_queryset(self):
+        return PlanningRun.objects.filter(created_by=self.request.user)
+
+    def get_serializer_class(self):
+        if self.action == 'create':
+            return PlanningRunCreateSerializer
+        return PlanningRunSerializer
+
+    @extend_schema(
+        summary="Crear planificación",
+        description=(
+            "Recibe las actividades a cubrir (asignatura, facultad, tipo, horas y grupos) de un "
+            "año académico y semestre y las reparte entre los profesores activos minimizando la "
+            "varianza de su utilización (carga / límite de horas), sin superar su límite, con las "
+            "categorías permitidas para cada tipo de actividad y, opcionalmente, su especialidad. "
+            "Se resuelve en la cola de trabajos (`run_jobs`): responde 202 y el estado se consulta en el detalle."
+        ),
+        tags=['Planning'],
+        responses={202: PlanningRunSerializer}
+    )
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        run = serializer.save()
+        enqueue('planning.solve', {'run': run.pk}, request.user)
+        return Response(PlanningRunSerializer(run).data, status=status.HTTP_202_ACCEPTED)
+
+    @extend_schema(
+        summary="Vista previa de la propuesta",
+        description=(
+            "Asignaciones propuestas, actividades sin cubrir (`no_candidates` o `no_capacity`), "
+            "actividades que ya tenían asignación y horas previas y planificadas de cada profesor."
+        ),
+        tags=['Planning'],
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=True, methods=['get'])
+    def preview(self, request, pk=None):
+        """Propuesta de una planificación terminada."""
+        run = self.get_object()
+        if run.status not in (PlanningRun.Status.DONE, PlanningRun.Status.APPLIED):
+            return Response(
+                {'error': f'La planificación está en estado {run.get_status_display()}.'},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response({'run': PlanningRunSerializer(run).data, **describe_plan(run.result)})
+
+    @extend_schema(
+        summary="Aplicar la propuesta",
+        description=(
+            "Crea las asignaciones propuestas como una operación masiva: se vuelven a validar "
+            "la unicidad, la sobrecarga y las coberturas duplicadas contra los datos actuales."
+        ),
+        tags=['Planning'],
+        request=None,
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=True, methods=['post'])
+    def apply(self, request, pk=None):
+        """Crear las asignaciones de una planificación terminada."""
+        run = self.get_object()
+        creates = plan_to_bulk(run)
+        if run.status != PlanningRun.Status.DONE or not creates:
+            return Response(
+                {'error': 'Solo se puede aplicar una planificación terminada con asignaciones propuestas.'},
+                status=status.HTTP_409_CONFLICT
+            )
+
+        queryset = Assignment.objects.all()
+        if request.user.is_jefe_disciplina:
+            queryset = queryset.filter(subject_id__in=get_user_scope(request.user).subject_ids)
+        operation = BulkAssignmentOperation(queryset, request.user, {'create': creates})
+        try:
+            with transaction.atomic():
+                # Marcarla primero evita aplicar dos veces la misma propuesta
+                claimed = PlanningRun.objects.filter(pk=run.pk, status=PlanningRun.Status.DONE).update(
+                    status=PlanningRun.Status.APPLIED, applied_at=timezone.now()
+                )
+                if not claimed:
+                    return Response(
+                        {'error': 'La planificación ya se aplicó.'},
+                        status=status.HTTP_409_CONFLICT
+                    )
+                operation.validate()
+                result = operation.apply()
+        except IntegrityError:
+            return Response(
+                {'error': 'La propuesta entra en conflicto con cambios concurrentes. Intente de nuevo.'},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(result)
@@ -2,6 +2,18 @@ from rest_framework import serializers
 from .models import Professor
 
 
+def get_active_assignments_list(obj):
+    """
+    Devuelve las asignaciones activas del profesor.
+    Usa las precargadas por la vista (``active_assignments``) si existen,
+    evitando una consulta por fila.
+    """
+    prefetched = getattr(obj, 'active_assignments', None)
+    if prefetched is not None:
+        return prefetched
+    return list(obj.get_active_assignments().select_related('subject', 'faculty'))
+
+
 class ProfessorSerializer(serializers.ModelSerializer):
     """Serializer completo para Profesores."""
     full_name = serializers.CharField(read_only=True)
@@ -31,17 +43,15 @@ class ProfessorSerializer(serializers.ModelSerializer):
         return obj.created_by.get_full_name() if obj.created_by else None
     
     def get_active_assignments_count(self, obj):
-        return obj.get_active_assignments().count()
+        return len(get_active_assignments_list(obj))
     
     def get_subjects_list(self, obj):
         """Obtiene las asignaturas asignadas al profesor desde sus assignments."""
-        assignments = obj.get_active_assignments().select_related('subject')
-        return list(set(a.subject.name for a in assignments))
+        return list(set(a.subject.name for a in get_active_assignments_list(obj)))
     
     def get_faculties_list(self, obj):
         """Obtiene las facultades donde el profesor tiene asignaciones."""
-        assignments = obj.get_active_assignments().select_related('faculty')
-        return list(set(a.faculty.name for a in assignments))
+        return list(set(a.faculty.name for a in get_active_assignments_list(obj)))
 
 
 class ProfessorCreateSerializer(serializers.ModelSerializer):
@@ -82,12 +92,10 @@ class ProfessorListSerializer(serializers.ModelSerializer):
         ]
     
     def get_subjects_list(self, obj):
-        assignments = obj.get_active_assignments().select_related('subject')
-        return list(set(a.subject.name for a in assignments))
+        return list(set(a.subject.name for a in get_active_assignments_list(obj)))
     
     def get_faculties_list(self, obj):
-        assignments = obj.get_active_assignments().select_related('faculty')
-        return list(set(a.faculty.name for a in assignments))
+        return list(set(a.faculty.name for a in get_active_assignments_list(obj)))
 
 
 class ProfessorExportSerializer(serializers.ModelSerializer):
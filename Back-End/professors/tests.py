@@ -1,3 +1,96 @@
-from django.test import TestCase
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from users.models import User
+from academic.models import Faculty, Discipline, Subject
+from assignments.models import Assignment
+from .models import Professor
+
+
+class ProfessorListQueryCountTests(TestCase):
+    """El listado de profesores debe costar un número fijo de consultas."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='director', email='director@uci.cu',
+            password='123456', role=User.Role.DIRECTOR
+        )
+        cls.faculty = Faculty.objects.create(name='Facultad 1', code='F1')
+        discipline = Discipline.objects.create(name='Matemática', code='MAT')
+        cls.subject = Subject.objects.create(name='Álgebra', code='ALG', discipline=discipline)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_professors(self, start, count):
+        for i in range(start, start + count):
+            professor = Professor.objects.create(
+                first_name=f'Nombre{i}', last_name=f'Apellido{i}',
+                email=f'profesor{i}@uci.cu', identification=f'{i:011d}'
+            )
+            Assignment.objects.create(
+                professor=professor, subject=self.subject, faculty=self.faculty,
+                academic_year='2025-2026', semester=1, group=f'G{i}'
+            )
+
+    def count_list_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get('/api/professors/')
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response.json()
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.create_professors(0, 2)
+        small_count, data = self.count_list_queries()
+        self.assertEqual(len(data), 2)
+
+        self.create_professors(2, 20)
+        large_count, data = self.count_list_queries()
+        self.assertEqual(len(data), 22)
+
+        self.assertEqual(small_count, large_count)
+
+    def test_list_includes_active_subjects_and_faculties(self):
+        self.create_professors(0, 1)
+        Assignment.objects.filter(professor__email='profesor0@uci.cu').update(is_active=False)
+        self.create_professors(1, 1)
+
+        _, data = self.count_list_queries()
+        by_email = {row['email']: row for row in data}
+        self.assertEqual(by_email['profesor0@uci.cu']['subjects_list'], [])
+        self.assertEqual(by_email['profesor1@uci.cu']['subjects_list'], ['Álgebra'])
+        self.assertEqual(by_email['profesor1@uci.cu']['faculties_list'], ['Facultad 1'])
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=True)
+class ProfessorResponseCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='director', email='director@uci.cu', password='123456',
+            role=User.Role.DIRECTOR, first_name='Eva', last_name='Ruiz'
+        )
+        cls.professor = Professor.objects.create(
+            first_name='Ana', last_name='Pérez', email='ana@uci.cu',
+            identification='00000000001', created_by=cls.user
+        )
+
+    def setUp(self):
+        for alias in ('default', 'responses'):
+            caches[alias].clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_creator_rename_invalidates_detail(self):
+        url = f'/api/professors/{self.professor.pk}/'
+        self.assertEqual(self.client.get(url).json()['created_by_name'], 'Eva Ruiz')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.last_name = 'Gómez'
+            self.user.save()
+        self.assertEqual(self.client.get(url).json()['created_by_name'], 'Eva Gómez')
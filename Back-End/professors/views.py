@@ -1,18 +1,34 @@
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
-from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
-from django.http import HttpResponse
+from django.db.models import Prefetch
 from drf_spectacular.utils import extend_schema, extend_schema_view
-import csv
 
 from .models import Professor
+from academic.models import Faculty, Subject
+from assignments.models import Assignment
 from .serializers import (
     ProfessorSerializer, ProfessorCreateSerializer,
     ProfessorListSerializer, ProfessorExportSerializer
 )
+from users.models import User
 from users.permissions import IsNotBlocked, CanAddProfessors, CanDownloadReports
+from core.exports import iter_values, streaming_csv_response
+from core.conditional import choices_response
+from core.response_cache import CachedResponseMixin
+from search.filters import FullTextSearchFilter
+
+
+# Columnas leídas con values_list() para la exportación CSV
+EXPORT_FIELDS = (
+    'first_name', 'last_name', 'email', 'phone', 'identification',
+    'category', 'scientific_degree', 'contract_type', 'specialty',
+    'years_of_experience',
+)
+CATEGORY_LABELS = dict(Professor.Category.choices)
+SCIENTIFIC_DEGREE_LABELS = dict(Professor.ScientificDegree.choices)
+CONTRACT_TYPE_LABELS = dict(Professor.ContractType.choices)
 
 
 @extend_schema_view(
@@ -23,17 +39,20 @@ from users.permissions import IsNotBlocked, CanAddProfessors, CanDownloadReports
     partial_update=extend_schema(summary="Actualizar profesor parcialmente", tags=['Professors']),
     destroy=extend_schema(summary="Eliminar profesor", description="Elimina un profesor.", tags=['Professors']),
 )
-class ProfessorViewSet(viewsets.ModelViewSet):
+class ProfessorViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestión de Profesores.
     """
     queryset = Professor.objects.all()
     permission_classes = [IsAuthenticated, IsNotBlocked]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter, FullTextSearchFilter]
     filterset_fields = ['is_active', 'category', 'scientific_degree', 'contract_type']
     search_fields = ['first_name', 'last_name', 'email', 'identification']
     ordering_fields = ['last_name', 'first_name', 'category', 'created_at']
     ordering = ['last_name', 'first_name']
+    cursor_ordering = ['last_name', 'first_name', 'id']
+    # Modelos que aparecen en las respuestas (asignaciones activas y created_by_name incluidos)
+    cache_models = (Professor, Assignment, Subject, Faculty, User)
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -47,6 +66,20 @@ class ProfessorViewSet(viewsets.ModelViewSet):
             self.permission_classes = [IsAuthenticated, IsNotBlocked, CanAddProfessors]
         return super().get_permissions()
     
+    def get_queryset(self):
+        queryset = Professor.objects.all()
+        # Precargar asignaciones activas con asignatura y facultad para que
+        # el listado cueste un número fijo de consultas
+        if self.action in ['list', 'retrieve']:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'assignments',
+                    queryset=Assignment.objects.filter(is_active=True).select_related('subject', 'faculty'),
+                    to_attr='active_assignments'
+                )
+            )
+        return queryset
+    
     @extend_schema(
         summary="Exportar profesores CSV",
         description="Descarga un archivo CSV con todos los profesores.",
@@ -58,59 +91,42 @@ class ProfessorViewSet(viewsets.ModelViewSet):
         """Exportar profesores a CSV."""
         queryset = self.filter_queryset(self.get_queryset())
         
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="profesores.csv"'
-        response.write('\ufeff')  # BOM para Excel
+        rows = (
+            [
+                row.first_name,
+                row.last_name,
+                row.email,
+                row.phone or '',
+                row.identification,
+                CATEGORY_LABELS.get(row.category, row.category),
+                SCIENTIFIC_DEGREE_LABELS.get(row.scientific_degree, row.scientific_degree),
+                CONTRACT_TYPE_LABELS.get(row.contract_type, row.contract_type),
+                row.specialty or '',
+                row.years_of_experience
+            ]
+            for row in iter_values(queryset, EXPORT_FIELDS)
+        )
         
-        writer = csv.writer(response)
-        writer.writerow([
+        return streaming_csv_response('profesores.csv', [
             'Nombre', 'Apellidos', 'Email', 'Teléfono', 'CI',
             'Categoría', 'Grado Científico', 'Tipo de Contrato',
             'Especialidad', 'Años de Experiencia'
-        ])
-        
-        for professor in queryset:
-            writer.writerow([
-                professor.first_name,
-                professor.last_name,
-                professor.email,
-                professor.phone or '',
-                professor.identification,
-                professor.get_category_display(),
-                professor.get_scientific_degree_display(),
-                professor.get_contract_type_display(),
-                professor.specialty or '',
-                professor.years_of_experience
-            ])
-        
-        return response
+        ], rows)
     
     @extend_schema(summary="Categorías docentes", description="Obtiene las opciones de categorías docentes.", tags=['Professors'])
     @action(detail=False, methods=['get'])
     def categories(self, request):
         """Obtener opciones de categorías."""
-        categories = [
-            {'value': choice[0], 'label': choice[1]}
-            for choice in Professor.Category.choices
-        ]
-        return Response(categories)
+        return choices_response(request, Professor.Category.choices)
     
     @extend_schema(summary="Grados científicos", description="Obtiene las opciones de grados científicos.", tags=['Professors'])
     @action(detail=False, methods=['get'])
     def scientific_degrees(self, request):
         """Obtener opciones de grados científicos."""
-        degrees = [
-            {'value': choice[0], 'label': choice[1]}
-            for choice in Professor.ScientificDegree.choices
-        ]
-        return Response(degrees)
+        return choices_response(request, Professor.ScientificDegree.choices)
     
     @extend_schema(summary="Tipos de contrato", description="Obtiene las opciones de tipos de contrato.", tags=['Professors'])
     @action(detail=False, methods=['get'])
     def contract_types(self, request):
         """Obtener opciones de tipos de contrato."""
-        types = [
-            {'value': choice[0], 'label': choice[1]}
-            for choice in Professor.ContractType.choices
-        ]
-        return Response(types)
+        return choices_response(request, Professor.ContractType.choices)
@@ -0,0 +1,125 @@
+"""
+Autocompletado de profesores, asignaturas y facultades para los formularios.
+
+Cada tipo tiene un índice en memoria del proceso: una lista ordenada de claves
+normalizadas (cada nombre a partir de cada una de sus palabras, más el código)
+sobre la que se busca el prefijo con ``bisect``. El índice se construye en la
+primera petición y se reconstruye cuando cambia la versión del modelo
+(``core.response_cache``) o, como mucho cada ``AUTOCOMPLETE_RECHECK_SECONDS``,
+el número de filas o el ``updated_at`` más reciente de la tabla. La versión
+solo la ven todos los workers con una caché compartida y no cubre los
+``update()``; la comprobación en la base de datos sí, con ese retraso máximo.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import NamedTuple
+
+from django.conf import settings
+
+from core.conditional import queryset_state
+from core.response_cache import get_model_versions
+from academic.models import Faculty, Subject
+from professors.models import Professor
+from .index import normalize
+
+
+class PrefixIndex:
+    """Lista ordenada de ``(clave, posición)`` con búsqueda por prefijo."""
+
+    def __init__(self, entries):
+        self.items = []
+        pairs = []
+        for texts, item in entries:
+            position = len(self.items)
+            self.items.append(item)
+            keys = set()
+            for text in texts:
+                words = normalize(text).split()
+                keys.update(' '.join(words[start:]) for start in range(len(words)))
+            pairs.extend((key, position) for key in keys)
+        pairs.sort()
+        self.keys = [key for key, _ in pairs]
+        self.positions = [position for _, position in pairs]
+
+    def search(self, prefix, limit, accept=None):
+        prefix = ' '.join(normalize(prefix).split())
+        results = []
+        seen = set()
+        for index in range(bisect_left(self.keys, prefix), len(self.keys)):
+            if not self.keys[index].startswith(prefix):
+                break
+            position = self.positions[index]
+            if position in seen:
+                continue
+            seen.add(position)
+            item = self.items[position]
+            if accept is None or accept(item):
+                results.append(item)
+                if len(results) == limit:
+                    break
+        return results
+
+
+def _professor_entries():
+    rows = Professor.objects.filter(is_active=True).order_by().values_list(
+        'pk', 'first_name', 'last_name', 'email'
+    )
+    for pk, first_name, last_name, email in rows:
+        name = f'{first_name} {last_name}'
+        yield (name,), {'id': pk, 'name': name, 'email': email}
+
+
+def _subject_entries():
+    rows = Subject.objects.filter(is_active=True).order_by().values_list(
+        'pk', 'name', 'code', 'discipline_id'
+    )
+    for pk, name, code, discipline_id in rows:
+        yield (name, code), {'id': pk, 'name': name, 'code': code, 'discipline': discipline_id}
+
+
+def _faculty_entries():
+    rows = Faculty.objects.filter(is_active=True).order_by().values_list('pk', 'name', 'code')
+    for pk, name, code in rows:
+        yield (name, code), {'id': pk, 'name': name, 'code': code}
+
+
+# tipo -> (modelo cuya versión invalida el índice, generador de entradas)
+AUTOCOMPLETE_TYPES = {
+    'professor': (Professor, _professor_entries),
+    'subject': (Subject, _subject_entries),
+    'faculty': (Faculty, _faculty_entries),
+}
+
+class _CachedIndex(NamedTuple):
+    version: object
+    # ``queryset_state`` de la tabla y cuándo se comprobó (``time.monotonic``)
+    state: tuple
+    checked_at: float
+    index: PrefixIndex
+
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def get_index(kind):
+    """Índice de ``kind``, reconstruido si el modelo cambió desde la última vez."""
+    model, entries = AUTOCOMPLETE_TYPES[kind]
+    [version] = get_model_versions([model])
+    cached = _indexes.get(kind)
+    if (cached is not None and cached.version == version
+            and time.monotonic() - cached.checked_at < settings.AUTOCOMPLETE_RECHECK_SECONDS):
+        return cached.index
+    with _lock:
+        cached = _indexes.get(kind)
+        checked_at = time.monotonic()
+        # El estado se lee antes que las filas: un cambio entre ambas lecturas
+        # solo provoca una reconstrucción de más en la siguiente comprobación
+        state = queryset_state(model.objects.all())
+        if cached is None or cached.version != version or cached.state != state:
+            index = PrefixIndex(entries())
+        else:
+            index = cached.index
+        _indexes[kind] = _CachedIndex(version, state, checked_at, index)
+    return index
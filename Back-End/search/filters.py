@@ -0,0 +1,34 @@
+from django.conf import settings
+from rest_framework.filters import BaseFilterBackend
+
+from .index import order_by_ids, search
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    Filtra con ``?q=`` usando el índice de texto completo. Sin ``?ordering=``
+    los resultados salen ordenados por relevancia, por lo que debe ir después
+    de ``OrderingFilter`` en ``filter_backends``.
+    """
+    search_param = 'q'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').strip()
+        if not query:
+            return queryset
+
+        # El límite se aplica después del alcance y los filtros de la vista
+        ids = search(queryset.model, query, limit=settings.SEARCH_MAX_RESULTS, within=queryset)
+        queryset = queryset.filter(pk__in=ids)
+        if ids and not request.query_params.get('ordering'):
+            queryset = order_by_ids(queryset, ids)
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [{
+            'name': self.search_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Búsqueda de texto completo (sin acentos, por prefijo, ordenada por relevancia)',
+            'schema': {'type': 'string'},
+        }]
@@ -0,0 +1,157 @@
+"""
+Búsqueda de texto completo sobre profesores, asignaturas, comentarios y
+asignaciones.
+
+Cada fila buscable tiene un ``SearchDocument`` con el texto de sus campos de
+búsqueda normalizado (minúsculas y sin acentos, de modo que «Pena» encuentra
+«Peña»). Las señales lo mantienen al día; las operaciones masivas llaman a
+``update_search_index``. La consulta usa el índice del motor (FTS5 en SQLite,
+``tsvector`` en PostgreSQL) y devuelve los ids ordenados por relevancia.
+"""
+import re
+import unicodedata
+
+from django.apps import apps as global_apps
+from django.db import connection, transaction
+from django.db.models import Case, IntegerField, When
+from django.db.models.expressions import RawSQL
+
+
+# Campos cuyo texto se indexa para cada modelo buscable
+SEARCH_FIELDS = {
+    'professors.Professor': ('first_name', 'last_name', 'email', 'identification', 'specialty'),
+    'academic.Subject': ('name', 'code'),
+    'comments.Comment': ('subject', 'message'),
+    'assignments.Assignment': (
+        'professor__first_name', 'professor__last_name',
+        'subject__name', 'subject__code', 'faculty__name',
+    ),
+}
+
+# Modelos cuyo cambio altera el texto indexado de otros: {modelo: [(dependiente, campo)]}
+DEPENDENTS = {
+    'professors.Professor': [('assignments.Assignment', 'professor')],
+    'academic.Subject': [('assignments.Assignment', 'subject')],
+    'academic.Faculty': [('assignments.Assignment', 'faculty')],
+}
+
+FTS_TABLE = 'search_searchdocument_fts'
+
+
+def normalize(text):
+    """Minúsculas y sin diacríticos."""
+    decomposed = unicodedata.normalize('NFKD', str(text))
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+def search_terms(query):
+    return re.findall(r'\w+', normalize(query))
+
+
+def _documents(apps, label, pks=None):
+    SearchDocument = apps.get_model('search', 'SearchDocument')
+    queryset = apps.get_model(label).objects.order_by()
+    if pks is not None:
+        queryset = queryset.filter(pk__in=pks)
+    model = label.lower()
+    for pk, *values in queryset.values_list('pk', *SEARCH_FIELDS[label]).iterator(chunk_size=2000):
+        yield SearchDocument(
+            model=model, object_id=pk,
+            body=' '.join(normalize(value) for value in values if value not in (None, ''))
+        )
+
+
+@transaction.atomic
+def update_search_index(model, pks, apps=global_apps):
+    """(Re)indexa las filas ``pks`` de ``model`` y sus dependientes."""
+    pks = list(pks)
+    if not pks:
+        return
+    label = model._meta.label
+    if label in SEARCH_FIELDS:
+        SearchDocument = apps.get_model('search', 'SearchDocument')
+        remove_from_search_index(model, pks, apps=apps)
+        SearchDocument.objects.bulk_create(_documents(apps, label, pks), batch_size=500)
+    for dependent, field in DEPENDENTS.get(label, ()):
+        dependent_model = apps.get_model(dependent)
+        dependent_pks = dependent_model.objects.filter(**{f'{field}__in': pks}).values_list('pk', flat=True)
+        update_search_index(dependent_model, dependent_pks, apps=apps)
+
+
+def remove_from_search_index(model, pks, apps=global_apps):
+    apps.get_model('search', 'SearchDocument').objects.filter(
+        model=model._meta.label_lower, object_id__in=list(pks)
+    ).delete()
+
+
+@transaction.atomic
+def rebuild_search_index(apps=global_apps):
+    """Regenera el índice completo. Devuelve el número de documentos."""
+    SearchDocument = apps.get_model('search', 'SearchDocument')
+    SearchDocument.objects.all().delete()
+    total = 0
+    for label in SEARCH_FIELDS:
+        total += len(SearchDocument.objects.bulk_create(_documents(apps, label), batch_size=500))
+    return total
+
+
+def search(model, query, limit, within=None):
+    """
+    Ids de ``model`` que contienen todos los términos de ``query`` (por
+    prefijo), del más al menos relevante. Con ``within`` (un queryset de
+    ``model``) solo cuentan sus filas, antes de aplicar ``limit``.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+    from .models import SearchDocument
+    table = SearchDocument._meta.db_table
+    label = model._meta.label_lower
+
+    within_sql, within_params = '', []
+    if within is not None and connection.vendor in ('sqlite', 'postgresql'):
+        subquery, within_params = within.order_by().values('pk').query.sql_with_params()
+        within_sql = f' AND d.object_id IN ({subquery})'
+
+    if connection.vendor == 'sqlite':
+        # bm25 con peso 0 para la columna del modelo: solo puntúa el texto
+        sql = (
+            f'SELECT d.object_id FROM {FTS_TABLE} f JOIN {table} d ON d.id = f.rowid '
+            f'WHERE {FTS_TABLE} MATCH %s{within_sql} ORDER BY bm25({FTS_TABLE}, 0.0, 1.0) LIMIT %s'
+        )
+        match = ' '.join(f'"{term}"*' for term in terms)
+        params = [f'model : "{label}" AND body : ({match})', *within_params, limit]
+    elif connection.vendor == 'postgresql':
+        sql = (
+            f"SELECT d.object_id FROM {table} d, to_tsquery('simple', %s) query "
+            f"WHERE d.model = %s AND d.document @@ query{within_sql} "
+            f"ORDER BY ts_rank(d.document, query) DESC LIMIT %s"
+        )
+        params = [' & '.join(f'{term}:*' for term in terms), label, *within_params, limit]
+    else:
+        # Sin índice de texto completo: subcadenas sobre una sola tabla
+        queryset = SearchDocument.objects.filter(model=label)
+        if within is not None:
+            queryset = queryset.filter(object_id__in=within.order_by().values('pk'))
+        for term in terms:
+            queryset = queryset.filter(body__contains=term)
+        return list(queryset.values_list('object_id', flat=True)[:limit])
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def order_by_ids(queryset, ids):
+    """Ordena ``queryset`` según la posición de cada fila en ``ids``."""
+    opts = queryset.model._meta
+    column = f'{connection.ops.quote_name(opts.db_table)}.{connection.ops.quote_name(opts.pk.column)}'
+    if connection.vendor == 'sqlite':
+        position = RawSQL(f"instr(%s, ',' || {column} || ',')", [f",{','.join(map(str, ids))},"])
+    elif connection.vendor == 'postgresql':
+        position = RawSQL(f'array_position(%s::bigint[], {column})', [list(ids)])
+    else:
+        position = Case(
+            *[When(pk=pk, then=index) for index, pk in enumerate(ids)], output_field=IntegerField()
+        )
+    return queryset.order_by(position)
@@ -0,0 +1,11 @@
+from jobs.registry import register
+from .index import rebuild_search_index
+
+
+@register(
+    'search.rebuild_index',
+    permission=lambda user: user.is_admin,
+    description='Reconstruye el índice de búsqueda de texto completo.'
+)
+def rebuild_index(job):
+    return {'documents': rebuild_search_index()}
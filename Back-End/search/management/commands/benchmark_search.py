@@ -0,0 +1,132 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, reset_queries, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+
+from academic.models import Discipline, Faculty, Subject
+from assignments.models import Assignment
+from comments.models import Comment
+from professors.models import Professor
+from search.index import rebuild_search_index
+from users.models import User
+
+
+class _Rollback(Exception):
+    """Fuerza el rollback de la transacción del benchmark."""
+
+
+FIRST_NAMES = ['José', 'María', 'Ángel', 'Lucía', 'Raúl', 'Inés', 'Andrés', 'Begoña', 'Iván', 'Sofía']
+# 100 apellidos sintéticos: cada uno aparece en ~1 % de las filas
+LAST_NAMES = [
+    prefix + suffix
+    for prefix in ['Fer', 'Gon', 'Ro', 'Mar', 'Ibá', 'Nú', 'Ló', 'Ví', 'Sán', 'Ca']
+    for suffix in ['nández', 'zález', 'dríguez', 'tínez', 'ñez', 'pez', 'llar', 'rro', 'chez', 'bral']
+]
+WORDS = ['álgebra', 'cálculo', 'física', 'química', 'programación', 'estadística', 'lógica', 'redes', 'señales', 'óptica']
+
+
+class Command(BaseCommand):
+    help = (
+        'Compara ?search= (SearchFilter, icontains) con ?q= (índice de texto completo) '
+        'en profesores, asignaciones y comentarios. Los datos sintéticos se crean en '
+        'una transacción que se revierte.'
+    )
+
+    ENDPOINTS = ['/api/professors/', '/api/assignments/', '/api/comments/']
+
+    def add_arguments(self, parser):
+        parser.add_argument('--professors', type=int, default=5000, help='Profesores sintéticos')
+        parser.add_argument('--assignments', type=int, default=20000, help='Asignaciones sintéticas')
+        parser.add_argument('--comments', type=int, default=20000, help='Comentarios sintéticos')
+        parser.add_argument('--repeat', type=int, default=20, help='Peticiones por medición')
+        # Sin acentos para que ambos filtros devuelvan las mismas filas
+        parser.add_argument('--term', default='carro', help='Término buscado')
+
+    def handle(self, *args, **options):
+        results = []
+        try:
+            # Sin límite de resultados para comparar las mismas filas
+            with transaction.atomic(), override_settings(RESPONSE_CACHE_ENABLED=False, SEARCH_MAX_RESULTS=10 ** 6):
+                user = self.seed(options)
+                self.stdout.write(self.style.HTTP_INFO("Indexando..."))
+                start = time.perf_counter()
+                total = rebuild_search_index()
+                self.stdout.write(f"  {total} documentos en {time.perf_counter() - start:.2f} s")
+
+                client = APIClient()
+                client.force_authenticate(user)
+                for url in self.ENDPOINTS:
+                    for param in ('search', 'q'):
+                        params = {param: options['term']}
+                        results.append((
+                            url, param,
+                            *self.measure(client, url, params, options['repeat']),
+                            # Primera página: el coste es casi solo el del filtro
+                            self.measure(client, url, {**params, 'page_size': 20}, options['repeat'])[0],
+                        ))
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        self.stdout.write("\n" + "=" * 60)
+        self.stdout.write(self.style.SUCCESS(f"Resultados para '{options['term']}'"))
+        self.stdout.write("=" * 60)
+        for url, param, avg_ms, rows, queries, page_ms in results:
+            self.stdout.write(
+                f"  {url:<20} ?{param:<7} listado: {avg_ms:7.1f} ms   página de 20: {page_ms:6.1f} ms   "
+                f"filas: {rows:5}   consultas: {queries}"
+            )
+        self.stdout.write("\n" + self.style.WARNING("Transacción revertida: la base de datos no se modificó."))
+
+    def measure(self, client, url, params, repeat):
+        reset_queries()
+        with CaptureQueriesContext(connection) as queries:
+            data = client.get(url, params).json()
+        rows = len(data['results']) if isinstance(data, dict) else len(data)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            client.get(url, params)
+        return (time.perf_counter() - start) * 1000 / repeat, rows, len(queries.captured_queries)
+
+    def seed(self, options):
+        rng = random.Random(42)
+        self.stdout.write(self.style.HTTP_INFO("Creando datos sintéticos..."))
+        user = User.objects.create_user(
+            username='bench_search', email='bench_search@uci.cu',
+            password='bench', role=User.Role.VICEDECANO
+        )
+        faculties = Faculty.objects.bulk_create([
+            Faculty(name=f'Bench Facultad {i}', code=f'BF{i}') for i in range(10)
+        ])
+        discipline = Discipline.objects.create(name='Bench Disciplina', code='BDIS')
+        subjects = Subject.objects.bulk_create([
+            Subject(name=f'{WORDS[i % len(WORDS)].capitalize()} {i}', code=f'BS{i}', discipline=discipline)
+            for i in range(200)
+        ])
+        professors = Professor.objects.bulk_create([
+            Professor(
+                first_name=rng.choice(FIRST_NAMES),
+                last_name=f'{rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}',
+                email=f'bench_search_{i}@uci.cu', identification=f'9{i:010d}',
+            )
+            for i in range(options['professors'])
+        ])
+        Assignment.objects.bulk_create([
+            Assignment(
+                professor=professors[i % len(professors)], subject=rng.choice(subjects),
+                faculty=rng.choice(faculties), academic_year='2025-2026',
+                semester=1, hours_per_week=4, group=f'G{i}'
+            )
+            for i in range(options['assignments'])
+        ])
+        Comment.objects.bulk_create([
+            Comment(
+                author=user, subject=f'Cambio en {rng.choice(WORDS)}',
+                message=' '.join(rng.choice(WORDS) for _ in range(20)) + f' ({rng.choice(LAST_NAMES)})'
+            )
+            for _ in range(options['comments'])
+        ])
+        return user
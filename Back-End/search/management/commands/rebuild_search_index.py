@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from search.index import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el índice de búsqueda de texto completo (?q=)'
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.HTTP_INFO("Reconstruyendo índice de búsqueda..."))
+        total = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f"✓ {total} documento(s) indexados"))
@@ -0,0 +1,92 @@
+from django.db import migrations
+
+
+# SQLite: tabla FTS5 de contenido externo sincronizada por triggers. El modelo
+# también se indexa para filtrar por él dentro de la propia consulta MATCH.
+SQLITE_SQL = [
+    """
+    CREATE VIRTUAL TABLE search_searchdocument_fts USING fts5(
+        model, body, content='search_searchdocument', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER search_searchdocument_ai AFTER INSERT ON search_searchdocument BEGIN
+        INSERT INTO search_searchdocument_fts(rowid, model, body) VALUES (new.id, new.model, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_searchdocument_ad AFTER DELETE ON search_searchdocument BEGIN
+        INSERT INTO search_searchdocument_fts(search_searchdocument_fts, rowid, model, body)
+        VALUES ('delete', old.id, old.model, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_searchdocument_au AFTER UPDATE ON search_searchdocument BEGIN
+        INSERT INTO search_searchdocument_fts(search_searchdocument_fts, rowid, model, body)
+        VALUES ('delete', old.id, old.model, old.body);
+        INSERT INTO search_searchdocument_fts(rowid, model, body) VALUES (new.id, new.model, new.body);
+    END
+    """,
+]
+SQLITE_REVERSE_SQL = [
+    'DROP TRIGGER IF EXISTS search_searchdocument_au',
+    'DROP TRIGGER IF EXISTS search_searchdocument_ad',
+    'DROP TRIGGER IF EXISTS search_searchdocument_ai',
+    'DROP TABLE IF EXISTS search_searchdocument_fts',
+]
+
+# PostgreSQL: columna tsvector generada con índice GIN (el texto ya viene sin acentos)
+POSTGRESQL_SQL = [
+    """
+    ALTER TABLE search_searchdocument ADD COLUMN document tsvector
+    GENERATED ALWAYS AS (to_tsvector('simple', body)) STORED
+    """,
+    'CREATE INDEX search_document_gin ON search_searchdocument USING GIN (document)',
+]
+POSTGRESQL_REVERSE_SQL = [
+    'DROP INDEX IF EXISTS search_document_gin',
+    'ALTER TABLE search_searchdocument DROP COLUMN IF EXISTS document',
+]
+
+
+def _execute(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_fulltext_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        _execute(schema_editor, SQLITE_SQL)
+    elif vendor == 'postgresql':
+        _execute(schema_editor, POSTGRESQL_SQL)
+
+
+def drop_fulltext_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        _execute(schema_editor, SQLITE_REVERSE_SQL)
+    elif vendor == 'postgresql':
+        _execute(schema_editor, POSTGRESQL_REVERSE_SQL)
+
+
+def build_index(apps, schema_editor):
+    from search.index import rebuild_search_index
+    rebuild_search_index(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+        ('academic', '0002_initial'),
+        ('assignments', '0005_assignmenthistory_reorder_action'),
+        ('comments', '0003_add_query_indexes'),
+        ('professors', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+        migrations.RunPython(build_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """
+    Texto indexado de una fila buscable, normalizado (minúsculas y sin
+    acentos). El índice de texto completo se crea en la migración según el
+    motor: tabla virtual FTS5 en SQLite y columna ``tsvector`` en PostgreSQL.
+    """
+    
+    model = models.CharField(
+        max_length=100,
+        verbose_name='Modelo'
+    )
+    object_id = models.PositiveBigIntegerField(
+        verbose_name='ID del objeto'
+    )
+    body = models.TextField(
+        verbose_name='Texto indexado'
+    )
+    
+    class Meta:
+        verbose_name = 'Documento de búsqueda'
+        verbose_name_plural = 'Documentos de búsqueda'
+        constraints = [
+            models.UniqueConstraint(fields=['model', 'object_id'], name='search_document_unique'),
+        ]
+    
+    def __str__(self):
+        return f"{self.model} #{self.object_id}"
@@ -0,0 +1,21 @@
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from .index import DEPENDENTS, SEARCH_FIELDS, remove_from_search_index, update_search_index
+
+
+def index_on_save(sender, instance, raw=False, **kwargs):
+    # Los fixtures (loaddata) se indexan con rebuild_search_index
+    if not raw:
+        update_search_index(sender, [instance.pk])
+
+
+def remove_on_delete(sender, instance, **kwargs):
+    remove_from_search_index(sender, [instance.pk])
+
+
+for label in {*SEARCH_FIELDS, *DEPENDENTS}:
+    model = apps.get_model(label)
+    post_save.connect(index_on_save, sender=model, dispatch_uid=f'search_index:{label}')
+    if label in SEARCH_FIELDS:
+        post_delete.connect(remove_on_delete, sender=model, dispatch_uid=f'search_index:{label}')
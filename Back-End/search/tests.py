@@ -0,0 +1,156 @@
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from users.models import User
+from academic.models import Faculty, Discipline, Subject
+from assignments.models import Assignment
+from comments.models import Comment
+from professors.models import Professor
+from .index import normalize, rebuild_search_index, search
+
+
+class FullTextSearchTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vicedecano = User.objects.create_user(
+            username='vicedecano', email='vicedecano@uci.cu',
+            password='123456', role=User.Role.VICEDECANO
+        )
+        cls.faculty = Faculty.objects.create(name='Facultad 1', code='F1')
+        discipline = Discipline.objects.create(name='Matemática', code='MAT')
+        cls.subject = Subject.objects.create(name='Álgebra Lineal', code='ALG', discipline=discipline)
+        cls.pena = Professor.objects.create(
+            first_name='José', last_name='Peña', email='jose@uci.cu', identification='00000000001'
+        )
+        cls.other = Professor.objects.create(
+            first_name='Ana', last_name='Pérez', email='ana@uci.cu', identification='00000000002',
+            specialty='Peña y peñas'
+        )
+        cls.assignment = Assignment.objects.create(
+            professor=cls.pena, subject=cls.subject, faculty=cls.faculty,
+            academic_year='2025-2026', semester=1, hours_per_week=4
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.vicedecano)
+
+    def test_normalize_removes_accents(self):
+        self.assertEqual(normalize('Peña ÁLGEBRA'), 'pena algebra')
+
+    def test_accent_insensitive_prefix_match_ranked(self):
+        # «Ana Pérez» menciona «peña» dos veces en su especialidad
+        self.assertEqual(search(Professor, 'pena', limit=10), [self.other.pk, self.pena.pk])
+        self.assertEqual(search(Professor, 'jos pen', limit=10), [self.pena.pk])
+
+        response = self.client.get('/api/professors/', {'q': 'PEÑA'})
+        self.assertEqual([row['id'] for row in response.json()], [self.other.pk, self.pena.pk])
+        response = self.client.get('/api/professors/', {'q': 'peña', 'ordering': 'last_name'})
+        self.assertEqual([row['id'] for row in response.json()], [self.pena.pk, self.other.pk])
+
+    @override_settings(SEARCH_MAX_RESULTS=3)
+    def test_limit_applies_after_view_filters(self):
+        for i in range(5):
+            Professor.objects.create(
+                first_name='Luis', last_name='García', email=f'garcia{i}@uci.cu',
+                identification=f'1000000000{i}', is_active=False
+            )
+        active = Professor.objects.create(
+            first_name='Eva', last_name='García', email='eva@uci.cu', identification='00000000003'
+        )
+        response = self.client.get('/api/professors/', {'q': 'garcia', 'is_active': 'true'})
+        self.assertEqual([row['id'] for row in response.json()], [active.pk])
+        self.assertEqual(
+            search(Professor, 'garcia', limit=3, within=Professor.objects.filter(is_active=True)), [active.pk]
+        )
+
+    def test_index_follows_changes_to_related_rows(self):
+        self.assertEqual(search(Assignment, 'algebra', limit=10), [self.assignment.pk])
+
+        self.subject.name = 'Geometría'
+        self.subject.save()
+        self.assertEqual(search(Assignment, 'algebra', limit=10), [])
+        response = self.client.get('/api/assignments/', {'q': 'geometria jose'})
+        self.assertEqual([row['id'] for row in response.json()], [self.assignment.pk])
+
+        self.assignment.delete()
+        self.assertEqual(search(Assignment, 'geometria', limit=10), [])
+
+    def test_bulk_create_and_rebuild(self):
+        response = self.client.post('/api/assignments/bulk/', {'create': [{
+            'professor': self.other.pk, 'subject': self.subject.pk, 'faculty': self.faculty.pk,
+            'academic_year': '2025-2026', 'semester': 2, 'hours_per_week': 2,
+        }]}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(len(search(Assignment, 'ana algebra', limit=10)), 1)
+
+        Comment.objects.bulk_create([Comment(author=self.vicedecano, subject='Revisión', message='Horario')])
+        self.assertEqual(search(Comment, 'revision', limit=10), [])
+        rebuild_search_index()
+        self.assertEqual(len(search(Comment, 'revision', limit=10)), 1)
+
+
+class AutocompleteTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vicedecano = User.objects.create_user(
+            username='vicedecano', email='vicedecano@uci.cu',
+            password='123456', role=User.Role.VICEDECANO
+        )
+        cls.jefe = User.objects.create_user(
+            username='jefe', email='jefe@uci.cu',
+            password='123456', role=User.Role.JEFE_DISCIPLINA
+        )
+        mathematics = Discipline.objects.create(name='Matemática', code='MAT', head=cls.jefe)
+        physics = Discipline.objects.create(name='Física', code='FIS')
+        cls.algebra = Subject.objects.create(name='Álgebra Lineal', code='ALG', discipline=mathematics)
+        cls.optics = Subject.objects.create(name='Óptica', code='OPT', discipline=physics)
+        cls.pena = Professor.objects.create(
+            first_name='José', last_name='Peña', email='jose@uci.cu', identification='00000000001'
+        )
+        Professor.objects.create(
+            first_name='Ana', last_name='Pérez', email='ana@uci.cu', identification='00000000002'
+        )
+
+    def setUp(self):
+        caches['default'].clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.vicedecano)
+
+    def autocomplete(self, **params):
+        response = self.client.get('/api/autocomplete/', params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [item['name'] for item in response.json()]
+
+    def test_prefix_matches_any_word_without_database_after_warm_up(self):
+        # Orden alfabético de la palabra que coincide: «peña» antes que «pérez»
+        self.assertEqual(self.autocomplete(type='professor', prefix='pe'), ['José Peña', 'Ana Pérez'])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.autocomplete(type='professor', prefix='PEN'), ['José Peña'])
+            self.assertEqual(self.autocomplete(type='professor', prefix='jose pe'), ['José Peña'])
+        self.assertEqual(self.autocomplete(type='subject', prefix='lin'), ['Álgebra Lineal'])
+        self.assertEqual(self.autocomplete(type='subject', prefix='opt'), ['Óptica'])
+
+    def test_index_is_rebuilt_after_save(self):
+        self.assertEqual(self.autocomplete(type='professor', prefix='ped'), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pena.last_name = 'Pedraza'
+            self.pena.save()
+        self.assertEqual(self.autocomplete(type='professor', prefix='ped'), ['José Pedraza'])
+
+    @override_settings(AUTOCOMPLETE_RECHECK_SECONDS=0)
+    def test_index_sees_changes_without_version_bump(self):
+        self.assertEqual(self.autocomplete(type='professor', prefix='ped'), [])
+        # update() (u otro worker sin caché compartida) no incrementa la versión
+        Professor.objects.filter(pk=self.pena.pk).update(last_name='Pedraza', updated_at=timezone.now())
+        self.assertEqual(self.autocomplete(type='professor', prefix='ped'), ['José Pedraza'])
+
+    def test_jefe_only_gets_own_subjects_and_type_is_validated(self):
+        self.client.force_authenticate(self.jefe)
+        self.assertEqual(self.autocomplete(type='subject'), ['Álgebra Lineal'])
+        response = self.client.get('/api/autocomplete/', {'type': 'user'})
+        self.assertEqual(response.status_code, 400)
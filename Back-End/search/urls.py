@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import AutocompleteView
+
+urlpatterns = [
+    path('autocomplete/', AutocompleteView.as_view(), name='autocomplete'),
+]
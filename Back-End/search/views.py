@@ -0,0 +1,58 @@
+from django.conf import settings
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from users.permissions import IsNotBlocked
+from users.scope import get_user_scope
+from .autocomplete import AUTOCOMPLETE_TYPES, get_index
+
+
+@extend_schema(tags=['Search'])
+class AutocompleteView(generics.GenericAPIView):
+    """
+    Autocompletado de profesores, asignaturas y facultades desde un índice de
+    prefijos en memoria.
+    """
+    permission_classes = [IsAuthenticated, IsNotBlocked]
+    
+    @extend_schema(
+        summary="Autocompletar",
+        description=(
+            "Devuelve las primeras coincidencias (sin acentos ni mayúsculas) cuyo nombre, "
+            "o alguna de sus palabras, o su código empieza por `prefix`. Solo elementos activos; "
+            "los jefes de disciplina solo ven las asignaturas de sus disciplinas."
+        ),
+        parameters=[
+            OpenApiParameter(name='type', description=f"Tipo: {', '.join(AUTOCOMPLETE_TYPES)}", required=True, type=str),
+            OpenApiParameter(name='prefix', description='Texto escrito por el usuario', required=False, type=str),
+            OpenApiParameter(name='limit', description=f'Máximo de resultados (hasta {settings.AUTOCOMPLETE_MAX_LIMIT})', required=False, type=int),
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    def get(self, request):
+        kind = request.query_params.get('type')
+        if kind not in AUTOCOMPLETE_TYPES:
+            return Response(
+                {'error': f"Tipo no válido. Opciones: {', '.join(AUTOCOMPLETE_TYPES)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            limit = int(request.query_params.get('limit', settings.AUTOCOMPLETE_LIMIT))
+        except ValueError:
+            return Response({'error': 'El límite debe ser un número entero.'}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, settings.AUTOCOMPLETE_MAX_LIMIT))
+        
+        if kind == 'subject' and request.user.is_jefe_disciplina:
+            # El alcance del jefe también está en caché: sin consultas tras calentar
+            subject_ids = get_user_scope(request.user).subject_ids
+            
+            def accept(item):
+                return item['id'] in subject_ids
+        else:
+            accept = None
+        
+        results = get_index(kind).search(request.query_params.get('prefix', ''), limit, accept)
+        return Response(results)
@@ -0,0 +1,11 @@
+from django.contrib import admin
+from .models import Tombstone
+
+
+@admin.register(Tombstone)
+class TombstoneAdmin(admin.ModelAdmin):
+    """Configuración del admin para los registros de eliminación."""
+    
+    list_display = ['model', 'object_id', 'deleted_at']
+    list_filter = ['model']
+    readonly_fields = ['model', 'object_id', 'related', 'deleted_at']
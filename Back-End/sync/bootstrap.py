@@ -0,0 +1,134 @@
+"""
+Carga inicial del frontend (``GET /api/bootstrap/``) en una sola respuesta.
+
+Devuelve los mismos campos que los listados de profesores, disciplinas,
+comentarios y asignaciones, pero construidos con consultas ``values()`` (sin
+instanciar modelos ni pasar por los serializers) y con el mismo alcance por
+rol que cada ``ViewSet``. Incluye un token de sincronización para que el
+cliente continúe con ``GET /api/sync/?since=<token>``.
+"""
+from collections import defaultdict
+
+from django.db.models import Count, Max
+from django.utils import timezone
+from rest_framework import serializers
+
+from academic.models import Discipline
+from assignments.models import Assignment
+from comments.models import Comment
+from professors.models import Professor
+from users.models import User
+from users.scope import get_user_scope
+from .changes import make_token
+
+
+_datetime = serializers.DateTimeField()
+
+
+def _to_representation(value):
+    return _datetime.to_representation(value) if value else None
+
+
+def bootstrap_professors(user):
+    subjects = defaultdict(set)
+    faculties = defaultdict(set)
+    for professor_id, subject, faculty in Assignment.objects.filter(is_active=True).order_by().values_list(
+        'professor_id', 'subject__name', 'faculty__name'
+    ).distinct():
+        subjects[professor_id].add(subject)
+        faculties[professor_id].add(faculty)
+
+    categories = dict(Professor.Category.choices)
+    degrees = dict(Professor.ScientificDegree.choices)
+    contracts = dict(Professor.ContractType.choices)
+    rows = Professor.objects.values(
+        'id', 'first_name', 'last_name', 'email', 'phone', 'identification',
+        'category', 'scientific_degree', 'contract_type', 'specialty',
+        'years_of_experience', 'is_active', 'created_at'
+    )
+    return [
+        {
+            **row,
+            'full_name': f"{row['first_name']} {row['last_name']}",
+            'category_display': categories.get(row['category'], row['category']),
+            'scientific_degree_display': degrees.get(row['scientific_degree'], row['scientific_degree']),
+            'contract_type_display': contracts.get(row['contract_type'], row['contract_type']),
+            'created_at': _to_representation(row['created_at']),
+            'subjects_list': sorted(subjects[row['id']]),
+            'faculties_list': sorted(faculties[row['id']]),
+        }
+        for row in rows
+    ]
+
+
+def bootstrap_disciplines(user):
+    queryset = Discipline.objects.all()
+    if user.is_jefe_disciplina:
+        queryset = queryset.filter(pk__in=get_user_scope(user).discipline_ids)
+    return list(queryset.annotate(subjects_count=Count('subjects')).values(
+        'id', 'name', 'code', 'is_active', 'subjects_count'
+    ))
+
+
+def bootstrap_comments(user):
+    roles = dict(User.Role.choices)
+    types = dict(Comment.CommentType.choices)
+    rows = Comment.objects.annotate(
+        replies_count=Count('replies'),
+        last_reply_at=Max('replies__created_at')
+    ).values(
+        'id', 'comment_type', 'subject', 'message', 'is_read', 'replies_count',
+        'last_reply_at', 'created_at', 'author__first_name', 'author__last_name', 'author__role'
+    )
+    return [
+        {
+            'id': row['id'],
+            'author_name': f"{row['author__first_name']} {row['author__last_name']}".strip(),
+            'author_role': roles.get(row['author__role'], row['author__role']),
+            'comment_type': row['comment_type'],
+            'comment_type_display': types.get(row['comment_type'], row['comment_type']),
+            'subject': row['subject'],
+            'message': row['message'],
+            'is_read': row['is_read'],
+            'replies_count': row['replies_count'],
+            'last_reply_at': _to_representation(row['last_reply_at']),
+            'created_at': _to_representation(row['created_at']),
+        }
+        for row in rows
+    ]
+
+
+def bootstrap_assignments(user):
+    queryset = Assignment.objects.all()
+    if user.is_jefe_disciplina:
+        queryset = queryset.filter(subject_id__in=get_user_scope(user).subject_ids)
+    rows = queryset.values(
+        'id', 'academic_year', 'semester', 'is_active',
+        'professor__first_name', 'professor__last_name', 'subject__name',
+        'faculty__name', 'subject__discipline__name'
+    )
+    return [
+        {
+            'id': row['id'],
+            'professor_name': f"{row['professor__first_name']} {row['professor__last_name']}",
+            'subject_name': row['subject__name'],
+            'faculty_name': row['faculty__name'],
+            'discipline_name': row['subject__discipline__name'],
+            'academic_year': row['academic_year'],
+            'semester': row['semester'],
+            'is_active': row['is_active'],
+        }
+        for row in rows
+    ]
+
+
+def build_bootstrap(user):
+    """Los cuatro conjuntos de datos con una consulta cada uno (dos los profesores)."""
+    now = timezone.now()
+    return {
+        'token': make_token(user, now),
+        'professors': bootstrap_professors(user),
+        'disciplines': bootstrap_disciplines(user),
+        'comments': bootstrap_comments(user),
+        'assignments': bootstrap_assignments(user),
+    }
@@ -0,0 +1,166 @@
+"""
+Sincronización incremental de los datos que carga el DataContext del frontend.
+
+El servidor emite un token firmado con el instante de la consulta y el alcance
+del usuario. Con ``?since=<token>`` solo se devuelven las filas con
+``updated_at`` posterior (o cuyos datos relacionados cambiaron) y los ids
+eliminados desde entonces según ``Tombstone``. Un token inválido, caducado,
+de otro usuario o emitido con otro alcance provoca una respuesta completa.
+"""
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Count, Max, Prefetch, Q
+from django.utils import timezone
+
+from academic.models import Discipline, Subject
+from academic.serializers import DisciplineListSerializer
+from assignments.models import Assignment
+from assignments.serializers import AssignmentListSerializer
+from comments.models import Comment, CommentReply
+from comments.serializers import CommentListSerializer
+from professors.models import Professor
+from professors.serializers import ProfessorListSerializer
+from users.scope import get_user_scope
+from .models import Tombstone
+
+
+TOKEN_SALT = 'sync.token'
+
+
+def _scope_hash(user):
+    parts = [user.pk, user.role]
+    if user.is_jefe_disciplina:
+        scope = get_user_scope(user)
+        parts += [sorted(scope.discipline_ids), sorted(scope.subject_ids)]
+    return hashlib.md5(json.dumps(parts).encode()).hexdigest()
+
+
+def make_token(user, instant):
+    return signing.dumps(
+        {'t': int(instant.timestamp() * 1_000_000), 's': _scope_hash(user)}, salt=TOKEN_SALT
+    )
+
+
+def read_token(user, token):
+    """
+    Devuelve el instante desde el que hay que enviar cambios, o ``None`` si el
+    cliente necesita una carga completa.
+    """
+    if not token:
+        return None
+    max_age = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    try:
+        payload = signing.loads(token, salt=TOKEN_SALT, max_age=max_age)
+    except signing.BadSignature:
+        return None
+    if payload.get('s') != _scope_hash(user):
+        return None
+    instant = datetime.fromtimestamp(payload['t'] / 1_000_000, tz=dt_timezone.utc)
+    # Margen para transacciones que confirmaron después de emitir el token
+    return instant - timedelta(seconds=settings.SYNC_TOKEN_OVERLAP_SECONDS)
+
+
+def _deleted(model, since):
+    queryset = Tombstone.objects.filter(model=model._meta.label_lower, deleted_at__gte=since)
+    return [(object_id, data) for object_id, data in queryset.values_list('object_id', 'related')]
+
+
+def _related_ids(model, since, field):
+    return {data.get(field) for _, data in _deleted(model, since)} - {None}
+
+
+def professors_changes(user, since):
+    queryset = Professor.objects.prefetch_related(
+        Prefetch(
+            'assignments',
+            queryset=Assignment.objects.filter(is_active=True).select_related('subject', 'faculty'),
+            to_attr='active_assignments'
+        )
+    )
+    deleted = []
+    if since:
+        # La lista de asignaturas y facultades sale de las asignaciones activas
+        changed_assignments = Assignment.objects.filter(
+            Q(updated_at__gte=since) | Q(subject__updated_at__gte=since) | Q(faculty__updated_at__gte=since)
+        ).values('professor_id')
+        queryset = queryset.filter(
+            Q(updated_at__gte=since) | Q(pk__in=changed_assignments)
+            | Q(pk__in=_related_ids(Assignment, since, 'professor_id'))
+        )
+        deleted = [object_id for object_id, _ in _deleted(Professor, since)]
+    return ProfessorListSerializer(queryset, many=True).data, deleted
+
+
+def disciplines_changes(user, since):
+    queryset = Discipline.objects.all()
+    if user.is_jefe_disciplina:
+        queryset = queryset.filter(pk__in=get_user_scope(user).discipline_ids)
+    deleted = []
+    if since:
+        # El número de asignaturas cambia al crear, mover o eliminar asignaturas
+        queryset = queryset.filter(
+            Q(updated_at__gte=since)
+            | Q(pk__in=Subject.objects.filter(updated_at__gte=since).values('discipline_id'))
+            | Q(pk__in=_related_ids(Subject, since, 'discipline_id'))
+        )
+        deleted = [object_id for object_id, _ in _deleted(Discipline, since)]
+    return DisciplineListSerializer(queryset, many=True).data, deleted
+
+
+def comments_changes(user, since):
+    queryset = Comment.objects.select_related('author', 'read_by').annotate(
+        replies_count=Count('replies'),
+        last_reply_at=Max('replies__created_at')
+    )
+    deleted = []
+    if since:
+        queryset = queryset.filter(
+            Q(updated_at__gte=since) | Q(author__updated_at__gte=since)
+            | Q(pk__in=CommentReply.objects.filter(created_at__gte=since).values('comment_id'))
+            | Q(pk__in=_related_ids(CommentReply, since, 'comment_id'))
+        )
+        deleted = [object_id for object_id, _ in _deleted(Comment, since)]
+    return CommentListSerializer(queryset, many=True).data, deleted
+
+
+def assignments_changes(user, since):
+    queryset = Assignment.objects.select_related('professor', 'subject', 'subject__discipline', 'faculty')
+    subject_ids = get_user_scope(user).subject_ids if user.is_jefe_disciplina else None
+    if subject_ids is not None:
+        queryset = queryset.filter(subject_id__in=subject_ids)
+    deleted = []
+    if since:
+        queryset = queryset.filter(
+            Q(updated_at__gte=since) | Q(professor__updated_at__gte=since)
+            | Q(subject__updated_at__gte=since) | Q(subject__discipline__updated_at__gte=since)
+            | Q(faculty__updated_at__gte=since)
+        )
+        deleted = [
+            object_id for object_id, data in _deleted(Assignment, since)
+            if subject_ids is None or data.get('subject_id') in subject_ids
+        ]
+    return AssignmentListSerializer(queryset, many=True).data, deleted
+
+
+COLLECTIONS = {
+    'professors': professors_changes,
+    'disciplines': disciplines_changes,
+    'comments': comments_changes,
+    'assignments': assignments_changes,
+}
+
+
+def build_sync(user, token=None):
+    """Respuesta de ``GET /api/sync/``: token nuevo y cambios por colección."""
+    # El token nuevo se fija antes de consultar para no perder cambios concurrentes
+    now = timezone.now()
+    since = read_token(user, token)
+    changes = {}
+    for name, collect in COLLECTIONS.items():
+        updated, deleted = collect(user, since)
+        changes[name] = {'updated': updated, 'deleted': deleted}
+    return {'token': make_token(user, now), 'full': since is None, 'changes': changes}
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=100, verbose_name='Modelo')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID del objeto')),
+                ('related', models.JSONField(blank=True, default=dict, verbose_name='Relacionados')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de eliminación')),
+            ],
+            options={
+                'verbose_name': 'Registro de eliminación',
+                'verbose_name_plural': 'Registros de eliminación',
+                'ordering': ['deleted_at'],
+                'indexes': [models.Index(fields=['deleted_at', 'model'], name='tombstone_deleted_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import models
+
+
+class Tombstone(models.Model):
+    """
+    Registro de una fila eliminada, para que la sincronización incremental
+    (``GET /api/sync/``) pueda informar de los borrados a los clientes.
+    Se purgan con ``python manage.py purge_tombstones``.
+    """
+    
+    model = models.CharField(
+        max_length=100,
+        verbose_name='Modelo'
+    )
+    object_id = models.PositiveBigIntegerField(
+        verbose_name='ID del objeto'
+    )
+    # Claves foráneas de la fila eliminada que afectan a otras colecciones
+    # (p. ej. el profesor de una asignación)
+    related = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='Relacionados'
+    )
+    deleted_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Fecha de eliminación'
+    )
+    
+    class Meta:
+        verbose_name = 'Registro de eliminación'
+        verbose_name_plural = 'Registros de eliminación'
+        ordering = ['deleted_at']
+        indexes = [
+            models.Index(fields=['deleted_at', 'model'], name='tombstone_deleted_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.model} #{self.object_id} ({self.deleted_at})"
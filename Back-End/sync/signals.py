@@ -0,0 +1,29 @@
+from django.apps import apps
+from django.db.models.signals import post_delete
+
+from .models import Tombstone
+
+
+# Modelos cuyos borrados se registran y claves foráneas que se conservan
+TRACKED_MODELS = {
+    'professors.Professor': (),
+    'academic.Discipline': (),
+    'academic.Subject': ('discipline_id',),
+    'comments.Comment': (),
+    'comments.CommentReply': ('comment_id',),
+    'assignments.Assignment': ('professor_id', 'subject_id'),
+}
+
+
+def record_tombstone(sender, instance, **kwargs):
+    Tombstone.objects.create(
+        model=sender._meta.label_lower,
+        object_id=instance.pk,
+        related={field: getattr(instance, field) for field in TRACKED_MODELS[sender._meta.label]},
+    )
+
+
+for label in TRACKED_MODELS:
+    post_delete.connect(
+        record_tombstone, sender=apps.get_model(label), dispatch_uid=f'sync_tombstone:{label}'
+    )
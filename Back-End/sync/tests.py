@@ -0,0 +1,132 @@
+from django.core.cache import caches
+import gzip
+import json
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from users.models import User
+from academic.models import Faculty, Discipline, Subject
+from assignments.models import Assignment
+from comments.models import Comment
+from professors.models import Professor
+from .models import Tombstone
+
+
+class SyncTestMixin:
+    """Una fila de cada colección del DataContext."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vicedecano = User.objects.create_user(
+            username='vicedecano', email='vicedecano@uci.cu',
+            password='123456', role=User.Role.VICEDECANO
+        )
+        cls.faculty = Faculty.objects.create(name='Facultad 1', code='F1')
+        cls.discipline = Discipline.objects.create(name='Matemática', code='MAT')
+        cls.subject = Subject.objects.create(name='Álgebra', code='ALG', discipline=cls.discipline)
+        cls.professor = Professor.objects.create(
+            first_name='Ana', last_name='Pérez',
+            email='ana@uci.cu', identification='00000000001'
+        )
+        cls.assignment = Assignment.objects.create(
+            professor=cls.professor, subject=cls.subject, faculty=cls.faculty,
+            academic_year='2025-2026', semester=1, hours_per_week=4
+        )
+        Comment.objects.create(author=cls.vicedecano, subject='Aviso', message='...')
+
+    def setUp(self):
+        caches['default'].clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.vicedecano)
+
+
+@override_settings(SYNC_TOKEN_OVERLAP_SECONDS=0)
+class SyncTests(SyncTestMixin, TestCase):
+
+    def sync(self, token=None):
+        response = self.client.get('/api/sync/', {'since': token} if token else {})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_full_then_empty_delta(self):
+        data = self.sync()
+        self.assertTrue(data['full'])
+        self.assertEqual(
+            {name: len(changes['updated']) for name, changes in data['changes'].items()},
+            {'professors': 1, 'disciplines': 1, 'comments': 1, 'assignments': 1}
+        )
+
+        data = self.sync(data['token'])
+        self.assertFalse(data['full'])
+        for changes in data['changes'].values():
+            self.assertEqual(changes, {'updated': [], 'deleted': []})
+
+    def test_delta_contains_updates_and_deletes(self):
+        token = self.sync()['token']
+        self.subject.name = 'Álgebra Lineal'
+        self.subject.save()
+        Comment.objects.create(author=self.vicedecano, subject='Nuevo', message='...')
+
+        data = self.sync(token)
+        changes = data['changes']
+        # La asignatura renombrada aparece en la asignación, el profesor y la disciplina
+        self.assertEqual(changes['assignments']['updated'][0]['subject_name'], 'Álgebra Lineal')
+        self.assertEqual(changes['professors']['updated'][0]['subjects_list'], ['Álgebra Lineal'])
+        self.assertEqual(len(changes['disciplines']['updated']), 1)
+        self.assertEqual([c['subject'] for c in changes['comments']['updated']], ['Nuevo'])
+
+        assignment_id = self.assignment.pk
+        self.assignment.delete()
+        changes = self.sync(data['token'])['changes']
+        self.assertEqual(changes['assignments'], {'updated': [], 'deleted': [assignment_id]})
+        self.assertEqual(changes['professors']['updated'][0]['subjects_list'], [])
+        self.assertTrue(Tombstone.objects.filter(model='assignments.assignment').exists())
+
+    def test_invalid_or_foreign_token_returns_full(self):
+        self.assertTrue(self.sync('no-es-un-token')['full'])
+
+        token = self.sync()['token']
+        jefe = User.objects.create_user(
+            username='jefe', email='jefe@uci.cu',
+            password='123456', role=User.Role.JEFE_DISCIPLINA
+        )
+        self.client.force_authenticate(jefe)
+        data = self.sync(token)
+        self.assertTrue(data['full'])
+        self.assertEqual(data['changes']['assignments']['updated'], [])
+
+        # Cambiar el alcance del jefe invalida sus tokens
+        token = data['token']
+        self.discipline.head = jefe
+        self.discipline.save()
+        # Cada petición real trae su propia instancia del usuario (sin alcance memorizado)
+        self.client.force_authenticate(User.objects.get(pk=jefe.pk))
+        data = self.sync(token)
+        self.assertTrue(data['full'])
+        self.assertEqual(len(data['changes']['assignments']['updated']), 1)
+
+
+class BootstrapTests(SyncTestMixin, TestCase):
+
+    LIST_URLS = {
+        'professors': '/api/professors/',
+        'disciplines': '/api/academic/disciplines/',
+        'comments': '/api/comments/',
+        'assignments': '/api/assignments/',
+    }
+
+    def test_matches_list_endpoints(self):
+        # Dos consultas para profesores y una por cada otra colección
+        with self.assertNumQueries(5):
+            data = self.client.get('/api/bootstrap/').json()
+        for name, url in self.LIST_URLS.items():
+            self.assertEqual(data[name], self.client.get(url).json(), name)
+        self.assertFalse(self.client.get('/api/sync/', {'since': data['token']}).json()['full'])
+
+    def test_response_is_compressed(self):
+        response = self.client.get('/api/bootstrap/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        data = json.loads(gzip.decompress(response.content))
+        self.assertEqual(len(data['assignments']), 1)
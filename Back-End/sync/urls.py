@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import BootstrapView, SyncView
+
+urlpatterns = [
+    path('bootstrap/', BootstrapView.as_view(), name='bootstrap'),
+    path('sync/', SyncView.as_view(), name='sync'),
+]
@@ -0,0 +1,58 @@
+from django.utils.decorators import method_decorator
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from core.compression import compress_page
+from users.permissions import IsNotBlocked
+from .bootstrap import build_bootstrap
+from .changes import build_sync
+
+
+@extend_schema(tags=['Sync'])
+@method_decorator(compress_page, name='dispatch')
+class SyncView(generics.GenericAPIView):
+    """
+    Sincronización incremental de profesores, disciplinas, comentarios y
+    asignaciones para la caché del frontend.
+    """
+    permission_classes = [IsAuthenticated, IsNotBlocked]
+    
+    @extend_schema(
+        summary="Sincronizar datos",
+        description=(
+            "Sin `since` (o con un token caducado o de otro alcance) devuelve todas las filas "
+            "y `full: true`. Con el `token` de la respuesta anterior devuelve solo las filas "
+            "creadas o modificadas (`updated`) y los ids eliminados (`deleted`) desde entonces."
+        ),
+        parameters=[
+            OpenApiParameter(name='since', description='Token devuelto por la sincronización anterior', required=False, type=str),
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    def get(self, request):
+        return Response(build_sync(request.user, request.query_params.get('since')))
+
+
+@extend_schema(tags=['Sync'])
+@method_decorator(compress_page, name='dispatch')
+class BootstrapView(generics.GenericAPIView):
+    """
+    Carga inicial del frontend: profesores, disciplinas, comentarios y
+    asignaciones en una sola respuesta comprimida.
+    """
+    permission_classes = [IsAuthenticated, IsNotBlocked]
+    
+    @extend_schema(
+        summary="Carga inicial",
+        description=(
+            "Devuelve los listados de profesores, disciplinas, comentarios y asignaciones "
+            "(con el alcance del rol) y un `token` para continuar con `/api/sync/`. "
+            "Se comprime con Brotli o gzip según `Accept-Encoding`."
+        ),
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    def get(self, request):
+        return Response(build_bootstrap(request.user))
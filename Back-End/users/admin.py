@@ -1,5 +1,8 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+
+from core.response_cache import bump_model_versions
+from .authentication import refresh_blocked_users, revoke_user_tokens
 from .models import User
 
 
@@ -31,8 +34,17 @@ class UserAdmin(BaseUserAdmin):
     
     @admin.action(description='Bloquear usuarios seleccionados')
     def block_users(self, request, queryset):
+        # ``update`` no emite señales: invalidar tokens, lista de bloqueados y
+        # respuestas en caché aquí
+        user_ids = list(queryset.values_list('pk', flat=True))
         queryset.update(is_blocked=True)
+        for user_id in user_ids:
+            revoke_user_tokens(user_id)
+        refresh_blocked_users()
+        bump_model_versions(User)
     
     @admin.action(description='Desbloquear usuarios seleccionados')
     def unblock_users(self, request, queryset):
         queryset.update(is_blocked=False)
+        refresh_blocked_users()
+        bump_model_versions(User)
@@ -0,0 +1,143 @@
+"""
+Autenticación JWT sin consultar la tabla de usuarios en cada petición.
+
+El token de acceso lleva el rol y el estado de bloqueo del usuario. La
+revocación se resuelve con la caché (``CACHES``):
+
+- el conjunto de usuarios bloqueados, que se recarga de la base de datos
+  cuando se bloquea o desbloquea a alguien (o al expirar), y
+- una marca por usuario con el instante (en nanosegundos) a partir del cual
+  sus tokens anteriores dejan de ser válidos (cambio de rol, desactivación o
+  bloqueo).
+
+Solo es inmediata en todos los workers si la caché es compartida
+(``CACHE_SHARED``). Sin ella, cada petición comprueba en la base de datos que
+el usuario sigue activo, con el mismo rol, y si está bloqueado.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .models import User
+
+
+BLOCKED_USERS_CACHE_KEY = 'auth:blocked_user_ids'
+
+# Campos del usuario que viajan en el token: nombre del claim -> atributo
+TOKEN_CLAIMS = {'role': 'role', 'blocked': 'is_blocked'}
+# Instante de emisión en nanosegundos: ``iat`` solo tiene segundos
+ISSUED_NS_CLAIM = 'iat_ns'
+
+
+def _revoked_key(user_id):
+    return f'auth:revoked_before:{user_id}'
+
+
+def get_blocked_user_ids():
+    """IDs de usuarios bloqueados, cargados una vez y compartidos por la caché."""
+    blocked = cache.get(BLOCKED_USERS_CACHE_KEY)
+    if blocked is None:
+        blocked = frozenset(User.objects.filter(is_blocked=True).values_list('pk', flat=True))
+        cache.set(BLOCKED_USERS_CACHE_KEY, blocked, settings.AUTH_BLOCKED_CACHE_TIMEOUT)
+    return blocked
+
+
+def refresh_blocked_users():
+    """Fuerza la recarga del conjunto de bloqueados en la próxima petición."""
+    cache.delete(BLOCKED_USERS_CACHE_KEY)
+
+
+def revoke_user_tokens(user_id):
+    """
+    Invalida los tokens de acceso emitidos hasta ahora para ``user_id``. Basta
+    con conservar la marca lo que dura un token de acceso; el refresco
+    consulta la base de datos y emite claims actualizados.
+    """
+    lifetime = api_settings.ACCESS_TOKEN_LIFETIME
+    cache.set(_revoked_key(user_id), time.time_ns(), int(lifetime.total_seconds()))
+
+
+def is_token_revoked(token):
+    revoked_before = cache.get(_revoked_key(token[api_settings.USER_ID_CLAIM]))
+    if revoked_before is None:
+        return False
+    # Tokens sin ``iat_ns``: un token del mismo segundo que la revocación se rechaza
+    issued = token.get(ISSUED_NS_CLAIM, token.get('iat', 0) * 10 ** 9)
+    return issued < revoked_before
+
+
+def set_token_claims(token, user):
+    """Copia en ``token`` los claims del usuario y el instante de emisión."""
+    for claim, attname in TOKEN_CLAIMS.items():
+        token[claim] = getattr(user, attname)
+    token[ISSUED_NS_CLAIM] = time.time_ns()
+
+
+def token_for_user(user):
+    """``RefreshToken`` con los claims del usuario; el token de acceso los hereda."""
+    refresh = RefreshToken.for_user(user)
+    set_token_claims(refresh, user)
+    return refresh
+
+
+def check_user_row(user_id, token):
+    """
+    Comprobación en la base de datos, sin caché compartida: rechaza el token si
+    el usuario ya no existe, está inactivo o cambió de rol. Devuelve si está
+    bloqueado.
+    """
+    row = User.objects.filter(pk=user_id).values_list('role', 'is_active', 'is_blocked').first()
+    if row is None or not row[1] or row[0] != token['role']:
+        raise AuthenticationFailed(
+            'La sesión ya no es válida. Inicie sesión de nuevo.', code='token_revoked'
+        )
+    return row[2]
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    Construye ``request.user`` a partir de los claims del token, sin consulta
+    (con ``CACHE_SHARED``; si no, con una consulta de tres columnas). El resto
+    de campos del usuario se cargan de una vez solo si la vista los usa.
+    """
+
+    def get_user(self, validated_token):
+        # Tokens emitidos antes de incluir los claims: comportamiento estándar
+        if 'role' not in validated_token:
+            return super().get_user(validated_token)
+
+        try:
+            # simplejwt guarda el id como texto en el token
+            user_id = User._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])
+        except KeyError:
+            raise InvalidToken('El token no identifica a ningún usuario.')
+
+        # IsNotBlocked rechaza la petición de un usuario bloqueado con su mensaje habitual
+        if settings.CACHE_SHARED:
+            if is_token_revoked(validated_token):
+                raise AuthenticationFailed(
+                    'La sesión ya no es válida. Inicie sesión de nuevo.', code='token_revoked'
+                )
+            is_blocked = user_id in get_blocked_user_ids()
+        else:
+            # La revocación hecha en otro worker no llegaría a esta caché
+            is_blocked = check_user_row(user_id, validated_token)
+        values = {'id': user_id, 'is_active': True, 'role': validated_token['role'], 'is_blocked': is_blocked}
+        # from_db espera los valores en el orden de los campos del modelo
+        field_names = [f.attname for f in User._meta.concrete_fields if f.attname in values]
+        user = User.from_db(DEFAULT_DB_ALIAS, field_names, [values[name] for name in field_names])
+        user._from_token = True
+        return user
+
+
+class ClaimsJWTScheme(SimpleJWTScheme):
+    """Documenta ``ClaimsJWTAuthentication`` en Swagger igual que el JWT estándar."""
+    target_class = 'users.authentication.ClaimsJWTAuthentication'
@@ -0,0 +1,47 @@
+"""
+Cambio del dominio de correo de los usuarios (p. ej. ``uci.edu.cu`` → ``uci.cu``).
+
+Lo usan el comando ``update_email_domain`` y el trabajo en segundo plano
+``users.update_email_domain``. Lee los usuarios afectados y los correos ya
+ocupados con dos consultas y guarda los cambios con un único ``bulk_update``
+(que no emite señales: actualiza ``updated_at`` e invalida la caché de
+respuestas aquí).
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from core.response_cache import bump_model_versions
+from .models import User
+
+
+@transaction.atomic
+def change_email_domain(old_domain, new_domain):
+    """
+    Cambia ``@old_domain`` por ``@new_domain`` en los correos de los usuarios.
+    Devuelve ``{'updated': [(antes, después)], 'skipped': [...]}``; se saltan
+    los usuarios cuyo correo nuevo ya existe.
+    """
+    old_suffix, new_suffix = f'@{old_domain}', f'@{new_domain}'
+    users = list(User.objects.filter(email__iendswith=old_suffix).order_by('email'))
+    targets = {user.pk: user.email[:-len(old_suffix)] + new_suffix for user in users}
+    taken = set(
+        User.objects.filter(email__in=targets.values()).exclude(pk__in=targets).order_by().values_list(
+            'email', flat=True
+        )
+    )
+
+    now = timezone.now()
+    changed, updated, skipped = [], [], []
+    for user in users:
+        new_email = targets[user.pk]
+        if new_email in taken:
+            skipped.append((user.email, new_email))
+            continue
+        updated.append((user.email, new_email))
+        user.email, user.updated_at = new_email, now
+        taken.add(new_email)
+        changed.append(user)
+    if changed:
+        User.objects.bulk_update(changed, ['email', 'updated_at'], batch_size=500)
+        bump_model_versions(User)
+    return {'updated': updated, 'skipped': skipped}
@@ -0,0 +1,16 @@
+"""
+Hashers de contraseñas con coste configurable.
+
+Al cambiar el número de iteraciones, las contraseñas existentes se vuelven a
+cifrar de forma transparente en el siguiente login correcto (``must_update``).
+"""
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 con iteraciones tomadas de ``PASSWORD_PBKDF2_ITERATIONS``."""
+
+    @property
+    def iterations(self):
+        return getattr(settings, 'PASSWORD_PBKDF2_ITERATIONS', None) or hashers.PBKDF2PasswordHasher.iterations
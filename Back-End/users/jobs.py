@@ -0,0 +1,24 @@
+from rest_framework import serializers
+
+from jobs.registry import register
+from .email_domain import change_email_domain
+
+
+class EmailDomainJobSerializer(serializers.Serializer):
+    old_domain = serializers.CharField(max_length=100, default='uci.edu.cu')
+    new_domain = serializers.CharField(max_length=100, default='uci.cu')
+
+    def validate(self, attrs):
+        if attrs['old_domain'].lower() == attrs['new_domain'].lower():
+            raise serializers.ValidationError('Los dominios deben ser distintos.')
+        return attrs
+
+
+@register(
+    'users.update_email_domain',
+    permission=lambda user: user.can_manage_users(),
+    serializer=EmailDomainJobSerializer,
+    description='Cambia el dominio de correo de todos los usuarios.'
+)
+def update_email_domain(job):
+    return change_email_domain(job.params['old_domain'], job.params['new_domain'])
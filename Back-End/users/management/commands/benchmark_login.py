@@ -0,0 +1,105 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, reset_queries, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+class _Rollback(Exception):
+    """Fuerza el rollback de la transacción del benchmark."""
+
+
+class Command(BaseCommand):
+    help = (
+        'Mide el rendimiento del endpoint de login (/api/auth/login/) con distintos '
+        'costes de PBKDF2. Los usuarios se crean en una transacción que se revierte.'
+    )
+
+    PASSWORD = 'benchmark-123'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=50, help='Usuarios sintéticos a crear')
+        parser.add_argument('--logins', type=int, default=100, help='Logins a medir por configuración')
+        parser.add_argument(
+            '--iterations', default='100000,600000,1000000',
+            help='Iteraciones de PBKDF2 a comparar, separadas por coma'
+        )
+
+    def handle(self, *args, **options):
+        iterations = [int(value) for value in options['iterations'].split(',') if value.strip()]
+        results = {}
+        try:
+            with transaction.atomic():
+                users = self.seed(options['users'])
+                for count in iterations:
+                    with override_settings(PASSWORD_PBKDF2_ITERATIONS=count):
+                        self.stdout.write(self.style.HTTP_INFO(f"Midiendo con {count} iteraciones..."))
+                        results[count] = self.run(users, options['logins'])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        self.stdout.write("\n" + "=" * 60)
+        self.stdout.write(self.style.SUCCESS("Resultados"))
+        self.stdout.write("=" * 60)
+        for count, data in results.items():
+            self.stdout.write(
+                f"  {count:>8} iter.  primer login (recifrado): {data['first_ms']:7.1f} ms   "
+                f"login: {data['avg_ms']:7.1f} ms   logins/s: {data['per_second']:6.1f}   "
+                f"consultas/login: {data['queries']}"
+            )
+        self.stdout.write("\n" + self.style.WARNING("Transacción revertida: la base de datos no se modificó."))
+
+    def seed(self, count):
+        # Las contraseñas se cifran con el coste actual; cada configuración
+        # medida las recifra en el primer login de cada usuario
+        template = User(username='tmp')
+        template.set_password(self.PASSWORD)
+        users = User.objects.bulk_create([
+            User(
+                username=f'bench_login_{i}', email=f'bench_login_{i}@uci.cu',
+                password=template.password, role=User.Role.JEFE_DISCIPLINA
+            )
+            for i in range(count)
+        ])
+        return users
+
+    def login(self, client, user):
+        return client.post(
+            '/api/auth/login/',
+            data=json.dumps({'email': user.email, 'password': self.PASSWORD}),
+            content_type='application/json'
+        )
+
+    def run(self, users, logins):
+        client = Client()
+
+        # Primer login de cada usuario: incluye el recifrado transparente
+        start = time.perf_counter()
+        for user in users:
+            self.login(client, user)
+        first_ms = (time.perf_counter() - start) * 1000 / len(users)
+
+        # request_started vacía el registro de consultas: partir de cero
+        reset_queries()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.login(client, users[0])
+        if response.status_code != 200:
+            self.stderr.write(f'Login fallido: {response.status_code} {response.content[:200]}')
+
+        start = time.perf_counter()
+        for i in range(logins):
+            self.login(client, users[i % len(users)])
+        elapsed = time.perf_counter() - start
+
+        return {
+            'first_ms': first_ms,
+            'avg_ms': elapsed * 1000 / logins,
+            'per_second': logins / elapsed,
+            'queries': len(queries.captured_queries),
+        }
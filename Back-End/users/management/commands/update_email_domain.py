@@ -1,73 +1,52 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
 
+from users.email_domain import change_email_domain
+
 User = get_user_model()
 
 
 class Command(BaseCommand):
-    help = 'Actualiza todos los correos de @uci.edu.cu a @uci.cu'
+    help = (
+        'Actualiza todos los correos de @uci.edu.cu a @uci.cu. '
+        'También disponible como trabajo en segundo plano (users.update_email_domain).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--old-domain', default='uci.edu.cu', help='Dominio actual')
+        parser.add_argument('--new-domain', default='uci.cu', help='Dominio nuevo')
 
     def handle(self, *args, **options):
+        old_domain, new_domain = options['old_domain'], options['new_domain']
         self.stdout.write("\n" + "="*60)
         self.stdout.write(self.style.SUCCESS("Actualizando dominio de correos..."))
         self.stdout.write("="*60 + "\n")
         
-        # Obtener todos los usuarios con @uci.edu.cu
-        old_users = User.objects.filter(email__endswith='@uci.edu.cu')
+        result = change_email_domain(old_domain, new_domain)
         
-        if not old_users.exists():
-            self.stdout.write(self.style.WARNING("✓ No hay usuarios con dominio @uci.edu.cu"))
+        if not result['updated'] and not result['skipped']:
+            self.stdout.write(self.style.WARNING(f"✓ No hay usuarios con dominio @{old_domain}"))
             return
         
-        self.stdout.write(f"Encontrados {old_users.count()} usuario(s) con @uci.edu.cu\n")
-        
-        updated_count = 0
-        skipped_count = 0
-        errors_count = 0
-        
-        for user in old_users:
-            try:
-                old_email = user.email
-                # Reemplazar @uci.edu.cu con @uci.cu
-                new_email = old_email.replace('@uci.edu.cu', '@uci.cu')
-                
-                # Verificar si el nuevo email ya existe
-                if User.objects.filter(email=new_email).exclude(pk=user.pk).exists():
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f"⚠ Saltando {old_email} → {new_email}: "
-                            f"Email ya existe"
-                        )
-                    )
-                    skipped_count += 1
-                    continue
-                
-                # Actualizar el correo
-                user.email = new_email
-                user.save()
-                
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"✓ {old_email} → {new_email}"
-                    )
+        for old_email, new_email in result['skipped']:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"⚠ Saltando {old_email} → {new_email}: "
+                    f"Email ya existe"
                 )
-                updated_count += 1
-                
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(
-                        f"✗ Error al actualizar {user.email}: {str(e)}"
-                    )
+            )
+        for old_email, new_email in result['updated']:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"✓ {old_email} → {new_email}"
                 )
-                errors_count += 1
+            )
         
         # Resumen
         self.stdout.write("\n" + "="*60)
-        self.stdout.write(self.style.SUCCESS(f"Actualizados: {updated_count}"))
-        if skipped_count > 0:
-            self.stdout.write(self.style.WARNING(f"Saltados: {skipped_count}"))
-        if errors_count > 0:
-            self.stdout.write(self.style.ERROR(f"Errores: {errors_count}"))
+        self.stdout.write(self.style.SUCCESS(f"Actualizados: {len(result['updated'])}"))
+        if result['skipped']:
+            self.stdout.write(self.style.WARNING(f"Saltados: {len(result['skipped'])}"))
         self.stdout.write("="*60 + "\n")
         
         # Mostrar usuarios actualizados
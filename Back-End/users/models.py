@@ -43,10 +43,21 @@ class User(AbstractUser):
         verbose_name = 'Usuario'
         verbose_name_plural = 'Usuarios'
         ordering = ['-created_at']
+        indexes = [
+            # Búsqueda del usuario en cada login
+            models.Index(fields=['email'], name='user_email_idx'),
+        ]
     
     def __str__(self):
         return f"{self.get_full_name()} ({self.get_role_display()})"
     
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        # Usuario construido desde el token: el primer campo diferido que se lee
+        # carga todos los demás en una sola consulta
+        if fields is not None and getattr(self, '_from_token', False):
+            fields = set(fields) | self.get_deferred_fields()
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+    
     @property
     def is_admin(self):
         return self.role == self.Role.ADMIN
@@ -0,0 +1,66 @@
+"""
+Alcance de datos del jefe de disciplina: disciplinas que dirige y asignaturas
+de esas disciplinas.
+
+Se calcula una vez por petición (se guarda en la instancia del usuario), de
+modo que las vistas filtran con ``IN (ids)`` en lugar de unir asignatura,
+disciplina y jefe en cada consulta. Con caché compartida (``CACHE_SHARED``) se
+conserva además durante ``USER_SCOPE_CACHE_TIMEOUT`` segundos; las señales de
+``users.signals`` invalidan la entrada cuando cambia el jefe de una disciplina
+o la disciplina de una asignatura. Sin ella no se guarda entre peticiones: la
+invalidación solo llegaría al worker que hizo el cambio y los demás seguirían
+dando acceso a un jefe ya sustituido.
+"""
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from academic.models import Discipline, Subject
+
+
+class UserScope(NamedTuple):
+    discipline_ids: frozenset
+    subject_ids: frozenset
+
+
+def _cache_key(user_id):
+    return f'user_scope:{user_id}'
+
+
+def _load_scope(user_id):
+    discipline_ids = frozenset(Discipline.objects.filter(head_id=user_id).order_by().values_list('pk', flat=True))
+    subject_ids = frozenset(
+        Subject.objects.filter(discipline_id__in=discipline_ids).order_by().values_list('pk', flat=True)
+    ) if discipline_ids else frozenset()
+    return UserScope(discipline_ids, subject_ids)
+
+
+def get_user_scope(user):
+    """Devuelve el ``UserScope`` de ``user`` usando la caché de la petición y, si la hay, la compartida."""
+    scope = getattr(user, '_scope_cache', None)
+    if scope is not None:
+        return scope
+
+    if not settings.CACHE_SHARED:
+        scope = _load_scope(user.pk)
+        user._scope_cache = scope
+        return scope
+
+    key = _cache_key(user.pk)
+    cached = cache.get(key)
+    if cached is None:
+        scope = _load_scope(user.pk)
+        cache.set(key, (tuple(scope.discipline_ids), tuple(scope.subject_ids)), settings.USER_SCOPE_CACHE_TIMEOUT)
+    else:
+        scope = UserScope(frozenset(cached[0]), frozenset(cached[1]))
+
+    user._scope_cache = scope
+    return scope
+
+
+def invalidate_user_scope(*user_ids):
+    """Elimina de la caché el alcance de los usuarios indicados."""
+    keys = [_cache_key(user_id) for user_id in user_ids if user_id is not None]
+    if keys:
+        cache.delete_many(keys)
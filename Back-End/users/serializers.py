@@ -1,7 +1,13 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password
 from django.contrib.auth.password_validation import validate_password
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from .authentication import set_token_claims, token_for_user
 
 User = get_user_model()
 
@@ -45,7 +51,10 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
                 'detail': 'Credenciales inválidas. Verifique su email y contraseña.'
             })
         
-        if not user.check_password(password):
+        # Si el hasher cambió de coste, Django pide recifrar la contraseña;
+        # se guarda junto con last_login en lugar de en una escritura aparte
+        rehashed = []
+        if not check_password(password, user.password, setter=rehashed.append):
             raise serializers.ValidationError({
                 'detail': 'Credenciales inválidas. Verifique su email y contraseña.'
             })
@@ -60,14 +69,18 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
                 'detail': 'Su cuenta está bloqueada. Contacte al administrador.'
             })
         
-        # Generar tokens manualmente
-        from rest_framework_simplejwt.tokens import RefreshToken
-        refresh = RefreshToken.for_user(user)
+        # Generar tokens con el rol y el estado de bloqueo como claims
+        refresh = token_for_user(user)
         
-        # Actualizar último login
-        from django.utils import timezone
+        # Actualizar último login (y la contraseña recifrada) con un único UPDATE
         user.last_login = timezone.now()
-        user.save(update_fields=['last_login'])
+        updates = {'last_login': user.last_login}
+        if rehashed:
+            user.set_password(password)
+            updates['password'] = user.password
+        # Sin señales ni bump_model_versions: ninguna respuesta en caché muestra
+        # last_login ni la contraseña
+        User.objects.filter(pk=user.pk).update(**updates)
         
         # Mapeo de roles backend → frontend
         role_map = {
@@ -91,6 +104,37 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         }
 
 
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresco de tokens que vuelve a leer el usuario de la base de datos: rechaza
+    cuentas bloqueadas o inactivas y emite el token de acceso con los claims
+    actuales (p. ej. tras un cambio de rol).
+    """
+    
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        
+        user = User.objects.filter(pk=refresh.payload.get(api_settings.USER_ID_CLAIM)).first()
+        if user is None or not user.is_active or user.is_blocked:
+            raise AuthenticationFailed(
+                'La cuenta no está activa o ha sido bloqueada.', code='no_active_account'
+            )
+        set_token_claims(refresh, user)
+        
+        data = {'access': str(refresh.access_token)}
+        
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist()
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand()
+            data['refresh'] = str(refresh)
+        
+        return data
+
+
 class UserSerializer(serializers.ModelSerializer):
     """Serializer para ver información de usuarios."""
     role_display = serializers.CharField(source='get_role_display', read_only=True)
@@ -0,0 +1,86 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from academic.models import Discipline, Subject
+from .authentication import TOKEN_CLAIMS, refresh_blocked_users, revoke_user_tokens
+from .models import User
+from .scope import invalidate_user_scope
+
+
+# Campos cuyo cambio deja desactualizados los tokens emitidos
+TOKEN_FIELDS = frozenset([*TOKEN_CLAIMS.values(), 'is_active'])
+
+
+@receiver(pre_save, sender=Discipline)
+def remember_discipline_head(sender, instance, **kwargs):
+    """Guarda el jefe anterior para invalidar también su alcance."""
+    instance._old_head_id = (
+        Discipline.objects.filter(pk=instance.pk).values_list('head_id', flat=True).first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Discipline)
+def invalidate_scope_on_discipline_save(sender, instance, created, **kwargs):
+    old_head_id = getattr(instance, '_old_head_id', None)
+    if created or old_head_id != instance.head_id:
+        invalidate_user_scope(old_head_id, instance.head_id)
+
+
+@receiver(post_delete, sender=Discipline)
+def invalidate_scope_on_discipline_delete(sender, instance, **kwargs):
+    invalidate_user_scope(instance.head_id)
+
+
+@receiver(pre_save, sender=Subject)
+def remember_subject_discipline(sender, instance, **kwargs):
+    instance._old_discipline_id = (
+        Subject.objects.filter(pk=instance.pk).values_list('discipline_id', flat=True).first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Subject)
+def invalidate_scope_on_subject_save(sender, instance, created, **kwargs):
+    old_discipline_id = getattr(instance, '_old_discipline_id', None)
+    if created or old_discipline_id != instance.discipline_id:
+        head_ids = Discipline.objects.filter(
+            pk__in=[old_discipline_id, instance.discipline_id]
+        ).values_list('head_id', flat=True)
+        invalidate_user_scope(*head_ids)
+
+
+@receiver(post_delete, sender=Subject)
+def invalidate_scope_on_subject_delete(sender, instance, **kwargs):
+    invalidate_user_scope(
+        Discipline.objects.filter(pk=instance.discipline_id).values_list('head_id', flat=True).first()
+    )
+
+
+@receiver(pre_save, sender=User)
+def remember_token_fields(sender, instance, update_fields=None, **kwargs):
+    """Guarda los valores de los claims del token antes de guardar."""
+    instance._old_token_values = None
+    # El login solo actualiza last_login: no hace falta consultar nada
+    if instance.pk and (update_fields is None or TOKEN_FIELDS.intersection(update_fields)):
+        instance._old_token_values = User.objects.filter(pk=instance.pk).values(*TOKEN_FIELDS).first()
+
+
+@receiver(post_save, sender=User)
+def invalidate_caches_on_user_save(sender, instance, **kwargs):
+    # Cambios de rol o bloqueo: descartar el alcance cacheado del usuario
+    invalidate_user_scope(instance.pk)
+
+    old = getattr(instance, '_old_token_values', None)
+    if not old:
+        return
+    if old['is_blocked'] != instance.is_blocked:
+        refresh_blocked_users()
+    if old['role'] != instance.role or (old['is_active'] and not instance.is_active):
+        revoke_user_tokens(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def revoke_tokens_on_user_delete(sender, instance, **kwargs):
+    revoke_user_tokens(instance.pk)
+    invalidate_user_scope(instance.pk)
@@ -1,3 +1,229 @@
-from django.test import TestCase
+from django.contrib import admin
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
 
-# Create your tests here.
+from academic.models import Discipline, Subject
+from core.response_cache import get_model_versions
+from .authentication import revoke_user_tokens
+from .email_domain import change_email_domain
+from .models import User
+from .scope import get_user_scope
+
+
+class UserScopeCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.jefe = User.objects.create_user(
+            username='jefe', email='jefe@uci.cu',
+            password='123456', role=User.Role.JEFE_DISCIPLINA
+        )
+        cls.other = User.objects.create_user(
+            username='otro', email='otro@uci.cu',
+            password='123456', role=User.Role.JEFE_DISCIPLINA
+        )
+        cls.discipline = Discipline.objects.create(name='Matemática', code='MAT', head=cls.jefe)
+        cls.subject = Subject.objects.create(name='Álgebra', code='ALG', discipline=cls.discipline)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_scope_is_cached_between_requests(self):
+        user = User.objects.get(pk=self.jefe.pk)
+        with self.assertNumQueries(2):
+            scope = get_user_scope(user)
+        self.assertEqual(scope.discipline_ids, {self.discipline.pk})
+        self.assertEqual(scope.subject_ids, {self.subject.pk})
+
+        # Otra petición (otra instancia del usuario) no consulta la base de datos
+        user = User.objects.get(pk=self.jefe.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_scope(user), scope)
+            get_user_scope(user)
+
+    @override_settings(CACHE_SHARED=False)
+    def test_scope_is_not_kept_between_requests_without_shared_cache(self):
+        get_user_scope(User.objects.get(pk=self.jefe.pk))
+        # Otro worker cambia el jefe: la señal solo invalida su propia caché
+        Discipline.objects.filter(pk=self.discipline.pk).update(head=self.other)
+        self.assertEqual(get_user_scope(User.objects.get(pk=self.jefe.pk)).subject_ids, set())
+
+    def test_head_change_invalidates_both_heads(self):
+        get_user_scope(self.jefe)
+        get_user_scope(self.other)
+
+        self.discipline.head = self.other
+        self.discipline.save()
+
+        self.assertEqual(get_user_scope(User.objects.get(pk=self.jefe.pk)).subject_ids, set())
+        self.assertEqual(
+            get_user_scope(User.objects.get(pk=self.other.pk)).subject_ids, {self.subject.pk}
+        )
+
+    def test_new_subject_is_visible_to_head(self):
+        client = APIClient()
+        client.force_authenticate(self.jefe)
+        self.assertEqual(len(client.get('/api/academic/subjects/').json()), 1)
+
+        Subject.objects.create(name='Cálculo', code='CAL', discipline=self.discipline)
+        client.force_authenticate(User.objects.get(pk=self.jefe.pk))
+        self.assertEqual(len(client.get('/api/academic/subjects/').json()), 2)
+
+
+class ClaimsJWTAuthenticationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            username='admin', email='admin@uci.cu',
+            password='123456', role=User.Role.ADMIN
+        )
+        cls.jefe = User.objects.create_user(
+            username='jefe', email='jefe@uci.cu',
+            password='123456', role=User.Role.JEFE_DISCIPLINA
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def login(self, email):
+        response = APIClient().post(
+            '/api/auth/login/', {'email': email, 'password': '123456'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.json()['access']}")
+        return client, response.json()['refresh']
+
+    def test_requests_do_not_load_the_user_row(self):
+        client, _ = self.login('jefe@uci.cu')
+        client.get('/api/academic/faculties/')  # carga la lista de bloqueados
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get('/api/academic/faculties/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(any('users_user' in query['sql'] for query in queries.captured_queries))
+
+    def test_block_takes_effect_immediately(self):
+        jefe_client, refresh = self.login('jefe@uci.cu')
+        admin_client, _ = self.login('admin@uci.cu')
+        self.assertEqual(jefe_client.get('/api/academic/faculties/').status_code, 200)
+
+        response = admin_client.post(f'/api/users/{self.jefe.pk}/block/')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertIn(jefe_client.get('/api/academic/faculties/').status_code, (401, 403))
+        response = APIClient().post('/api/auth/refresh/', {'refresh': refresh}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+        admin_client.post(f'/api/users/{self.jefe.pk}/unblock/')
+        jefe_client, _ = self.login('jefe@uci.cu')
+        self.assertEqual(jefe_client.get('/api/academic/faculties/').status_code, 200)
+
+    def test_token_issued_in_the_same_second_is_revoked(self):
+        client, _ = self.login('jefe@uci.cu')
+        revoke_user_tokens(self.jefe.pk)
+        self.assertEqual(client.get('/api/academic/faculties/').status_code, 401)
+        client, _ = self.login('jefe@uci.cu')
+        self.assertEqual(client.get('/api/academic/faculties/').status_code, 200)
+
+    @override_settings(CACHE_SHARED=False)
+    def test_without_shared_cache_checks_the_user_row(self):
+        client, _ = self.login('jefe@uci.cu')
+        self.assertEqual(client.get('/api/academic/faculties/').status_code, 200)
+
+        # Cambios hechos por otro worker: la caché de este proceso no se entera
+        User.objects.filter(pk=self.jefe.pk).update(is_blocked=True)
+        self.assertEqual(client.get('/api/academic/faculties/').status_code, 403)
+        User.objects.filter(pk=self.jefe.pk).update(is_blocked=False, role=User.Role.ADMIN)
+        self.assertEqual(client.get('/api/academic/faculties/').status_code, 401)
+
+    def test_admin_block_action_takes_effect_immediately(self):
+        jefe_client, _ = self.login('jefe@uci.cu')
+        self.assertEqual(jefe_client.get('/api/academic/faculties/').status_code, 200)
+
+        user_admin = admin.site._registry[User]
+        user_admin.block_users(None, User.objects.filter(pk=self.jefe.pk))
+        self.assertIn(jefe_client.get('/api/academic/faculties/').status_code, (401, 403))
+
+        user_admin.unblock_users(None, User.objects.filter(pk=self.jefe.pk))
+        jefe_client, _ = self.login('jefe@uci.cu')
+        self.assertEqual(jefe_client.get('/api/academic/faculties/').status_code, 200)
+
+    def test_profile_returns_full_user(self):
+        client, _ = self.login('jefe@uci.cu')
+        response = client.get('/api/auth/profile/')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['email'], 'jefe@uci.cu')
+
+    def test_register_returns_tokens_with_claims(self):
+        response = APIClient().post('/api/auth/register/', {
+            'email': 'nuevo@uci.cu', 'password': 'Clave-segura-1', 'password_confirm': 'Clave-segura-1',
+            'name': 'Nuevo Usuario', 'cargo': 'jefe de disciplina',
+        }, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        data = response.json()
+        self.assertEqual(data['user']['role'], 'jefe_disciplina')
+
+        access = AccessToken(data['access'])
+        self.assertEqual(int(access['user_id']), data['user']['id'])
+        self.assertEqual((access['role'], access['blocked']), (User.Role.JEFE_DISCIPLINA, False))
+
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {data['access']}")
+        self.assertEqual(client.get('/api/auth/profile/').json()['email'], 'nuevo@uci.cu')
+        response = APIClient().post('/api/auth/refresh/', {'refresh': data['refresh']}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+
+
+class LoginTests(TestCase):
+
+    @override_settings(PASSWORD_PBKDF2_ITERATIONS=1000)
+    def test_login_rehashes_with_a_single_update(self):
+        with override_settings(PASSWORD_PBKDF2_ITERATIONS=2000):
+            user = User.objects.create_user(
+                username='jefe', email='jefe@uci.cu',
+                password='123456', role=User.Role.JEFE_DISCIPLINA
+            )
+        self.assertIn('$2000$', user.password)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = APIClient().post(
+                '/api/auth/login/', {'email': 'jefe@uci.cu', 'password': '123456'}, format='json'
+            )
+        self.assertEqual(response.status_code, 200, response.content)
+        updates = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('UPDATE "users_user"')]
+        self.assertEqual(len(updates), 1)
+
+        user.refresh_from_db()
+        self.assertIn('$1000$', user.password)
+        self.assertIsNotNone(user.last_login)
+        self.assertTrue(user.check_password('123456'))
+
+
+class EmailDomainTests(TestCase):
+
+    def test_changes_domain_and_skips_taken_emails(self):
+        for username, email in (('ana', 'ana@uci.edu.cu'), ('luis', 'luis@UCI.EDU.CU'),
+                                ('eva', 'eva@uci.edu.cu'), ('eva2', 'eva@uci.cu')):
+            User.objects.create_user(username=username, email=email, password='123456')
+
+        before = dict(User.objects.values_list('username', 'updated_at'))
+        [version] = get_model_versions([User])
+
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            result = change_email_domain('uci.edu.cu', 'uci.cu')
+        # Usuarios afectados, correos ocupados y un único UPDATE (sin contar los savepoints)
+        self.assertEqual(len([q for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]), 3)
+        self.assertEqual(result['skipped'], [('eva@uci.edu.cu', 'eva@uci.cu')])
+        self.assertEqual(
+            sorted(User.objects.values_list('email', flat=True)),
+            ['ana@uci.cu', 'eva@uci.cu', 'eva@uci.edu.cu', 'luis@uci.cu']
+        )
+        # bulk_update no emite señales: updated_at y la versión se actualizan a mano
+        after = dict(User.objects.values_list('username', 'updated_at'))
+        self.assertGreater(after['ana'], before['ana'])
+        self.assertEqual(after['eva'], before['eva'])
+        self.assertNotEqual(get_model_versions([User]), [version])
@@ -13,6 +13,8 @@ from .serializers import (
     RegisterSerializer
 )
 from .permissions import IsAdmin, CanManageUsers, IsNotBlocked
+from .authentication import revoke_user_tokens, refresh_blocked_users, token_for_user
+from core.conditional import choices_response
 
 User = get_user_model()
 
@@ -39,9 +41,8 @@ class RegisterView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
         
-        # Generar tokens para auto-login
-        from rest_framework_simplejwt.tokens import RefreshToken
-        refresh = RefreshToken.for_user(user)
+        # Generar tokens para auto-login, con el rol y el bloqueo como claims
+        refresh = token_for_user(user)
         
         role_map = {
             'ADMIN': 'admin',
@@ -143,6 +144,9 @@ class UserViewSet(viewsets.ModelViewSet):
             )
         user.is_blocked = True
         user.save()
+        # Efecto inmediato: invalidar sus tokens y recargar la lista de bloqueados
+        revoke_user_tokens(user.pk)
+        refresh_blocked_users()
         return Response({'message': f'Usuario {user.username} bloqueado correctamente.'})
     
     @extend_schema(
@@ -157,6 +161,7 @@ class UserViewSet(viewsets.ModelViewSet):
         user = self.get_object()
         user.is_blocked = False
         user.save()
+        refresh_blocked_users()
         return Response({'message': f'Usuario {user.username} desbloqueado correctamente.'})
     
     @extend_schema(
@@ -200,7 +205,8 @@ class ProfileView(generics.RetrieveUpdateAPIView):
         return super().patch(request, *args, **kwargs)
     
     def get_object(self):
-        return self.request.user
+        # request.user solo trae los claims del token: cargar la fila completa
+        return User.objects.get(pk=self.request.user.pk)
 
 
 @extend_schema(tags=['Auth'])
@@ -212,7 +218,8 @@ class ChangePasswordView(generics.UpdateAPIView):
     permission_classes = [IsAuthenticated, IsNotBlocked]
     
     def get_object(self):
-        return self.request.user
+        # request.user solo trae los claims del token: cargar la fila completa
+        return User.objects.get(pk=self.request.user.pk)
     
     @extend_schema(summary="Cambiar contraseña propia", description="Permite al usuario cambiar su propia contraseña.")
     def update(self, request, *args, **kwargs):
@@ -243,8 +250,4 @@ class RoleChoicesView(generics.GenericAPIView):
     
     @extend_schema(summary="Obtener roles", description="Obtiene la lista de roles disponibles en el sistema.")
     def get(self, request):
-        roles = [
-            {'value': choice[0], 'label': choice[1]}
-            for choice in User.Role.choices
-        ]
-        return Response(roles)
+        return choices_response(request, User.Role.choices)